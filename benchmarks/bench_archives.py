@@ -0,0 +1,61 @@
+"""Benchmark loading configs from a zip archive directly vs. extracting them.
+
+The archive holds many small files, like a zipapp with bundled resources, and
+a handful of configs are loaded from it.
+
+Usage:
+    python benchmarks/bench_archives.py [MEMBERS]
+"""
+
+import json
+import sys
+import tempfile
+import timeit
+import zipfile
+from pathlib import Path
+
+from typer_config.loaders import multifile_loader
+
+
+def via_extraction(archive: Path, members: list) -> dict:
+    """Old workflow: extract the configs to a temporary directory, then load."""
+    with tempfile.TemporaryDirectory() as tmp, zipfile.ZipFile(archive) as zip_file:
+        return multifile_loader(
+            [zip_file.extract(member, tmp) for member in members],
+            process_pool_threshold=None,
+        )
+
+
+def main() -> None:
+    """Run benchmark."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        archive = Path(tmp) / "app.pyz"
+        with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zip_file:
+            for i in range(count):
+                zip_file.writestr(f"pkg/module{i}.py", f"VALUE = {i}\n")
+            for layer in ("base", "prod", "site"):
+                zip_file.writestr(
+                    f"defaults/{layer}.json",
+                    json.dumps({f"{layer}{i}": i for i in range(100)}),
+                )
+
+        members = [f"defaults/{layer}.json" for layer in ("base", "prod", "site")]
+        paths = [f"zip://{archive}!/{member}" for member in members]
+        assert multifile_loader(paths) == via_extraction(archive, members)
+
+        direct = min(
+            timeit.repeat(lambda: multifile_loader(paths), number=10, repeat=5)
+        )
+        extract = min(
+            timeit.repeat(lambda: via_extraction(archive, members), number=10, repeat=5)
+        )
+        print(
+            f"{count} members: direct {direct * 100:8.3f} ms, "
+            f"extraction {extract * 100:8.3f} ms per load"
+        )
+
+
+if __name__ == "__main__":
+    main()
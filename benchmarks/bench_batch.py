@@ -0,0 +1,87 @@
+"""Benchmark a process per parameter set vs. batch execution.
+
+Usage:
+    python benchmarks/bench_batch.py [ROWS]
+"""
+
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from typer_config.batch import read_overrides, run_batch
+from typer_config.loaders import json_loader
+
+APP = """
+import typer
+from typer_config.decorators import use_json_config
+
+app = typer.Typer()
+
+
+@app.command()
+@use_json_config()
+def main(name: str, count: int = 1, scale: float = 1.0):
+    return f"{name}: {count * scale}"
+
+
+if __name__ == "__main__":
+    app()
+"""
+
+
+def main() -> None:
+    """Run benchmark."""
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        (tmp_path / "bench_app.py").write_text(APP)
+        base = tmp_path / "base.json"
+        base.write_text(json.dumps({f"unused{i}": i for i in range(10_000)}))
+        sweep = tmp_path / "sweep.jsonl"
+        sweep.write_text(
+            "".join(
+                json.dumps({"name": f"run{i}", "count": i}) + "\n" for i in range(rows)
+            )
+        )
+
+        start = time.perf_counter()
+        for row in read_overrides(sweep):
+            subprocess.run(
+                [
+                    sys.executable,
+                    str(tmp_path / "bench_app.py"),
+                    row["name"],
+                    "--count",
+                    str(row["count"]),
+                    "--config",
+                    str(base),
+                ],
+                check=True,
+                capture_output=True,
+            )
+        per_process = time.perf_counter() - start
+
+        sys.path.insert(0, tmp)
+        for label, processes in (("threads", False), ("processes", True)):
+            start = time.perf_counter()
+            results = list(
+                run_batch(
+                    "bench_app:app",
+                    read_overrides(sweep),
+                    base=json_loader(base),
+                    processes=processes,
+                )
+            )
+            elapsed = time.perf_counter() - start
+            assert all(result.error is None for result in results)
+            print(f"batch ({label:>9}): {elapsed * 1000:9.2f} ms")
+
+        print(f"process per row    : {per_process * 1000:9.2f} ms ({rows} rows)")
+
+
+if __name__ == "__main__":
+    main()
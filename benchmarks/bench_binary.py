@@ -0,0 +1,65 @@
+"""Benchmark the binary config format against JSON.
+
+Usage:
+    python benchmarks/bench_binary.py [ENTRIES]
+"""
+
+import gc
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+from typer_config.dumpers import binary_dumper, json_dumper
+from typer_config.loaders import binary_loader, json_loader
+
+
+def main() -> None:
+    """Run benchmark."""
+    entries = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+
+    config = {
+        f"service{i}": {
+            "image": f"registry.example.com/service{i}:1.2.3",
+            "replicas": i % 7,
+            "ratio": i / 3,
+            "enabled": i % 2 == 0,
+            "ports": [8000 + i % 100, 9000 + i % 100],
+        }
+        for i in range(entries)
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, dumper, loader, suffix in (
+            ("json", json_dumper, json_loader, ".json"),
+            ("binary", binary_dumper, binary_loader, ".tcfg"),
+        ):
+            path = Path(tmp) / f"config{suffix}"
+            # timeit disables the garbage collector, which hides its cost
+            dump = min(
+                timeit.repeat(
+                    lambda d=dumper, p=path: d(config, p),
+                    setup="gc.enable()",
+                    number=1,
+                    repeat=3,
+                    globals={"gc": gc},
+                )
+            )
+            load = min(
+                timeit.repeat(
+                    lambda ld=loader, p=path: ld(p),
+                    setup="gc.enable()",
+                    number=1,
+                    repeat=5,
+                    globals={"gc": gc},
+                )
+            )
+            assert loader(path) == config
+            print(
+                f"{label:>6}: load {load * 1000:8.2f} ms, dump {dump * 1000:8.2f} ms, "
+                f"size {path.stat().st_size / 2**20:6.2f} MiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
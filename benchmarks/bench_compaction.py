@@ -0,0 +1,61 @@
+"""Benchmark memory of many similar per-tenant configs with and without compaction.
+
+Usage:
+    python benchmarks/bench_compaction.py [TENANTS] [SERVICES]
+"""
+
+import json
+import sys
+import tracemalloc
+
+from typer_config.compaction import ConfigCompactor
+
+
+def tenant_source(i: int, services: int) -> str:
+    """JSON source of a tenant config (mostly shared defaults)."""
+    return json.dumps(
+        {
+            "tenant": f"tenant{i}",
+            "region": ["eu-west-1", "us-east-1"][i % 2],
+            "limits": {"cpu": 2, "memory": "4Gi", "requests_per_second": 100},
+            "services": {
+                f"service{k}": {
+                    "image": f"registry.example.com/service{k}:1.2.3",
+                    "replicas": 2 + (i + k) % 3,
+                    "ports": [8000 + k, 9000 + k],
+                    "env": {"LOG_LEVEL": "info", "TIMEOUT": "30s"},
+                    "weights": [0.1 * w for w in range(16)],
+                }
+                for k in range(services)
+            },
+        }
+    )
+
+
+def measure(sources: list, transform) -> int:
+    """Memory (bytes) retained by the loaded configs."""
+    tracemalloc.start()
+    configs = [transform(json.loads(source)) for source in sources]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del configs
+    return current
+
+
+def main() -> None:
+    """Run benchmark."""
+    tenants = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    services = int(sys.argv[2]) if len(sys.argv) > 2 else 30
+
+    sources = [tenant_source(i, services) for i in range(tenants)]
+
+    raw = measure(sources, lambda config: config)
+    compacted = measure(sources, ConfigCompactor())
+
+    print(f"tenants: {tenants}, services per tenant: {services}")
+    print(f"      raw: {raw / 2**20:8.2f} MiB")
+    print(f"compacted: {compacted / 2**20:8.2f} MiB ({compacted / raw:.1%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Benchmark shell completion latency with a large config file.
+
+Usage:
+    python benchmarks/bench_completion.py [KEYS]
+"""
+
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+import typer
+from typer.testing import CliRunner
+
+from typer_config.callbacks import conf_callback_factory
+from typer_config.decorators import use_config
+from typer_config.loaders import loader_transformer, yaml_loader
+
+
+def make_app(**kwargs) -> typer.Typer:
+    """App with a YAML config option."""
+    app = typer.Typer()
+
+    @app.command()
+    @use_config(
+        conf_callback_factory(
+            loader_transformer(
+                yaml_loader, loader_conditional=lambda param_value: param_value
+            ),
+            **kwargs,
+        )
+    )
+    def main(name: str = "", count: int = 1):
+        typer.echo(f"{name} {count}")
+
+    return app
+
+
+def main() -> None:
+    """Run benchmark."""
+    keys = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    runner = CliRunner()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        conf = Path(tmp) / "config.yml"
+        conf.write_text(
+            "".join(f"key{i}: {{value: {i}, tags: [a, b]}}\n" for i in range(keys))
+        )
+        env = {
+            "_BENCH_COMPLETE": "complete_zsh",
+            "_TYPER_COMPLETE_ARGS": f"bench --config {conf} --co",
+        }
+
+        modes = {
+            "load": {"on_completion": "load"},
+            "cache": {"on_completion": "cache", "completion_cache_dir": tmp},
+            "skip": {},
+        }
+        for label, kwargs in modes.items():
+            app = make_app(**kwargs)
+
+            def complete(app=app):
+                result = runner.invoke(app, [], prog_name="bench", env=env)
+                assert "--count" in result.output, result.output
+
+            complete()  # warm up (fills the cache)
+            best = min(timeit.repeat(complete, number=1, repeat=5))
+            print(f"{label:>5}: {best * 1000:9.2f} ms per TAB")
+
+
+if __name__ == "__main__":
+    main()
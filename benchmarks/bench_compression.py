@@ -0,0 +1,63 @@
+"""Benchmark loading compressed configs directly vs. via a temporary file.
+
+Usage:
+    python benchmarks/bench_compression.py [ENTRIES]
+"""
+
+import gzip
+import json
+import lzma
+import os
+import shutil
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+from typer_config.loaders import json_loader
+
+
+def via_temp_file(path: Path, codec) -> dict:
+    """Old workflow: decompress to a temporary file, then load it."""
+    with (
+        tempfile.NamedTemporaryFile("wb", suffix=".json", delete=False) as tmp,
+        codec.open(path, "rb") as _file,
+    ):
+        shutil.copyfileobj(_file, tmp)
+    try:
+        return json_loader(tmp.name)
+    finally:
+        os.remove(tmp.name)
+
+
+def main() -> None:
+    """Run benchmark."""
+    entries = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    config = {
+        f"service{i}": {"image": f"registry/service{i}:1.2.3", "replicas": i % 7}
+        for i in range(entries)
+    }
+    data = json.dumps(config).encode()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for suffix, codec in ((".gz", gzip), (".xz", lzma)):
+            path = Path(tmp) / f"config.json{suffix}"
+            path.write_bytes(codec.compress(data))
+            assert json_loader(path) == via_temp_file(path, codec) == config
+
+            direct = min(
+                timeit.repeat(lambda p=path: json_loader(p), number=1, repeat=5)
+            )
+            temp = min(
+                timeit.repeat(
+                    lambda p=path, c=codec: via_temp_file(p, c), number=1, repeat=5
+                )
+            )
+            print(
+                f"{suffix:>4} ({path.stat().st_size / 2**10:7.0f} KiB): "
+                f"direct {direct * 1000:8.2f} ms, temp file {temp * 1000:8.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Benchmark throughput of concurrent invocations of a config-decorated command.
+
+Usage:
+    python benchmarks/bench_concurrent_invocations.py [INVOCATIONS]
+"""
+
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import typer
+
+from typer_config.decorators import use_json_config
+
+
+def main() -> None:
+    """Run benchmark."""
+    invocations = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+
+    app = typer.Typer()
+
+    @app.command()
+    @use_json_config()
+    def cmd(
+        opt1: str = typer.Option("default"),
+        opt2: str = typer.Option("default"),
+    ):
+        return f"{opt1} {opt2}"
+
+    command = typer.main.get_command(app)
+    shared_default_map = {"opt2": "shared"}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        conf = Path(tmp) / "config.json"
+        conf.write_text('{"opt1": "from config"}', encoding="utf-8")
+        args = ["--config", str(conf)]
+
+        def invoke(_: int) -> str:
+            return command.main(
+                args, standalone_mode=False, default_map=shared_default_map
+            )
+
+        for threads in (1, 2, 4, 8, 16):
+            with ThreadPoolExecutor(max_workers=threads) as pool:
+                start = time.perf_counter()
+                results = list(pool.map(invoke, range(invocations)))
+                elapsed = time.perf_counter() - start
+
+            assert set(results) == {"from config shared"}
+            print(f"{threads:>3} threads: {invocations / elapsed:9.0f} invocations/s")
+
+    assert shared_default_map == {"opt2": "shared"}
+
+
+if __name__ == "__main__":
+    main()
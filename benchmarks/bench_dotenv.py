@@ -0,0 +1,70 @@
+"""Benchmark the built-in dotenv parser against python-dotenv.
+
+Usage:
+    python benchmarks/bench_dotenv.py [LINES]
+"""
+
+import io
+import subprocess
+import sys
+import timeit
+
+import dotenv
+
+from typer_config.dotenv_parser import dotenv_values
+
+
+def import_time(code: str, baseline: str, repeat: int = 5) -> float:
+    """Extra wall time of running `code` over `baseline` in a fresh interpreter.
+
+    Args:
+        code (str): code to time
+        baseline (str): code whose time is subtracted
+        repeat (int, optional): number of runs. Defaults to 5.
+
+    Returns:
+        float: seconds
+    """
+
+    def run(code: str) -> float:
+        return min(
+            timeit.repeat(
+                lambda: subprocess.run([sys.executable, "-c", code], check=True),
+                number=1,
+                repeat=repeat,
+            )
+        )
+
+    return run(code) - run(baseline)
+
+
+def main() -> None:
+    """Run benchmark."""
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+
+    # the built-in parser is part of `typer_config`, python-dotenv is extra
+    extra = import_time("import typer_config; import dotenv", "import typer_config")
+    print(f"extra import time of python-dotenv: {extra * 1000:7.1f} ms")
+
+    source = "\n".join(
+        (
+            f"KEY{i}=value{i}",
+            f"export QUOTED{i}='single {i}'",
+            f'DOUBLE{i}="double\\t{i}" # comment',
+            f"REF{i}=${{KEY{i}}}/${{MISSING:-default}}",
+        )[i % 4]
+        for i in range(lines)
+    )
+    assert dotenv_values(source) == dotenv.dotenv_values(stream=io.StringIO(source))
+
+    print(f"parse time ({lines:,} lines):")
+    for label, func in (
+        ("typer_config.dotenv_parser", lambda: dotenv_values(source)),
+        ("dotenv", lambda: dotenv.dotenv_values(stream=io.StringIO(source))),
+    ):
+        best = min(timeit.repeat(func, number=1, repeat=3))
+        print(f"  {label:>26}: {best * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
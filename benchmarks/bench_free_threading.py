@@ -0,0 +1,62 @@
+"""Benchmark loader throughput across threads.
+
+On a free-threaded interpreter (e.g. `python3.13t`) throughput should scale
+with the number of cores; with the GIL it stays flat.
+
+Usage:
+    python benchmarks/bench_free_threading.py [LOADS_PER_THREAD]
+"""
+
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stderr
+from pathlib import Path
+
+from typer_config.loaders import multifile_loader
+from typer_config.utils import file_exists_and_warn
+
+
+def main() -> None:
+    """Run benchmark."""
+    loads = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    cpus = os.cpu_count() or 1
+    print(f"Python {sys.version.split()[0]}, GIL {'on' if gil else 'off'}, {cpus} CPUs")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        files = []
+        for i in range(3):
+            path = Path(tmp) / f"layer{i}.json"
+            config = {"app": {f"key{k}": {"layer": i} for k in range(500)}}
+            path.write_text(json.dumps(config), encoding="utf-8")
+            files.append(str(path))
+        missing = Path(tmp) / "missing.json"
+
+        def work(_: int) -> None:
+            for _ in range(loads):
+                multifile_loader(files, process_pool_threshold=None)
+                file_exists_and_warn(missing)
+
+        baseline = None
+        # keep the missing-file diagnostics out of the output
+        with redirect_stderr(io.StringIO()):
+            for threads in sorted({1, 2, 4, cpus}):
+                with ThreadPoolExecutor(max_workers=threads) as pool:
+                    start = time.perf_counter()
+                    list(pool.map(work, range(threads)))
+                    elapsed = time.perf_counter() - start
+                rate = threads * loads / elapsed
+                baseline = baseline or rate
+                print(
+                    f"{threads:>3} threads: {rate:9.0f} loads/s "
+                    f"({rate / baseline:.2f}x)"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Benchmark section-targeted INI parsing on a large multi-section file.
+
+Usage:
+    python benchmarks/bench_ini_sections.py [SECTIONS] [KEYS_PER_SECTION]
+"""
+
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+from typer_config.loaders import ini_loader
+
+
+def main() -> None:
+    """Run benchmark."""
+    sections = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    keys = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "services.ini"
+        with open(path, "w", encoding="utf-8") as _file:
+            _file.write("[DEFAULT]\nroot = /srv\n\n")
+            for i in range(sections):
+                _file.write(f"[service{i}]\n")
+                _file.writelines(
+                    f"key{k} = %(root)s/service{i}/{k}\n" for k in range(keys)
+                )
+                _file.write("\n")
+
+        target = f"service{sections // 2}"
+        assert ini_loader(path, sections=[target]) == {target: ini_loader(path)[target]}
+
+        for label, kwargs in (("full", {}), ("targeted", {"sections": [target]})):
+            best = min(
+                timeit.repeat(
+                    lambda kwargs=kwargs: ini_loader(path, **kwargs),
+                    number=1,
+                    repeat=5,
+                )
+            )
+            print(f"{label:>9}: {best * 1000:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
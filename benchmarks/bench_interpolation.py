@@ -0,0 +1,57 @@
+"""Benchmark config value interpolation.
+
+Usage:
+    python benchmarks/bench_interpolation.py [N]
+"""
+
+import sys
+import timeit
+
+from typer_config.interpolation import interpolate_config
+
+
+def make_config(size: int) -> dict:
+    """Config with `size` interpolated values spread over nested sections.
+
+    Args:
+        size (int): number of interpolated values
+
+    Returns:
+        dict: config
+    """
+    services = {
+        f"svc{i}": {
+            "root": "${paths.root}/svc" + str(i),
+            "cache": f"${{services.svc{i}.root}}/cache",
+            "logs": f"${{services.svc{i}.cache}}/../logs-${{env:USER}}",
+            "port": "${defaults.port}",
+        }
+        for i in range(size // 4)
+    }
+    return {
+        "paths": {"root": "/srv/app"},
+        "defaults": {"port": 8080},
+        "services": services,
+    }
+
+
+def main() -> None:
+    """Run benchmark."""
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    environ = {"USER": "bench"}
+
+    for n in (size // 100, size // 10, size):
+        config = make_config(n)
+        runs = 3
+        best = min(
+            timeit.repeat(
+                lambda config=config: interpolate_config(config, environ),
+                number=1,
+                repeat=runs,
+            )
+        )
+        print(f"{n:>9,} values: {best * 1000:9.1f} ms ({best / n * 1e6:.2f} us/value)")
+
+
+if __name__ == "__main__":
+    main()
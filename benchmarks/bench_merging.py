@@ -0,0 +1,75 @@
+"""Benchmark list merge strategies against a naive de-duplicating merge.
+
+Usage:
+    python benchmarks/bench_merging.py [ITEMS]
+"""
+
+import sys
+import timeit
+
+from typer_config.merging import MergeStrategies, _deep_merge
+
+
+def naive_union(base: list, override: list) -> list:
+    """De-duplicate with membership tests on a list (quadratic).
+
+    Args:
+        base (list): earlier list
+        override (list): later list
+
+    Returns:
+        list: union
+    """
+    merged = list(base)
+    for item in override:
+        if item not in merged:
+            merged.append(item)
+    return merged
+
+
+def main() -> None:
+    """Run benchmark."""
+    items = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    half = items // 2
+
+    # the lists overlap by half
+    base = {"tags": [f"tag{i}" for i in range(items)]}
+    override = {"tags": [f"tag{i}" for i in range(half, items + half)]}
+    servers = {"servers": [{"name": f"s{i}", "port": i} for i in range(items)]}
+    more = {"servers": [{"name": f"s{i}", "tls": True} for i in range(half, items)]}
+
+    naive_override = {"tags": override["tags"][: min(items, 2_000)]}
+    naive = min(
+        timeit.repeat(
+            lambda: naive_union(base["tags"], naive_override["tags"]),
+            number=1,
+            repeat=3,
+        )
+    )
+    print(
+        f"{'naive union':>24}: {naive * 1000:9.1f} ms "
+        f"(only {len(naive_override['tags'])} override items)"
+    )
+
+    for label, strategy, layers in (
+        ("replace", "replace", (base, override)),
+        ("append", "append", (base, override)),
+        ("union", "union", (base, override)),
+        ("union_by_key:name", "union_by_key:name", (servers, more)),
+    ):
+        path = "servers" if strategy.startswith("union_by_key") else "tags"
+        strategies = MergeStrategies({path: strategy})
+        best = min(
+            timeit.repeat(
+                lambda layers=layers, strategies=strategies: _deep_merge(
+                    *layers, strategies
+                ),
+                number=1,
+                repeat=3,
+            )
+        )
+        print(f"{label:>24}: {best * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
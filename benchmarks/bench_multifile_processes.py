@@ -0,0 +1,69 @@
+"""Benchmark sequential vs process-pool parsing in `multifile_loader`.
+
+Usage:
+    python benchmarks/bench_multifile_processes.py [FILES] [KEYS_PER_FILE]
+"""
+
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+import yaml
+
+from typer_config.loaders import _available_cpus, multifile_loader
+
+
+def write_files(directory: Path, count: int, keys: int) -> list[str]:
+    """Write `count` YAML files with `keys` nested entries each.
+
+    Args:
+        directory (Path): output directory
+        count (int): number of files
+        keys (int): entries per file
+
+    Returns:
+        list[str]: file paths
+    """
+    files = []
+    for i in range(count):
+        path = directory / f"layer{i}.yml"
+        config: dict = {}
+        for k in range(keys):
+            config.setdefault(f"section{k % 100}", {})[f"key{k}"] = {
+                "value": k * i,
+                "name": f"n{k}",
+            }
+        path.write_text(yaml.safe_dump(config), encoding="utf-8")
+        files.append(str(path))
+    return files
+
+
+def main() -> None:
+    """Run benchmark."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    keys = int(sys.argv[2]) if len(sys.argv) > 2 else 5_000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        files = write_files(Path(tmp), count, keys)
+        size = sum(Path(f).stat().st_size for f in files)
+        print(
+            f"{count} files, {size / 1024 / 1024:.1f} MiB total, "
+            f"{_available_cpus()} CPUs (the pool needs at least 2)"
+        )
+
+        for label, threshold in (("sequential", None), ("process pool", 0)):
+            best = min(
+                timeit.repeat(
+                    lambda threshold=threshold: multifile_loader(
+                        files, process_pool_threshold=threshold
+                    ),
+                    number=1,
+                    repeat=3,
+                )
+            )
+            print(f"{label:>12}: {best * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
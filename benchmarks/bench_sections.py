@@ -0,0 +1,54 @@
+"""Benchmark section path expressions vs. chained config transformers.
+
+Usage:
+    python benchmarks/bench_sections.py [TENANTS]
+"""
+
+import sys
+import timeit
+
+from typer_config.sections import compile_section
+from typer_config.utils import get_dict_section
+
+
+def chained(config: dict) -> dict:
+    """Old workflow: a `config_transformer` per step, each building a dict."""
+    tenants = get_dict_section(config, ["tenants"])
+    with_limits = {
+        name: tenant for name, tenant in tenants.items() if "limits" in tenant
+    }
+    return {name: tenant["limits"] for name, tenant in with_limits.items()}
+
+
+def main() -> None:
+    """Run benchmark."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    config = {
+        "tenants": {
+            f"tenant{i}": {"limits": {"cpu": i % 8}, "name": f"Tenant {i}"}
+            for i in range(count)
+        }
+    }
+
+    path = compile_section("tenants.*.limits")
+    assert path(config) == chained(config)
+
+    compiled = min(timeit.repeat(lambda: path(config), number=5, repeat=5)) / 5
+    old = min(timeit.repeat(lambda: chained(config), number=5, repeat=5)) / 5
+    lookup = (
+        min(
+            timeit.repeat(
+                lambda: compile_section("tenants.*.limits"), number=1000, repeat=5
+            )
+        )
+        / 1000
+    )
+    print(
+        f"{count} tenants: path {compiled * 1000:8.2f} ms, "
+        f"chained transformers {old * 1000:8.2f} ms"
+    )
+    print(f"cached compilation: {lookup * 1e6:6.2f} us")
+
+
+if __name__ == "__main__":
+    main()
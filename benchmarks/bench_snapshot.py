@@ -0,0 +1,45 @@
+"""Benchmark merged-result snapshots for layered config stacks.
+
+Usage:
+    python benchmarks/bench_snapshot.py [LAYERS] [KEYS_PER_LAYER]
+"""
+
+import json
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+from typer_config.cache import snapshot_loader
+from typer_config.loaders import loader_transformer, multifile_loader
+from typer_config.utils import get_dict_section
+
+
+def main() -> None:
+    """Run benchmark."""
+    layers = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    keys = int(sys.argv[2]) if len(sys.argv) > 2 else 20_000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        files = []
+        for i in range(layers):
+            path = Path(tmp) / f"layer{i}.json"
+            config = {"app": {f"key{k}": {"layer": i, "k": k} for k in range(keys)}}
+            path.write_text(json.dumps(config), encoding="utf-8")
+            files.append(str(path))
+        files.append(str(Path(tmp) / "missing.json"))
+
+        loader = loader_transformer(
+            multifile_loader,
+            config_transformer=lambda config: get_dict_section(config, ["app"]),
+        )
+        cached = snapshot_loader(loader, Path(tmp) / "cache", namespace="app")
+        cached(files)  # warm the snapshot
+
+        for label, func in (("uncached", loader), ("snapshot hit", cached)):
+            best = min(timeit.repeat(lambda func=func: func(files), number=1, repeat=5))
+            print(f"{label:>12}: {best * 1000:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
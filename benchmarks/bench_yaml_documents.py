@@ -0,0 +1,56 @@
+"""Benchmark selecting the first vs the last document of a large YAML stream.
+
+Usage:
+    python benchmarks/bench_yaml_documents.py [DOCUMENTS] [KEYS_PER_DOCUMENT]
+"""
+
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+import yaml
+
+from typer_config.loaders import yaml_loader
+
+
+def main() -> None:
+    """Run benchmark."""
+    documents = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    keys = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "envs.yml"
+        with open(path, "w", encoding="utf-8") as _file:
+            for i in range(documents):
+                _file.write(f"---\nenv: env{i}\n")
+                _file.writelines(
+                    f"key{k}: {{value: {k}, tags: [a, b, c]}}\n" for k in range(keys)
+                )
+
+        last = documents - 1
+
+        def load_all():
+            with open(path, encoding="utf-8") as _file:
+                return next(
+                    doc
+                    for doc in yaml.safe_load_all(_file)
+                    if doc["env"] == f"env{last}"
+                )
+
+        cases = {
+            "safe_load_all, filter": load_all,
+            "first by index": lambda: yaml_loader(path, document=0),
+            "last by index": lambda: yaml_loader(path, document=last),
+            "first by env": lambda: yaml_loader(path, document={"env": "env0"}),
+            "last by env": lambda: yaml_loader(path, document={"env": f"env{last}"}),
+        }
+        assert cases["last by env"]() == load_all()
+
+        for label, func in cases.items():
+            best = min(timeit.repeat(func, number=1, repeat=3))
+            print(f"{label:>22}: {best * 1000:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -15,10 +15,12 @@ from .decorators import (
     use_ini_config,
     use_json_config,
     use_multifile_config,
+    use_profile,
     use_toml_config,
     use_yaml_config,
 )
 from .loaders import (
+    binary_loader,
     dotenv_loader,
     ini_loader,
     json_loader,
@@ -31,6 +33,7 @@ from .loaders import (
 __version__ = importlib.metadata.version("typer_config")
 
 __all__ = [
+    "binary_loader",
     "conf_callback_factory",
     "dotenv_conf_callback",
     "dotenv_loader",
@@ -46,6 +49,7 @@ __all__ = [
     "use_ini_config",
     "use_json_config",
     "use_multifile_config",
+    "use_profile",
     "use_toml_config",
     "use_yaml_config",
     "yaml_conf_callback",
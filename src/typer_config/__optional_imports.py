@@ -9,7 +9,9 @@ from importlib.util import find_spec
 def try_import(module_name: str):  # noqa: ANN202 (no type for modules)
     """Try to import a module by name.
 
-    Note: caches the imported modules in a `functools.lru_cache`
+    Note: caches the imported modules in a `functools.lru_cache`, which is
+        thread-safe (also on free-threaded builds). Concurrent first calls may
+        both run the import, but `importlib` serializes that with its own lock.
 
     Args:
         module_name (str): name of module to import
@@ -0,0 +1,219 @@
+"""Configs Inside Archives.
+
+Config files can be read straight from zip archives (including zipapps and
+PEX files) without extracting them, either with a path like
+`zip://path/to/app.pyz!/defaults/config.yml` or with an `importlib.resources`
+traversable, e.g. `importlib.resources.files("myapp") / "defaults.yml"`.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import zipfile
+from threading import Lock
+from typing import IO, TYPE_CHECKING, Any
+
+from .streams import is_stream, stream_exists
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .__typing import TyperParameterValue
+
+ARCHIVE_PREFIX = "zip://"
+"""Prefix of config paths inside zip archives."""
+
+ARCHIVE_SEPARATOR = "!/"
+"""Separator between the archive and the member path."""
+
+# archive path -> (archive identity, open archive, member names)
+_ARCHIVES: dict[str, tuple[tuple[int, ...], zipfile.ZipFile, frozenset[str]]] = {}
+_ARCHIVES_LOCK = Lock()
+
+
+def split_archive_path(file_path: TyperParameterValue) -> tuple[str, str] | None:
+    """Split a `zip://archive!/member` path.
+
+    Args:
+        file_path (TyperParameterValue): config path
+
+    Returns:
+        tuple[str, str] | None: archive path and member name, or None if
+            it isn't a path inside an archive
+    """
+    if not isinstance(file_path, str) or not file_path.startswith(ARCHIVE_PREFIX):
+        return None
+
+    archive, separator, member = file_path[len(ARCHIVE_PREFIX) :].partition(
+        ARCHIVE_SEPARATOR
+    )
+    if not separator or not archive or not member:
+        message = f"Expected '{ARCHIVE_PREFIX}archive{ARCHIVE_SEPARATOR}member'."
+        raise ValueError(message)
+
+    return os.path.expanduser(archive), member
+
+
+def is_traversable(file_path: TyperParameterValue) -> bool:
+    """Check whether a config path is an `importlib.resources` traversable.
+
+    Args:
+        file_path (TyperParameterValue): config path
+
+    Returns:
+        bool: whether it is a traversable (that isn't a filesystem path)
+    """
+    return (
+        not isinstance(file_path, (str, bytes, os.PathLike))
+        and hasattr(file_path, "open")
+        and hasattr(file_path, "is_file")
+    )
+
+
+def archive_identity(archive: str) -> tuple[int, ...]:
+    """Cheap identity of an archive that changes whenever it does.
+
+    Args:
+        archive (str): archive path
+
+    Returns:
+        tuple[int, ...]: stat fields (empty if it is missing)
+    """
+    try:
+        stat = os.stat(archive)
+    except OSError:
+        return ()
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino, stat.st_dev)
+
+
+def _open_archive(archive: str) -> tuple[zipfile.ZipFile, frozenset[str]]:
+    """Open an archive and index its members, once per archive version.
+
+    Args:
+        archive (str): archive path
+
+    Raises:
+        FileNotFoundError: the archive doesn't exist
+
+    Returns:
+        tuple[zipfile.ZipFile, frozenset[str]]: archive and member names
+    """
+    identity = archive_identity(archive)
+    if not identity:
+        message = f"No such archive: '{archive}'"
+        raise FileNotFoundError(message)
+
+    with _ARCHIVES_LOCK:
+        cached = _ARCHIVES.get(archive)
+        if cached is not None and cached[0] == identity:
+            return cached[1], cached[2]
+
+        # NOTE: the central directory is read once here, members are
+        # looked up in it without touching the archive again.
+        zip_file = zipfile.ZipFile(archive)
+        names = frozenset(zip_file.namelist())
+        _ARCHIVES[archive] = (identity, zip_file, names)
+
+    return zip_file, names
+
+
+def is_archived(file_path: TyperParameterValue) -> bool:
+    """Check whether a config path points inside an archive (or is a traversable).
+
+    Args:
+        file_path (TyperParameterValue): config path
+
+    Returns:
+        bool: whether it must be opened with `open_archived`
+    """
+    return is_traversable(file_path) or split_archive_path(file_path) is not None
+
+
+def archived_identity(file_path: TyperParameterValue) -> tuple[Any, ...]:
+    """Identity of a config inside an archive, like `cache.file_identity`.
+
+    Args:
+        file_path (TyperParameterValue): archive path or traversable
+
+    Returns:
+        tuple[Any, ...]: config path and archive identity
+    """
+    if is_traversable(file_path):
+        # e.g. `zipfile.Path`, which `importlib.resources` uses for zipapps
+        archive = getattr(getattr(file_path, "root", None), "filename", None)
+    else:
+        archive, _ = split_archive_path(file_path)  # type: ignore
+    return (str(file_path), *(archive_identity(archive) if archive else ()))
+
+
+def config_exists(file_path: TyperParameterValue) -> bool:
+    """Check whether a config file exists, also inside archives or as a stream.
+
+    Args:
+        file_path (TyperParameterValue): config path
+
+    Returns:
+        bool: whether the config file exists
+    """
+    if is_stream(file_path):
+        return stream_exists(file_path)
+    if not is_archived(file_path):
+        return os.path.isfile(file_path)
+    return is_archived_file(file_path)
+
+
+def is_archived_file(file_path: TyperParameterValue) -> bool:
+    """Check whether a config inside an archive (or traversable) exists.
+
+    Args:
+        file_path (TyperParameterValue): archive path or traversable
+
+    Returns:
+        bool: whether the member exists
+    """
+    if is_traversable(file_path):
+        return file_path.is_file()
+
+    archive, member = split_archive_path(file_path)  # type: ignore
+    try:
+        _, names = _open_archive(archive)
+    except (OSError, zipfile.BadZipFile):
+        return False
+    return member in names
+
+
+def open_archived(
+    file_path: TyperParameterValue, mode: str = "r", encoding: str | None = None
+) -> IO[Any]:
+    """Open a config inside an archive (or a traversable) for reading.
+
+    Args:
+        file_path (TyperParameterValue): archive path or traversable
+        mode (str, optional): "r" or "rb". Defaults to "r".
+        encoding (str | None, optional): text encoding. Defaults to None.
+
+    Raises:
+        ValueError: not a read mode
+        FileNotFoundError: the member doesn't exist
+
+    Returns:
+        IO[Any]: file object
+    """
+    if mode not in {"r", "rb"}:
+        message = f"Configs inside archives are read-only (mode '{mode}')."
+        raise ValueError(message)
+
+    if is_traversable(file_path):
+        if mode == "rb":
+            return file_path.open(mode)
+        return file_path.open(mode, encoding=encoding)
+
+    archive, member = split_archive_path(file_path)  # type: ignore
+    zip_file, names = _open_archive(archive)
+    if member not in names:
+        message = f"No such file: '{file_path}'"
+        raise FileNotFoundError(message)
+
+    stream = zip_file.open(member)
+    if mode == "rb":
+        return stream
+    return io.TextIOWrapper(stream, encoding=encoding)
@@ -0,0 +1,321 @@
+"""Batch Execution.
+
+Run one command over a stream of parameter sets in a single process: the
+base config is loaded once and each row of overrides is layered over it.
+
+Usage:
+    ```py
+    from typer_config.batch import read_overrides, run_batch
+    from typer_config.loaders import yaml_loader
+
+    for result in run_batch(
+        "myapp.cli:app",
+        read_overrides("sweep.jsonl"),
+        base=yaml_loader("base.yml"),
+        workers=8,
+    ):
+        if result.error is not None:
+            print(result.index, "failed:", result.error)
+    ```
+"""
+
+from __future__ import annotations
+
+import csv
+import importlib
+import json
+import os
+import pickle
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from functools import cache
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, NamedTuple
+
+from typer import Typer
+from typer.main import get_command
+
+from .loaders import _deep_merge
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable, Iterator, Sequence
+
+    from .__typing import ConfigDict, FilePath
+
+OVERRIDE_FORMATS = {".jsonl": "jsonl", ".ndjson": "jsonl", ".csv": "csv"}
+"""Override stream formats by file extension."""
+
+
+class OverridesError(ValueError):
+    """Row of an overrides stream that couldn't be read."""
+
+
+class BatchResult(NamedTuple):
+    """Outcome of one invocation of a batch."""
+
+    index: int
+    """Position of the overrides in the input stream."""
+
+    overrides: ConfigDict
+    """Parameter overrides of this invocation."""
+
+    value: Any = None
+    """Return value of the command (or its exit code)."""
+
+    error: BaseException | None = None
+    """Exception raised by the invocation, if it failed."""
+
+
+def _read_rows(_file: IO[str], fmt: str) -> Iterator[ConfigDict | OverridesError]:
+    if fmt == "csv":
+        reader = csv.DictReader(_file)
+        while True:
+            try:
+                row = next(reader)
+            except StopIteration:
+                return
+            except csv.Error as ex:
+                yield OverridesError(f"Line {reader.line_num}: {ex}")
+                continue
+            # empty cells keep the base value
+            yield {key: value for key, value in row.items() if value != ""}
+
+    for lineno, line in enumerate(_file, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as ex:
+            yield OverridesError(f"Line {lineno}: {ex}")
+            continue
+        if not isinstance(row, dict):
+            yield OverridesError(f"Line {lineno} is not a JSON object.")
+            continue
+        yield row
+
+
+def read_overrides(
+    source: FilePath | IO[str], fmt: str | None = None
+) -> Iterator[ConfigDict | OverridesError]:
+    """Lazily read parameter overrides from a JSONL or CSV stream.
+
+    JSONL rows may be nested (e.g. for subcommands), CSV rows are flat and
+    their values are strings that click converts like command line values.
+    Rows that can't be read (e.g. malformed JSON) are yielded as
+    `OverridesError`s, so one bad row doesn't end the stream; `run_batch`
+    reports them as failed results.
+
+    Args:
+        source (FilePath | IO[str]): file path or open text stream
+        fmt (str | None, optional): "jsonl" or "csv". Defaults to None
+            (guess from the file extension, see OVERRIDE_FORMATS).
+
+    Raises:
+        ValueError: unknown format
+
+    Yields:
+        ConfigDict | OverridesError: overrides of one invocation, or the
+            error of a row that couldn't be read
+    """
+    if fmt is None and isinstance(source, (str, Path)):
+        fmt = OVERRIDE_FORMATS.get(Path(source).suffix.lower())
+
+    if fmt not in {"jsonl", "csv"}:
+        message = f"Unknown overrides format: {fmt}."
+        raise ValueError(message)
+
+    if not isinstance(source, (str, Path)):
+        yield from _read_rows(source, fmt)
+        return
+
+    with open(source, encoding="utf-8", newline="") as _file:
+        yield from _read_rows(_file, fmt)
+
+
+@cache
+def _import_command(app: str) -> Any:  # noqa: ANN401
+    """Import a command (once per process) from a `module:attribute` string.
+
+    Args:
+        app (str): import path of a typer app or click command
+
+    Returns:
+        Any: click command
+    """
+    module, _, attribute = app.partition(":")
+    obj: Any = importlib.import_module(module)
+    for name in attribute.split("."):
+        obj = getattr(obj, name)
+    return _as_command(obj)
+
+
+def _as_command(app: Any) -> Any:  # noqa: ANN401
+    if isinstance(app, str):
+        return _import_command(app)
+    if isinstance(app, Typer):
+        return get_command(app)
+    return app
+
+
+def _invoke(
+    app: Any,  # noqa: ANN401
+    default_map: ConfigDict,
+    args: Sequence[str],
+) -> Any:  # noqa: ANN401
+    """Invoke a command with the given defaults.
+
+    Args:
+        app (Any): click command or import path (in worker processes)
+        default_map (ConfigDict): parameter values of this invocation
+        args (Sequence[str]): extra command line arguments
+
+    Returns:
+        Any: return value of the command
+    """
+    command = _as_command(app)
+    return command.main(
+        args=list(args),
+        prog_name=command.name,
+        default_map=default_map,
+        standalone_mode=False,
+    )
+
+
+def _invoke_in_process(
+    app: str, default_map: ConfigDict, args: Sequence[str]
+) -> Any:  # noqa: ANN401
+    """Invoke a command in a worker process.
+
+    Exceptions that can't be sent back to the parent process (e.g. click
+    exceptions that reference their context) are replaced by a RuntimeError
+    with the same message.
+
+    Args:
+        app (str): import path of the command
+        default_map (ConfigDict): parameter values of this invocation
+        args (Sequence[str]): extra command line arguments
+
+    Raises:
+        RuntimeError: invocation failed with an exception that can't be pickled
+
+    Returns:
+        Any: return value of the command
+    """
+    try:
+        return _invoke(app, default_map, args)
+    except Exception as ex:
+        try:
+            pickle.dumps(ex)
+        except Exception:  # noqa: BLE001
+            message = f"{type(ex).__name__}: {ex}"
+            raise RuntimeError(message) from None
+        raise
+
+
+def run_batch(  # noqa: PLR0913
+    app: Any,  # noqa: ANN401
+    overrides: Iterable[ConfigDict | OverridesError],
+    *,
+    base: ConfigDict | None = None,
+    args: Sequence[str] = (),
+    workers: int | None = None,
+    processes: bool = False,
+    max_in_flight: int | None = None,
+) -> Iterator[BatchResult]:
+    """Run a command once per set of parameter overrides.
+
+    Each set of overrides is deep merged over `base` and passed to the
+    command as its click default map, so values are converted and validated
+    as if they came from a config file (and config options of the command
+    still work). Results are yielded as soon as invocations complete, so
+    they are not in input order. Rows that can't be read or merged are
+    yielded as failed results too, without stopping the batch.
+
+    Note:
+        With `processes=True`, `app` must be an import path such as
+        `"myapp.cli:app"`. Each worker process imports it once.
+
+    Args:
+        app (Any): typer app, click command or `module:attribute` import path
+        overrides (Iterable[ConfigDict | OverridesError]): parameter
+            overrides, e.g. from `read_overrides`. Consumed lazily.
+        base (ConfigDict | None, optional): base parameter values.
+            Defaults to None.
+        args (Sequence[str], optional): command line arguments for every
+            invocation (e.g. a subcommand name). Defaults to ().
+        workers (int | None, optional): number of threads or processes.
+            Defaults to None (number of CPUs).
+        processes (bool, optional): use a process pool instead of a thread
+            pool. Defaults to False.
+        max_in_flight (int | None, optional): maximum number of submitted
+            invocations that haven't completed. Defaults to None (twice the
+            number of workers).
+
+    Yields:
+        BatchResult: outcome of each invocation
+    """
+    base = base or {}
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or 2 * workers
+
+    executor: Executor
+    if processes:
+        if not isinstance(app, str):
+            message = "Use an import path ('module:attribute') for processes."
+            raise TypeError(message)
+        executor = ProcessPoolExecutor(workers)
+        invoke = _invoke_in_process
+    else:
+        app = _as_command(app)
+        executor = ThreadPoolExecutor(workers)
+        invoke = _invoke
+
+    rows = enumerate(overrides)
+    pending: dict[Future[Any], tuple[int, ConfigDict]] = {}
+    # rows that failed before they were submitted
+    failed: list[BatchResult] = []
+
+    def _submit() -> None:
+        while len(pending) + len(failed) < max_in_flight:
+            item = next(rows, None)
+            if item is None:
+                return
+            index, row = item
+
+            if isinstance(row, OverridesError):
+                failed.append(BatchResult(index, {}, error=row))
+                continue
+            try:
+                default_map = _deep_merge(base, row)
+            except Exception as ex:  # noqa: BLE001
+                failed.append(BatchResult(index, row, error=ex))
+                continue
+
+            future = executor.submit(invoke, app, default_map, args)
+            pending[future] = (index, row)
+
+    with executor:
+        _submit()
+
+        while pending or failed:
+            yield from failed
+            failed.clear()
+
+            if pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    index, row = pending.pop(future)
+                    error = future.exception()
+                    if error is None:
+                        yield BatchResult(index, row, future.result())
+                    else:
+                        yield BatchResult(index, row, error=error)
+
+            _submit()
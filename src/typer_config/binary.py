@@ -0,0 +1,427 @@
+"""Binary Config Format.
+
+A compact binary encoding for machine-generated configs that only needs the
+standard library. A file is a fixed header followed by the payload:
+
+| bytes  | content                                             |
+| ------ | --------------------------------------------------- |
+| 4      | magic `TCFG`                                        |
+| 1      | format version (`BINARY_FORMAT`)                    |
+| 32     | SHA-256 of the payload                              |
+| ...    | payload: the config in a tagged encoding            |
+
+The payload stores the scalars by type in flat little-endian tables (64-bit
+integers, doubles, and one UTF-8 text holding every distinct string). The
+containers are laid out level by level (breadth first): a level is a run of
+32-bit references to scalars or to containers of the next level, and every
+container of a level takes a consecutive slice of the level below it.
+Dictionaries refer to a table of key tuples (their "shapes"), so repeated
+keys are stored once. Decoding builds one level at a time, bottom up, with
+bulk operations only.
+
+Only plain data (dicts with string keys, lists, strings, numbers, booleans
+and None) can be dumped, and decoding can only ever produce plain data, even
+from crafted files. Files are checked against their header and checksum
+before decoding, so truncated, corrupted or foreign files are rejected. The
+format doesn't depend on the Python version.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import struct
+import sys
+from array import array
+from itertools import accumulate, islice, repeat
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .__typing import ConfigDict
+
+BINARY_MAGIC = b"TCFG"
+"""Magic bytes at the start of a binary config."""
+
+BINARY_FORMAT = 2
+"""Version of the binary config layout. Bump when it changes."""
+
+BINARY_SUFFIX = ".tcfg"
+"""File extension of binary configs."""
+
+_DIGEST_SIZE = 32
+_HEADER_SIZE = len(BINARY_MAGIC) + 1 + _DIGEST_SIZE
+
+_SCALARS = (str, int, float, bool, type(None))
+
+# kinds of references: the scalar tables (concatenated in this order when
+# decoding) and the dictionaries and lists of the next level
+_CONST, _INT, _BIGINT, _FLOAT, _STR, _DICT, _LIST = range(7)
+_KIND_BITS = 3
+_MAX_COUNT = 2**32 - 1
+
+_CONSTS = (None, False, True)
+_NUL = "\0"
+_INT64 = (-(2**63), 2**63 - 1)
+
+# byte sizes of: references, ints, floats, big ints, string lengths, string
+# text, shapes, dict shapes, list lengths, level sizes
+_SECTIONS = struct.Struct("<10Q")
+
+_U32 = "I" if array("I").itemsize == 4 else "L"  # noqa: PLR2004
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+class BinaryConfigError(ValueError):
+    """Invalid binary config."""
+
+
+def _check_plain(value: Any, path: str = "") -> None:  # noqa: ANN401
+    """Check that a value only contains plain config data.
+
+    Args:
+        value (Any): value to check
+        path (str, optional): location of the value, for error messages.
+            Defaults to "".
+
+    Raises:
+        BinaryConfigError: unsupported type
+    """
+    if isinstance(value, _SCALARS):
+        return
+
+    if isinstance(value, dict):
+        for key, val in value.items():
+            if not isinstance(key, str):
+                message = f"Keys must be strings, got {key!r} at '{path}'."
+                raise BinaryConfigError(message)
+            _check_plain(val, f"{path}.{key}" if path else key)
+        return
+
+    if isinstance(value, list):
+        for index, val in enumerate(value):
+            _check_plain(val, f"{path}[{index}]")
+        return
+
+    message = f"Unsupported type {type(value).__name__} at '{path}'."
+    raise BinaryConfigError(message)
+
+
+def _pack(values: array) -> bytes:
+    if not _LITTLE_ENDIAN:  # pragma: no cover
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _unpack(typecode: str, data: memoryview) -> array:
+    values = array(typecode)
+    values.frombytes(data)
+    if not _LITTLE_ENDIAN:  # pragma: no cover
+        values.byteswap()
+    return values
+
+
+def _u32(values: list[int]) -> array:
+    if values and max(values) > _MAX_COUNT:
+        message = "Config is too large for the binary format."
+        raise BinaryConfigError(message)
+    return array(_U32, values)
+
+
+class _Encoder:
+    """Builds the tables and levels of a config."""
+
+    def __init__(self: _Encoder) -> None:
+        self.ints = array("q")
+        self.floats = array("d")
+        self.bigints: list[str] = []
+        self.strings: dict[str, int] = {}
+        self.shapes: dict[tuple[str, ...], int] = {}
+        # top down: (references as `index << 3 | kind`, dict shapes, list lengths)
+        self.levels: list[tuple[list[int], list[int], list[int]]] = []
+
+    def _string(self: _Encoder, value: str) -> int:
+        return self.strings.setdefault(value, len(self.strings))
+
+    def _scalar(self: _Encoder, value: Any) -> int:  # noqa: ANN401
+        """Add a scalar to its table.
+
+        Args:
+            value (Any): scalar value
+
+        Returns:
+            int: reference
+        """
+        if value is None or value is False or value is True:
+            return _CONSTS.index(value) << _KIND_BITS | _CONST
+        if isinstance(value, str):
+            return self._string(value) << _KIND_BITS | _STR
+        if isinstance(value, float):
+            self.floats.append(value)
+            return (len(self.floats) - 1) << _KIND_BITS | _FLOAT
+        if _INT64[0] <= value <= _INT64[1]:
+            self.ints.append(value)
+            return (len(self.ints) - 1) << _KIND_BITS | _INT
+        self.bigints.append(str(int(value)))
+        return (len(self.bigints) - 1) << _KIND_BITS | _BIGINT
+
+    def encode(self: _Encoder, config: ConfigDict) -> None:
+        """Lay out a (plain) config level by level.
+
+        The children of the dicts of a level come first, in order, then the
+        children of its lists.
+
+        Args:
+            config (ConfigDict): configuration
+        """
+        dicts: list[dict[str, Any]] = [config]
+        lists: list[list[Any]] = []
+
+        while dicts or lists:
+            references: list[int] = []
+            next_dicts: list[dict[str, Any]] = []
+            next_lists: list[list[Any]] = []
+            shapes = [
+                self.shapes.setdefault(shape, len(self.shapes))
+                for shape in (tuple(str(key) for key in value) for value in dicts)
+            ]
+
+            children: list[Any] = []
+            for value in dicts:
+                children.extend(value.values())
+            for value in lists:
+                children.extend(value)
+
+            for child in children:
+                if isinstance(child, dict):
+                    references.append(len(next_dicts) << _KIND_BITS | _DICT)
+                    next_dicts.append(child)
+                elif isinstance(child, list):
+                    references.append(len(next_lists) << _KIND_BITS | _LIST)
+                    next_lists.append(child)
+                else:
+                    references.append(self._scalar(child))
+
+            self.levels.append((references, shapes, list(map(len, lists))))
+            dicts, lists = next_dicts, next_lists
+
+    def payload(self: _Encoder) -> bytes:
+        """Serialize the tables and the levels (bottom up).
+
+        Returns:
+            bytes: payload
+        """
+        shapes: list[int] = []
+        for shape in self.shapes:
+            shapes.append(len(shape))
+            shapes.extend(map(self._string, shape))
+
+        # offsets of the tables in the table a level is decoded with
+        offsets = [0] * 7
+        offsets[_INT] = len(_CONSTS)
+        offsets[_BIGINT] = offsets[_INT] + len(self.ints)
+        offsets[_FLOAT] = offsets[_BIGINT] + len(self.bigints)
+        offsets[_STR] = offsets[_FLOAT] + len(self.floats)
+        offsets[_DICT] = offsets[_STR] + len(self.strings)
+
+        references: list[int] = []
+        dict_shapes: list[int] = []
+        list_lengths: list[int] = []
+        sizes: list[int] = []
+        below = 0  # dicts of the level below, which its lists follow
+        for refs, level_shapes, lengths in reversed(self.levels):
+            offsets[_LIST] = offsets[_DICT] + below
+            references.extend(offsets[ref & 7] + (ref >> _KIND_BITS) for ref in refs)
+            dict_shapes.extend(level_shapes)
+            list_lengths.extend(lengths)
+            sizes.extend((len(level_shapes), len(lengths)))
+            below = len(level_shapes)
+
+        # strings are terminated with NUL, unless one of them contains it:
+        # then their lengths are stored
+        if any(_NUL in string for string in self.strings):
+            lengths = _pack(_u32([len(string) for string in self.strings]))
+            text = "".join(self.strings)
+        else:
+            lengths = b""
+            text = "".join(string + _NUL for string in self.strings)
+
+        sections = [
+            _pack(_u32(references)),
+            _pack(self.ints),
+            _pack(self.floats),
+            " ".join(self.bigints).encode("ascii"),
+            lengths,
+            text.encode("utf-8", "surrogatepass"),
+            _pack(_u32(shapes)),
+            _pack(_u32(dict_shapes)),
+            _pack(_u32(list_lengths)),
+            _pack(_u32(sizes)),
+        ]
+        return _SECTIONS.pack(*map(len, sections)) + b"".join(sections)
+
+
+def encode_config(config: ConfigDict) -> bytes:
+    """Encode a config in the binary format.
+
+    Args:
+        config (ConfigDict): configuration
+
+    Raises:
+        BinaryConfigError: the config contains other than plain data
+
+    Returns:
+        bytes: encoded config
+    """
+    if not isinstance(config, dict):
+        message = "A config must be a dictionary."
+        raise BinaryConfigError(message)
+    _check_plain(config)
+
+    encoder = _Encoder()
+    encoder.encode(config)
+    payload = encoder.payload()
+
+    return b"".join(
+        [
+            BINARY_MAGIC,
+            bytes([BINARY_FORMAT]),
+            hashlib.sha256(payload).digest(),
+            payload,
+        ]
+    )
+
+
+def _decode_payload(payload: memoryview) -> ConfigDict:
+    """Decode the payload of a binary config.
+
+    Args:
+        payload (memoryview): payload
+
+    Raises:
+        BinaryConfigError: malformed payload
+
+    Returns:
+        ConfigDict: configuration
+    """
+    sections = []
+    offset = _SECTIONS.size
+    for size in _SECTIONS.unpack_from(payload):
+        sections.append(payload[offset : offset + size])
+        offset += size
+    if offset != len(payload):
+        message = "Malformed binary config (section sizes)."
+        raise BinaryConfigError(message)
+
+    text = str(sections[5], "utf-8", "surrogatepass")
+    if sections[4]:
+        ends = list(accumulate(_unpack(_U32, sections[4])))
+        if ends[-1] != len(text):
+            message = "Malformed binary config (string table)."
+            raise BinaryConfigError(message)
+        strings = list(map(text.__getitem__, map(slice, [0, *ends], ends)))
+    else:
+        strings = text.split(_NUL)
+        if strings.pop():
+            message = "Malformed binary config (string table)."
+            raise BinaryConfigError(message)
+
+    shapes = []
+    words = _unpack(_U32, sections[6])
+    position = 0
+    while position < len(words):
+        end = position + 1 + words[position]
+        shapes.append(tuple(map(strings.__getitem__, words[position + 1 : end])))
+        position = end
+    if position != len(words):
+        message = "Malformed binary config (shapes)."
+        raise BinaryConfigError(message)
+
+    scalars = [
+        *_CONSTS,
+        *_unpack("q", sections[1]),
+        *map(int, bytes(sections[3]).split()),
+        *_unpack("d", sections[2]),
+        *strings,
+    ]
+    references = _unpack(_U32, sections[0])
+    dict_keys = list(map(shapes.__getitem__, _unpack(_U32, sections[7])))
+    list_lengths = _unpack(_U32, sections[8])
+    sizes = _unpack(_U32, sections[9])
+
+    if (
+        sizes[-2:].tolist() != [1, 0]
+        or sum(sizes[0::2]) != len(dict_keys)
+        or sum(sizes[1::2]) != len(list_lengths)
+        or sum(map(len, dict_keys)) + sum(list_lengths) != len(references)
+    ):
+        message = "Malformed binary config (levels)."
+        raise BinaryConfigError(message)
+
+    # bottom up: a level refers to scalars and to the containers of the level
+    # below, which follow the scalars in the table
+    scalar_count = len(scalars)
+    table = scalars
+    shared_references = iter(references)
+    dict_starts = accumulate(sizes[0::2], initial=0)
+    list_starts = accumulate(sizes[1::2], initial=0)
+    below: list[Any] = []
+
+    for dict_count, list_count, dict_start, list_start in zip(
+        sizes[0::2], sizes[1::2], dict_starts, list_starts, strict=False
+    ):
+        keys = dict_keys[dict_start : dict_start + dict_count]
+        lengths = list_lengths[list_start : list_start + list_count]
+        table[scalar_count:] = below
+        values = map(
+            table.__getitem__,
+            islice(shared_references, sum(map(len, keys)) + sum(lengths)),
+        )
+        # NOTE: zip and islice take exactly as many values as each container
+        # has, from one iterator, so the children are consumed in order
+        below = [
+            *map(dict, map(zip, keys, repeat(values))),
+            *map(list, map(islice, repeat(values), lengths)),
+        ]
+
+    config: ConfigDict = below[0]
+    return config
+
+
+def decode_config(data: bytes) -> ConfigDict:
+    """Decode a config in the binary format.
+
+    Args:
+        data (bytes): encoded config
+
+    Raises:
+        BinaryConfigError: not a (supported or intact) binary config
+
+    Returns:
+        ConfigDict: configuration
+    """
+    view = memoryview(data)
+
+    if len(data) < _HEADER_SIZE or view[: len(BINARY_MAGIC)] != BINARY_MAGIC:
+        message = "Not a binary config."
+        raise BinaryConfigError(message)
+
+    fmt = view[len(BINARY_MAGIC)]
+    if fmt != BINARY_FORMAT:
+        message = f"Unsupported binary config version {fmt}."
+        raise BinaryConfigError(message)
+
+    digest, payload = (
+        view[_HEADER_SIZE - _DIGEST_SIZE : _HEADER_SIZE],
+        view[_HEADER_SIZE:],
+    )
+    if hashlib.sha256(payload).digest() != digest:
+        message = "Corrupted binary config (checksum mismatch)."
+        raise BinaryConfigError(message)
+
+    try:
+        return _decode_payload(payload)
+    except BinaryConfigError:
+        raise
+    except (IndexError, ValueError, struct.error) as ex:
+        message = f"Malformed binary config ({ex})."
+        raise BinaryConfigError(message) from ex
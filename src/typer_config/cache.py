@@ -0,0 +1,485 @@
+"""Configuration Caches.
+
+These wrap a `typer_config.__typing.ConfigLoader` and skip the parsing and
+merging work when none of the input files changed. `ResultStore` caches the
+results of commands by the fingerprint of their parameters.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import marshal
+import os
+import pickle
+from contextlib import suppress
+from enum import Enum
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import TYPE_CHECKING, Any
+
+from .archives import archived_identity, is_archived, is_traversable
+from .compression import open_file, strip_compression_suffix
+from .dotenv_parser import referenced_variables
+from .streams import is_stream
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Mapping
+
+    from .__typing import (
+        ConfigDict,
+        ConfigLoader,
+        FilePath,
+        TyperParameterValue,
+    )
+
+SNAPSHOT_FORMAT = 2
+"""Version of the snapshot file layout. Bump when it changes."""
+
+SNAPSHOT_SUFFIX = ".snapshot"
+
+
+def file_identity(file_path: FilePath) -> tuple[Any, ...]:
+    """Cheap identity of a file that changes whenever the file does.
+
+    Args:
+        file_path (FilePath): file path
+
+    Returns:
+        tuple[Any, ...]: path and stat fields (only the path if it is missing)
+    """
+    if is_archived(file_path):
+        return archived_identity(file_path)
+
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return (str(file_path),)
+    return (
+        str(file_path),
+        stat.st_mtime_ns,
+        stat.st_ctime_ns,
+        stat.st_size,
+        stat.st_ino,
+        stat.st_dev,
+    )
+
+
+def files_manifest(files: list[TyperParameterValue]) -> tuple[tuple[Any, ...], ...]:
+    """Identity of every candidate file, including the missing ones.
+
+    Args:
+        files (list[TyperParameterValue]): candidate files
+
+    Returns:
+        tuple[tuple[Any, ...], ...]: manifest
+    """
+    return tuple(file_identity(file_path) for file_path in files if file_path)
+
+
+def _snapshot_path(
+    cache_dir: FilePath, namespace: str, files: list[TyperParameterValue]
+) -> Path:
+    """Snapshot file for a stack of candidate files.
+
+    Args:
+        cache_dir (FilePath): cache directory
+        namespace (str): distinguishes loaders/sections over the same files
+        files (list[TyperParameterValue]): candidate files
+
+    Returns:
+        Path: snapshot file path
+    """
+    digest = hashlib.sha256(
+        "\0".join([namespace, *(str(f) for f in files if f)]).encode()
+    ).hexdigest()
+    return Path(cache_dir) / f"{digest[:32]}{SNAPSHOT_SUFFIX}"
+
+
+def environ_dependencies(files: list[TyperParameterValue]) -> dict[str, str | None]:
+    """Current values of the environment variables that dotenv files expand.
+
+    Args:
+        files (list[TyperParameterValue]): candidate files
+
+    Returns:
+        dict[str, str | None]: value by name (None if it isn't set)
+    """
+    names: set[str] = set()
+    for file_path in files:
+        if not file_path or is_stream(file_path):
+            continue
+        name = file_path.name if is_traversable(file_path) else str(file_path)
+        if not strip_compression_suffix(name).endswith(".env"):
+            continue
+        try:
+            with open_file(file_path, encoding="utf-8") as _file:
+                names |= referenced_variables(_file.read())
+        except (OSError, UnicodeDecodeError):
+            continue
+    return {name: os.environ.get(name) for name in sorted(names)}
+
+
+def _read_snapshot(path: Path, manifest: tuple[Any, ...]) -> ConfigDict | None:
+    """Read a snapshot if it matches the manifest and the environment.
+
+    Args:
+        path (Path): snapshot file
+        manifest (tuple[Any, ...]): expected manifest
+
+    Returns:
+        ConfigDict | None: cached config or None on a miss
+    """
+    try:
+        with open(path, "rb") as _file:
+            # NOTE: marshal only decodes plain data (no code execution).
+            fmt, version, cached_manifest, environ, conf = marshal.load(  # noqa: S302
+                _file
+            )
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+    if (fmt, version, cached_manifest) != (
+        SNAPSHOT_FORMAT,
+        marshal.version,
+        manifest,
+    ):
+        return None
+
+    # dotenv files expand `${VAR}` from the environment
+    if any(os.environ.get(name) != value for name, value in environ.items()):
+        return None
+
+    return conf
+
+
+def _write_snapshot(
+    path: Path,
+    manifest: tuple[Any, ...],
+    conf: ConfigDict,
+    environ: Mapping[str, str | None],
+) -> None:
+    """Atomically write a snapshot (best effort).
+
+    Args:
+        path (Path): snapshot file
+        manifest (tuple[Any, ...]): manifest of the files `conf` was loaded from
+        conf (ConfigDict): config to store
+        environ (Mapping[str, str | None]): environment variables `conf`
+            depends on (see `environ_dependencies`)
+    """
+    try:
+        data = marshal.dumps(
+            (SNAPSHOT_FORMAT, marshal.version, manifest, dict(environ), conf)
+        )
+    except ValueError:
+        # e.g. TOML datetimes; such configs are just not cached
+        return
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with NamedTemporaryFile(
+            "wb", dir=path.parent, prefix=path.name, delete=False
+        ) as _file:
+            _file.write(data)
+        os.replace(_file.name, path)
+    except OSError:  # pragma: no cover
+        pass
+
+
+def snapshot_loader(
+    loader: ConfigLoader, cache_dir: FilePath, namespace: str = ""
+) -> ConfigLoader:
+    """Cache the result of a multifile loader on disk.
+
+    The wrapped loader must take a list of candidate files (like
+    `multifile_loader` and `multifile_fallback_loader`). Its result is stored
+    together with a manifest of every candidate's identity (including which
+    ones were missing). A hit costs one `stat` per candidate and one small read.
+
+    Examples:
+        Cache the merged `[tool.my_tool]` section of a layered stack:
+        ```py
+        cached_loader = snapshot_loader(
+            loader_transformer(
+                multifile_loader,
+                config_transformer=lambda config: config["tool"]["my_tool"],
+            ),
+            cache_dir="~/.cache/my_tool",
+            namespace="tool.my_tool",
+        )
+        ```
+
+    Note:
+        Snapshots are stored with `marshal`, so only plain data is cached.
+        Configs containing other types (e.g. TOML datetimes) are always
+        loaded fresh, and so are stacks that read a stream (e.g. stdin).
+        Dotenv files expand `${VAR}` from the environment, so the values of
+        the variables they reference are stored too, and a snapshot is
+        reloaded when one of them changes.
+
+    Args:
+        loader (ConfigLoader): loader taking a list of files
+        cache_dir (FilePath): directory for snapshot files
+        namespace (str, optional): distinguishes different loaders or
+            config transformers over the same files. Defaults to "".
+
+    Returns:
+        ConfigLoader: caching loader
+    """
+    cache_dir = Path(cache_dir).expanduser()
+
+    def _loader(param_value: TyperParameterValue) -> ConfigDict:
+        files = list(param_value)
+        if any(is_stream(file_path) for file_path in files):
+            return loader(files)
+
+        manifest = files_manifest(files)
+        path = _snapshot_path(cache_dir, namespace, files)
+
+        conf = _read_snapshot(path, manifest)
+        if conf is None:
+            # read the environment first, so a change during the load
+            # invalidates the snapshot
+            environ = environ_dependencies(files)
+            conf = loader(files)
+            _write_snapshot(path, manifest, conf, environ)
+
+        return conf
+
+    return _loader
+
+
+FINGERPRINT_FORMAT = 1
+"""Version of the fingerprint encoding. Bump when it changes."""
+
+RESULT_SUFFIX = ".result"
+
+EVICT_FRACTION = 0.8
+"""`ResultStore` evicts down to this fraction of `max_bytes`."""
+
+
+def _file_digest(file_path: Path) -> str | None:
+    """SHA-256 of a file's contents.
+
+    Args:
+        file_path (Path): file path
+
+    Returns:
+        str | None: hex digest or None if it isn't a readable file
+    """
+    digest = hashlib.sha256()
+    try:
+        with open(file_path, "rb") as _file:
+            for chunk in iter(lambda: _file.read(1024 * 1024), b""):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def _canonical(value: Any, *, hash_files: bool) -> Any:  # noqa: ANN401,PLR0911
+    """Convert a parameter value to plain JSON data with a stable encoding.
+
+    Args:
+        value (Any): parameter value
+        hash_files (bool): represent paths by their file contents
+
+    Returns:
+        Any: JSON serializable value
+    """
+    if isinstance(value, Enum):
+        return _canonical(value.value, hash_files=hash_files)
+    if isinstance(value, Path):
+        if hash_files:
+            return {"path": str(value), "sha256": _file_digest(value)}
+        return {"path": str(value)}
+    if isinstance(value, dict):
+        return {
+            str(key): _canonical(val, hash_files=hash_files)
+            for key, val in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [_canonical(val, hash_files=hash_files) for val in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted(
+            (_canonical(val, hash_files=hash_files) for val in value), key=repr
+        )
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return {"type": type(value).__qualname__, "repr": repr(value)}
+
+
+def fingerprint(
+    params: Mapping[str, Any], namespace: str = "", *, hash_files: bool = False
+) -> str:
+    """Stable fingerprint of a set of parameters.
+
+    Enums are represented by their values and other non-JSON values by
+    their type and `repr`, so fingerprints are the same across processes.
+
+    Args:
+        params (Mapping[str, Any]): bound parameters of an invocation
+        namespace (str, optional): distinguishes different commands.
+            Defaults to "".
+        hash_files (bool, optional): include the contents of `Path`
+            parameters, so results are recomputed when the files change.
+            Defaults to False.
+
+    Returns:
+        str: hex digest
+    """
+    encoded = json.dumps(
+        [FINGERPRINT_FORMAT, namespace, _canonical(params, hash_files=hash_files)],
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class ResultStore:
+    """On-disk store of command results, addressed by fingerprint.
+
+    Each result is a file named after its fingerprint, written atomically,
+    so concurrent processes can share a store. Hits refresh the modification
+    time of the file and, with `max_bytes`, the least recently used results
+    are evicted when the store grows beyond it. Writes keep a running size,
+    so the store is only scanned on the first write and when it is full
+    (and then shrunk to `EVICT_FRACTION` of `max_bytes`). Writes of other
+    processes are only counted at the next scan.
+
+    Note:
+        Results are stored with `pickle`. Only use a cache directory that
+        other users can't write to.
+    """
+
+    def __init__(
+        self: ResultStore, cache_dir: FilePath, max_bytes: int | None = None
+    ) -> None:
+        """Open a store.
+
+        Args:
+            cache_dir (FilePath): directory of the result files
+            max_bytes (int | None, optional): maximum total size of the
+                stored results. Defaults to None (unbounded).
+        """
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.max_bytes = max_bytes
+        # total size of the results, measured when the store is scanned
+        self._size: int | None = None
+
+    def _path(self: ResultStore, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}{RESULT_SUFFIX}"
+
+    def get(self: ResultStore, key: str) -> tuple[bool, Any]:
+        """Look up a result.
+
+        Args:
+            key (str): fingerprint
+
+        Returns:
+            tuple[bool, Any]: whether there was a hit, and the result
+        """
+        path = self._path(key)
+        try:
+            _file = open(path, "rb")  # noqa: SIM115
+        except OSError:
+            return False, None
+
+        try:
+            with _file:
+                result = pickle.load(_file)  # noqa: S301
+        except (EOFError, pickle.UnpicklingError, ValueError):
+            # corrupt (e.g. truncated), so it never loads
+            with suppress(OSError):
+                path.unlink(missing_ok=True)
+            return False, None
+        except Exception:  # noqa: BLE001
+            # maybe transient (e.g. a plugin that isn't imported yet)
+            return False, None
+
+        with suppress(OSError):
+            os.utime(path)
+        return True, result
+
+    def put(self: ResultStore, key: str, result: Any) -> None:  # noqa: ANN401
+        """Store a result (best effort).
+
+        Args:
+            key (str): fingerprint
+            result (Any): result to store; results that can't be pickled
+                are not stored
+        """
+        try:
+            data = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:  # noqa: BLE001
+            return
+
+        path = self._path(key)
+        try:
+            replaced = path.stat().st_size
+        except OSError:
+            replaced = 0
+
+        temporary = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # NOTE: temporary files have the result suffix too, so ones left
+            # behind (e.g. by a crash) are counted and evicted
+            with NamedTemporaryFile(
+                "wb",
+                dir=path.parent,
+                prefix=f"{key}.",
+                suffix=RESULT_SUFFIX,
+                delete=False,
+            ) as _file:
+                temporary = _file.name
+                _file.write(data)
+            os.replace(temporary, path)
+        except OSError:  # pragma: no cover
+            if temporary is not None:
+                with suppress(OSError):
+                    os.unlink(temporary)
+            return
+
+        if self.max_bytes is None:
+            return
+
+        if self._size is not None:
+            self._size += len(data) - replaced
+        if self._size is None or self._size > self.max_bytes:
+            self._size = self.evict(
+                self.max_bytes, target=int(self.max_bytes * EVICT_FRACTION)
+            )
+
+    def evict(self: ResultStore, max_bytes: int, target: int | None = None) -> int:
+        """Remove the least recently used results if the store doesn't fit.
+
+        Args:
+            max_bytes (int): maximum total size of the stored results
+            target (int | None, optional): size to shrink a store that doesn't
+                fit to. Defaults to None (`max_bytes`).
+
+        Returns:
+            int: total size of the remaining results
+        """
+        entries = []
+        for path in self.cache_dir.glob(f"*/*{RESULT_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except OSError:  # removed concurrently
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        if total <= max_bytes:
+            return total
+
+        target = max_bytes if target is None else target
+        for _, size, path in sorted(entries):
+            if total <= target:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+        return total
@@ -2,15 +2,30 @@
 
 from __future__ import annotations
 
+import os
+from collections.abc import Callable, Iterator, Mapping, MutableMapping
+from pathlib import Path
+from typing import Any
+
 from typer import BadParameter, CallbackParam, Context
 
 # NOTE: I'm not sure why, but these types must be imported at runtime
 # for the tests to pass...
 from .__typing import (  # noqa: TC001
+    ConfigDict,
     ConfigLoader,
     ConfigParameterCallback,
+    FilePath,
     TyperParameterValue,
 )
+from .cache import (
+    _read_snapshot,
+    _snapshot_path,
+    _write_snapshot,
+    environ_dependencies,
+    files_manifest,
+)
+from .keys import check_keys
 from .loaders import (
     dotenv_loader,
     json_loader,
@@ -18,19 +33,252 @@ from .loaders import (
     toml_loader,
     yaml_loader,
 )
+from .profiles import CONFIG_META, PROFILE_META
+from .references import bind_references
+from .streams import is_stream
+from .utils import response_file
+
+
+def _expand_response_files(ctx: Context, conf: ConfigDict) -> ConfigDict:
+    """Expand response file values of list parameters.
+
+    Args:
+        ctx (typer.Context): typer context
+        conf (ConfigDict): loaded config
+
+    Returns:
+        ConfigDict: config with response file values replaced by `FileLines`
+    """
+    list_params = {
+        param.name
+        for param in ctx.command.params
+        if param.name and (param.multiple or param.nargs == -1)
+    }
+
+    if not list_params.intersection(conf):
+        return conf
+
+    return {
+        key: response_file(value) if key in list_params else value
+        for key, value in conf.items()
+    }
+
+
+def effective_config(
+    ctx: Context,
+    conf: ConfigDict,
+    files: list[TyperParameterValue],
+    source: Any = None,  # noqa: ANN401
+) -> ConfigDict:
+    """Apply the selected profile to a loaded config and prepare its values.
+
+    Args:
+        ctx (typer.Context): typer context
+        conf (ConfigDict): loaded config
+        files (list[TyperParameterValue]): candidate files it was loaded from
+        source (Any, optional): hashable identity of the loader, for the
+            profile views cache (see `ProfileViews`). Defaults to None.
+
+    Raises:
+        ValueError: unknown or invalid profile
+
+    Returns:
+        ConfigDict: config for the default map
+    """
+    if PROFILE_META in ctx.meta:
+        views, profile = ctx.meta[PROFILE_META]
+        conf = views(conf, profile, files, source)
+    # NOTE: response files are expanded after the profile is applied (so
+    # profile overrides can point to them too) and the keys are normalized
+    # (so `input-files` is recognized as the `input_files` parameter).
+    conf = _expand_response_files(ctx, check_keys(ctx, conf))
+    return bind_references(conf)
+
+
+def _help_requested(ctx: Context) -> bool:
+    """Check whether the help option was given on the command line.
+
+    Args:
+        ctx (typer.Context): typer context
+
+    Returns:
+        bool: whether help is (about to be) shown
+    """
+    help_option = ctx.command.get_help_option(ctx)
+    if help_option is None or help_option.name is None:
+        return False
+    source = ctx.get_parameter_source(help_option.name)
+    return source is not None and source.name == "COMMANDLINE"
+
+
+class _LazyDefaultMap(MutableMapping[str, Any]):
+    """Default map that loads the config when a default is first looked up.
+
+    Click processes eager options (like the config option, `--help` and
+    `--version`) before the other parameters, in command line order. Deferring
+    the load to the first lookup means that eager exits never pay for it.
+    While help is shown, the defaults from before the config are used.
+    """
 
+    def __init__(
+        self: _LazyDefaultMap,
+        ctx: Context,
+        load: Callable[[], ConfigDict],
+        defaults: Mapping[str, Any],
+    ) -> None:
+        self._ctx = ctx
+        self._load = load
+        self._defaults = defaults
+        self._data: ConfigDict | None = None
 
-def conf_callback_factory(loader: ConfigLoader) -> ConfigParameterCallback:
+    def _resolve(self: _LazyDefaultMap) -> MutableMapping[str, Any]:
+        if self._data is None:
+            if _help_requested(self._ctx):
+                return dict(self._defaults)
+            self._data = self._load()
+        return self._data
+
+    def __getitem__(self: _LazyDefaultMap, key: str) -> Any:  # noqa: ANN401
+        return self._resolve()[key]
+
+    def __setitem__(
+        self: _LazyDefaultMap, key: str, value: Any  # noqa: ANN401
+    ) -> None:
+        self._resolve()[key] = value
+
+    def __delitem__(self: _LazyDefaultMap, key: str) -> None:
+        del self._resolve()[key]
+
+    def __iter__(self: _LazyDefaultMap) -> Iterator[str]:
+        return iter(self._resolve())
+
+    def __len__(self: _LazyDefaultMap) -> int:
+        return len(self._resolve())
+
+    def __repr__(self: _LazyDefaultMap) -> str:
+        state = "unloaded" if self._data is None else repr(self._data)
+        return f"{type(self).__name__}({state})"
+
+
+COMPLETION_MODES = ("skip", "cache", "load")
+"""What config callbacks do while the shell completes a command line."""
+
+
+def _is_completing(ctx: Context) -> bool:
+    """Check whether the command line is being completed by the shell.
+
+    Args:
+        ctx (typer.Context): typer context
+
+    Returns:
+        bool: whether click's completion environment variable is set
+    """
+    # NOTE: completion parses the command line resiliently. Then, look for
+    # the variable click derives from the program name, e.g. `_MY_APP_COMPLETE`.
+    if not ctx.resilient_parsing:
+        return False
+    prog_name = ctx.find_root().info_name or ""
+    complete_var = f"_{prog_name}_COMPLETE".replace("-", "_").upper()
+    return bool(os.environ.get(complete_var))
+
+
+def _load_for_completion(
+    ctx: Context,
+    param: CallbackParam,
+    param_value: TyperParameterValue,
+    loader: ConfigLoader,
+    cache_dir: Path,
+) -> ConfigDict:
+    """Load a config through a small snapshot cache for completion.
+
+    Args:
+        ctx (typer.Context): typer context
+        param (typer.CallbackParam): config parameter
+        param_value (TyperParameterValue): config file
+        loader (ConfigLoader): config loader
+        cache_dir (Path): snapshot directory
+
+    Returns:
+        ConfigDict: loaded config (empty if no config file or a stream
+            was given)
+    """
+    files = [param_value]
+    manifest = files_manifest(files)
+
+    # without an explicit file (or with a stream), the snapshot couldn't
+    # be validated
+    if not manifest or is_stream(param_value):
+        return {}
+
+    path = _snapshot_path(
+        cache_dir, f"completion:{ctx.command_path}:{param.name}", files
+    )
+    conf = _read_snapshot(path, manifest)
+    if conf is None:
+        environ = environ_dependencies(files)
+        conf = loader(param_value)
+        _write_snapshot(path, manifest, conf, environ)
+
+    return conf
+
+
+def conf_callback_factory(
+    loader: ConfigLoader,
+    *,
+    on_completion: str = "skip",
+    completion_cache_dir: FilePath | None = None,
+    config_files: (
+        Callable[[TyperParameterValue], list[TyperParameterValue]] | None
+    ) = None,
+) -> ConfigParameterCallback:
     """Typer configuration callback factory.
 
+    Note:
+        The config is loaded when the first parameter default is looked up,
+        not in the (eager) callback itself. So eager exits such as `--help`
+        or `--version` never read the config file, whatever the order of the
+        options on the command line. Likewise, secret references in the config
+        (see `typer_config.references`) are only read when the default of
+        their parameter is looked up.
+
+    Note:
+        Click runs eager callbacks on every TAB press while the shell completes
+        a command line. Loading the config is usually not needed for that, so
+        it is skipped by default. Use `on_completion="cache"` if you have
+        completion functions that read the config from the context, and
+        `"load"` to always load it.
+
     Args:
         loader (ConfigLoader): Config loader function that takes the value
             passed to the typer CLI and returns a dictionary that is
             applied to the click context's default map.
+        on_completion (str, optional): what to do during shell completion,
+            one of COMPLETION_MODES: "skip" loading, serve the config from a
+            "cache" of snapshots in `completion_cache_dir` (only for config
+            files given on the command line), or "load" it.
+            Defaults to "skip".
+        completion_cache_dir (FilePath | None, optional): snapshot directory
+            for `on_completion="cache"`. Defaults to None.
+        config_files (Callable | None, optional): returns the candidate files
+            the loader reads for a parameter value, which profile views are
+            cached by (see `use_profile`). Defaults to None (only the file
+            given as the parameter value).
+
+    Raises:
+        ValueError: unknown completion mode or missing cache directory
 
     Returns:
         ConfigParameterCallback: Configuration parameter callback function.
     """
+    if on_completion not in COMPLETION_MODES:
+        message = f"on_completion must be one of {COMPLETION_MODES}."
+        raise ValueError(message)
+
+    if on_completion == "cache" and completion_cache_dir is None:
+        message = "on_completion='cache' needs a completion_cache_dir."
+        raise ValueError(message)
+
+    cache_dir = None if completion_cache_dir is None else Path(completion_cache_dir)
 
     def _callback(
         ctx: Context, param: CallbackParam, param_value: TyperParameterValue
@@ -49,12 +297,37 @@ def conf_callback_factory(loader: ConfigLoader) -> ConfigParameterCallback:
         Returns:
             TyperParameterValue: must return back the given parameter
         """
-        try:
-            conf = loader(param_value)  # Load config file
-            ctx.default_map = ctx.default_map or {}  # Initialize the default map
-            ctx.default_map.update(conf)  # Merge the config Dict into default_map
-        except Exception as ex:
-            raise BadParameter(str(ex), ctx=ctx, param=param) from ex
+        completing = on_completion != "load" and _is_completing(ctx)
+        if completing and on_completion == "skip":
+            return param_value
+
+        defaults = ctx.default_map or {}
+
+        def _load() -> ConfigDict:
+            try:
+                if completing:
+                    conf = _load_for_completion(
+                        ctx, param, param_value, loader, cache_dir.expanduser()  # type: ignore
+                    )
+                else:
+                    conf = loader(param_value)  # Load config file
+                files = config_files(param_value) if config_files else [param_value]
+
+                # NOTE: eager parameters are processed in command line order,
+                # so a profile (see `use_profile`) may be selected before or
+                # after the config is loaded.
+                # `ctx.meta` is shared with subcommands, so tag it with `ctx`
+                ctx.meta[CONFIG_META] = (ctx, defaults, conf, files, loader)
+                conf = effective_config(ctx, conf, files, loader)
+            except Exception as ex:
+                raise BadParameter(str(ex), ctx=ctx, param=param) from ex
+
+            # NOTE: the default map may be shared with other (concurrent)
+            # invocations, e.g. `main(default_map=...)`, so never mutate it.
+            # Merge into a new dict that belongs to this invocation instead.
+            return {**defaults, **conf}
+
+        ctx.default_map = _LazyDefaultMap(ctx, _load, defaults)
         return param_value
 
     return _callback
@@ -145,6 +418,12 @@ def argument_list_callback(
         This is a shim to fix list arguments in a config.
         See [maxb2/typer-config#124](https://github.com/maxb2/typer-config/issues/124).
 
+    Note:
+        Large lists can be kept in a separate file with one item per line
+        by setting the config value to `"@inputs.txt"` or
+        `{"from_file": "inputs.txt"}`. The command then receives a lazy
+        `typer_config.utils.FileLines` that reads the file when iterated.
+
     Args:
         ctx (typer.Context): typer context
         param (typer.CallbackParam): typer parameter
@@ -153,6 +432,6 @@ def argument_list_callback(
     Returns:
         list[str]: argument list
     """
-    ctx.default_map = ctx.default_map or {}
-    default = ctx.default_map.get(param.name, []) if param.name else []
-    return param_value if param_value else default
+    default_map = ctx.default_map or {}
+    default = default_map.get(param.name, []) if param.name else []
+    return param_value if param_value else response_file(default)
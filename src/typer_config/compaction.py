@@ -0,0 +1,200 @@
+"""Configuration Compaction.
+
+Reduce the memory used by many similar configs loaded in one process
+(e.g. one per tenant) by interning keys and sharing identical subtrees.
+"""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from typing import TYPE_CHECKING, Any, NoReturn
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .__typing import ConfigDict
+
+SMALL_MAPPING_SIZE = 16
+"""Mappings with at most this many (shareable) items are shared."""
+
+ARRAY_MIN_LENGTH = 8
+"""Homogeneous numeric lists with at least this many items become arrays."""
+
+_INT_MIN = -(2**63)
+_INT_MAX = 2**63 - 1
+
+
+class FrozenDict(dict):
+    """Read-only dictionary.
+
+    It is still a `dict`, so it works everywhere a loaded config does
+    (e.g. `get_dict_section` and deep merging, which copy instead of mutate).
+    Like a `dict`, it isn't hashable (its values can be arrays).
+    """
+
+    __slots__ = ()
+
+    def _readonly(self: FrozenDict, *_: object, **__: object) -> NoReturn:
+        msg = f"{type(self).__name__} is read-only."
+        raise TypeError(msg)
+
+    __setitem__ = __delitem__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly  # type: ignore
+    __ior__ = _readonly  # type: ignore
+
+    def __repr__(self: FrozenDict) -> str:  # noqa: D105
+        return f"{type(self).__name__}({dict.__repr__(self)})"
+
+    def __reduce__(self: FrozenDict) -> tuple[Any, ...]:
+        """Rebuild from a plain copy, for `pickle` and `copy`.
+
+        Returns:
+            tuple[Any, ...]: constructor and arguments
+        """
+        return (type(self), (dict(self),))
+
+
+class ConfigCompactor:
+    """Compact loaded configs by sharing repeated data.
+
+    * keys are interned,
+    * string values are deduplicated,
+    * homogeneous numeric lists are stored as `array.array`,
+    * other lists of shareable values become tuples and small mappings of
+      shareable values become `FrozenDict`s, and identical ones are shared
+      across every config passed through the same compactor.
+
+    The root of a compacted config stays a plain `dict`.
+
+    Warning:
+        Compacted configs are read-only: lists become tuples/arrays and small
+        mappings can't be modified. Only use this for configs you don't mutate.
+
+    Usage:
+        Use one compactor for all configs of a process as a config transformer:
+        ```py
+        compactor = ConfigCompactor()
+
+        tenant_loader = loader_transformer(yaml_loader, config_transformer=compactor)
+        ```
+    """
+
+    def __init__(self: ConfigCompactor) -> None:
+        self._shared: dict[Any, Any] = {}
+
+    def __len__(self: ConfigCompactor) -> int:
+        """Number of distinct shared values."""
+        return len(self._shared)
+
+    def __call__(self: ConfigCompactor, config: ConfigDict) -> ConfigDict:
+        """Compact a config.
+
+        Args:
+            config (ConfigDict): config to compact (not modified)
+
+        Returns:
+            ConfigDict: compacted config
+        """
+        return dict(self._compact_items(config))
+
+    def _share(self: ConfigCompactor, key: Any, value: Any) -> Any:  # noqa: ANN401
+        return self._shared.setdefault(key, value)
+
+    def compact(self: ConfigCompactor, value: Any) -> Any:  # noqa: ANN401
+        """Compact any config value.
+
+        Args:
+            value (Any): value to compact
+
+        Returns:
+            Any: compacted (and possibly shared) value
+        """
+        if isinstance(value, str):
+            return self._share((str, value), value)
+
+        if isinstance(value, dict):
+            return self._compact_mapping(value)
+
+        if isinstance(value, (list, tuple)):
+            return self._compact_sequence(value)
+
+        return value
+
+    def _compact_items(
+        self: ConfigCompactor, value: dict[Any, Any]
+    ) -> list[tuple[Any, Any]]:
+        return [
+            (sys.intern(key) if type(key) is str else key, self.compact(val))
+            for key, val in value.items()
+        ]
+
+    def _compact_mapping(
+        self: ConfigCompactor, value: dict[Any, Any]
+    ) -> Any:  # noqa: ANN401
+        items = self._compact_items(value)
+
+        if len(items) <= SMALL_MAPPING_SIZE:
+            tokens = [_token(val) for _, val in items]
+            if None not in tokens:
+                keys = tuple(_token(key) for key, _ in items)
+                return self._share((FrozenDict, keys, tuple(tokens)), FrozenDict(items))
+
+        return dict(items)
+
+    def _compact_sequence(
+        self: ConfigCompactor, value: list[Any] | tuple[Any, ...]
+    ) -> Any:  # noqa: ANN401
+        items = [self.compact(val) for val in value]
+
+        if len(items) >= ARRAY_MIN_LENGTH:
+            packed = _pack(items)
+            if packed is not None:
+                return self._share((array, packed.typecode, packed.tobytes()), packed)
+
+        tokens = [_token(val) for val in items]
+        if None in tokens:
+            return items
+
+        return self._share((tuple, tuple(tokens)), tuple(items))
+
+
+_SCALARS = (str, int, float, bool, type(None))
+
+
+def _token(value: Any) -> Any:  # noqa: ANN401
+    """Identity of a compacted value for sharing, or None if it can't be shared.
+
+    Note:
+        Types are part of the token, so that e.g. `1`, `1.0` and `True`
+        (which compare equal) are never shared with each other. Containers
+        are already shared, so their identity is enough.
+
+    Args:
+        value (Any): compacted value
+
+    Returns:
+        Any: hashable token or None
+    """
+    if isinstance(value, (tuple, FrozenDict, array)):
+        return (id(value),)
+    if isinstance(value, float):
+        return (float, value.hex())
+    if isinstance(value, _SCALARS):
+        return (type(value), value)
+    return None
+
+
+def _pack(items: list[Any]) -> array | None:
+    """Pack a homogeneous list of numbers into an array.
+
+    Args:
+        items (list[Any]): list items
+
+    Returns:
+        array | None: packed array or None if the items aren't all ints
+            (in the int64 range) or all floats
+    """
+    if all(type(item) is int and _INT_MIN <= item <= _INT_MAX for item in items):
+        return array("q", items)
+    if all(type(item) is float for item in items):
+        return array("d", items)
+    return None
@@ -0,0 +1,75 @@
+"""Compressed Config Files.
+
+Config files ending in `.gz`, `.bz2` or `.xz` (e.g. `config.json.gz`) are
+decompressed (or compressed) on the fly with the standard library codecs,
+so the parsers read straight from the decompressing stream. This also works
+for compressed files inside archives (see `typer_config.archives`).
+"""
+
+from __future__ import annotations
+
+import os
+from importlib import import_module
+from typing import IO, TYPE_CHECKING, Any
+
+from .archives import is_archived, is_traversable, open_archived
+from .streams import is_stream, open_stream
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .__typing import FilePath
+
+COMPRESSION_SUFFIXES = {".gz": "gzip", ".bz2": "bz2", ".xz": "lzma"}
+"""Modules of the supported compression codecs by file extension."""
+
+
+def _codec(file_path: FilePath) -> str | None:
+    name = file_path.name if is_traversable(file_path) else os.fspath(file_path)
+    _, suffix = os.path.splitext(name)
+    return COMPRESSION_SUFFIXES.get(suffix.lower())
+
+
+def strip_compression_suffix(file_path: str) -> str:
+    """Remove a compression extension, e.g. `config.json.gz` -> `config.json`.
+
+    Args:
+        file_path (str): file path
+
+    Returns:
+        str: file path without compression extension
+    """
+    if _codec(file_path) is None:
+        return file_path
+    return os.path.splitext(file_path)[0]
+
+
+def open_file(
+    file_path: FilePath, mode: str = "r", encoding: str | None = None
+) -> IO[Any]:
+    """Open a (possibly compressed or archived) config file or stream.
+
+    Args:
+        file_path (FilePath): file path, archive path, traversable or stream
+        mode (str, optional): "r", "w", "rb" or "wb". Defaults to "r".
+        encoding (str | None, optional): text encoding. Defaults to None.
+
+    Returns:
+        IO[Any]: file object
+    """
+    if is_stream(file_path):
+        return open_stream(file_path, mode, encoding=encoding)
+
+    codec = _codec(file_path)
+    archived = is_archived(file_path)
+
+    if codec is None:
+        if archived:
+            return open_archived(file_path, mode, encoding=encoding)
+        return open(file_path, mode, encoding=encoding)
+
+    # NOTE: the codec modules are only imported when they are needed
+    if "b" not in mode:
+        mode = f"{mode}t"
+    if archived:
+        # the codec reads from the (uncompressed) archive member stream
+        file_path = open_archived(file_path, "rb")
+    return import_module(codec).open(file_path, mode, encoding=encoding)
@@ -3,14 +3,17 @@
 from __future__ import annotations
 
 from enum import Enum
-from functools import wraps
+from functools import partial, wraps
 from inspect import Parameter, signature
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from typer import Option
+from typer import BadParameter, CallbackParam, Context, Option
 
-from .callbacks import conf_callback_factory
-from .dumpers import json_dumper, toml_dumper, yaml_dumper
+from .cache import ResultStore, fingerprint, snapshot_loader
+from .callbacks import conf_callback_factory, effective_config
+from .discovery import expand_file_sources
+from .dumpers import RunLogDumper, json_dumper, toml_dumper, yaml_dumper
+from .keys import KEYS_META, UNKNOWN_KEYS_MODES, KeyIndex
 from .loaders import (
     dotenv_loader,
     ini_loader,
@@ -21,9 +24,14 @@ from .loaders import (
     toml_loader,
     yaml_loader,
 )
-from .utils import file_exists_and_warn, get_dict_section
+from .merging import MergeStrategies
+from .profiles import CONFIG_META, PROFILE_META, PROFILES_KEY, ProfileViews
+from .sections import compile_section
+from .utils import file_exists_and_warn
 
 if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Mapping
+
     from .__typing import (
         ConfigDumper,
         ConfigParameterCallback,
@@ -39,6 +47,8 @@ def use_config(
     callback: ConfigParameterCallback,
     param_name: TyperParameterName = "config",
     param_help: str = "Configuration file.",
+    *,
+    unknown_keys: str | None = None,
 ) -> TyperCommandDecorator:
     """Decorator for using configuration on a typer command.
 
@@ -56,12 +66,67 @@ def use_config(
             ...
         ```
 
+    Note:
+        With `unknown_keys`, an index of the command's parameters is built
+        when the decorator is applied. Config keys may then also be spelled
+        with dashes (`max-workers` for `max_workers`), and keys that aren't
+        parameters (or subcommands) are reported, see `typer_config.keys`.
+        Apply the decorator after the other decorators that add parameters.
+
     Args:
         callback (ConfigParameterCallback): config parameter callback to load
         param_name (TyperParameterName, optional): name of config parameter.
             Defaults to "config".
         param_help (str, optional): config parameter help string.
             Defaults to "Configuration file.".
+        unknown_keys (str | None, optional): what to do about unknown config
+            keys, one of UNKNOWN_KEYS_MODES: "ignore" them (but still accept
+            dashes), "warn" or raise an "error". Defaults to None (keys must
+            match parameter names and aren't checked).
+
+    Raises:
+        ValueError: unknown mode
+
+    Returns:
+        TyperCommandDecorator: decorator to apply to command
+    """
+    if unknown_keys is not None and unknown_keys not in UNKNOWN_KEYS_MODES:
+        message = f"unknown_keys must be one of {UNKNOWN_KEYS_MODES}."
+        raise ValueError(message)
+
+    def decorator(cmd: TyperCommand) -> TyperCommand:
+        index = None if unknown_keys is None else KeyIndex(signature(cmd).parameters)
+
+        # NOTE: typer resolves the annotations of callbacks at runtime
+        def _callback(
+            ctx: Context, param: CallbackParam, param_value: Any  # noqa: ANN401
+        ) -> Any:  # noqa: ANN401
+            # NOTE: `ctx.meta` is shared with subcommands, which may have
+            # config options of their own.
+            if index is None:
+                ctx.meta.pop(KEYS_META, None)
+            else:
+                ctx.meta[KEYS_META] = (index, unknown_keys)
+            return callback(ctx, param, param_value)
+
+        return _add_option(
+            param_name,
+            Option("", callback=_callback, is_eager=True, help=param_help),
+        )(cmd)
+
+    return decorator
+
+
+def _add_option(
+    param_name: TyperParameterName, option: Any  # noqa: ANN401
+) -> TyperCommandDecorator:
+    """Decorator that adds a (keyword-only, string) option to a typer command.
+
+    The option is removed again before the command is called.
+
+    Args:
+        param_name (TyperParameterName): name of the parameter
+        option (Any): `typer.Option(...)` of the parameter
 
     Returns:
         TyperCommandDecorator: decorator to apply to command
@@ -75,18 +140,18 @@ def use_config(
         # the function with modified signature.
         sig = signature(cmd, eval_str=True)
 
-        config_param = Parameter(
+        new_param = Parameter(
             param_name,
             kind=Parameter.KEYWORD_ONLY,
             annotation=str,
-            default=Option("", callback=callback, is_eager=True, help=param_help),
+            default=option,
         )
 
-        new_sig = sig.replace(parameters=[*sig.parameters.values(), config_param])
+        new_sig = sig.replace(parameters=[*sig.parameters.values(), new_param])
 
         @wraps(cmd)
         def wrapped(*args, **kwargs):  # noqa: ANN202,ANN002,ANN003
-            # NOTE: need to delete the config parameter
+            # NOTE: need to delete the added parameter
             # to match the wrapped command's signature.
             kwargs.pop(param_name, None)
 
@@ -99,12 +164,78 @@ def use_config(
     return decorator
 
 
+def use_profile(
+    param_name: TyperParameterName = "profile",
+    param_help: str = "Configuration profile.",
+    envvar: str | None = None,
+    key: str = PROFILES_KEY,
+) -> TyperCommandDecorator:
+    """Decorator for selecting a configuration profile on a typer command.
+
+    Combine this with any `use_*_config` decorator. The selected profile's
+    overrides (under the `profiles` key of the config) are deep merged over
+    the rest of the config. Each profile's view is computed once per version
+    of the config file and subtrees it doesn't override are shared.
+
+    Usage:
+        ```py
+        import typer
+        from typer_config.decorators import use_profile, use_yaml_config
+
+        app = typer.Typer()
+
+        @app.command()
+        @use_yaml_config()
+        @use_profile(envvar="MYAPP_PROFILE")
+        def main(...):
+            ...
+        ```
+
+    Args:
+        param_name (TyperParameterName, optional): name of profile parameter.
+            Defaults to "profile".
+        param_help (str, optional): profile parameter help string.
+            Defaults to "Configuration profile.".
+        envvar (str | None, optional): environment variable to read the
+            profile from. Defaults to None.
+        key (str, optional): config key of the profiles.
+            Defaults to PROFILES_KEY.
+
+    Returns:
+        TyperCommandDecorator: decorator to apply to command
+    """
+    views = ProfileViews(key)
+
+    def callback(
+        ctx: Context, param: CallbackParam, param_value: str | None
+    ) -> str | None:
+        ctx.meta[PROFILE_META] = (views, param_value)
+
+        # the config of this command was loaded before the profile was selected
+        owner, defaults, conf, files, loader = ctx.meta.get(CONFIG_META, (None,) * 5)
+        if owner is ctx:
+            try:
+                view = effective_config(ctx, conf, files, loader)
+                ctx.default_map = {**defaults, **view}
+            except ValueError as ex:
+                raise BadParameter(str(ex), ctx=ctx, param=param) from ex
+
+        return param_value
+
+    return _add_option(
+        param_name,
+        Option(None, callback=callback, is_eager=True, envvar=envvar, help=param_help),
+    )
+
+
 # default decorators
 def use_json_config(
-    section: list[str] | None = None,
+    section: str | list[str] | None = None,
     param_name: TyperParameterName = "config",
     param_help: str = "Configuration file.",
     default_value: TyperParameterValue | None = None,
+    *,
+    unknown_keys: str | None = None,
 ) -> TyperCommandDecorator:
     """Decorator for using JSON configuration on a typer command.
 
@@ -122,19 +253,24 @@ def use_json_config(
         ```
 
     Args:
-        section (list[str], optional): List of nested sections to access in the config.
-            Defaults to None.
+        section (str | list[str], optional): section path expression (see
+            `typer_config.sections`) or list of nested sections to access in
+            the config. Defaults to None.
         param_name (TyperParameterName, optional): name of config parameter.
             Defaults to "config".
         param_help (str, optional): config parameter help string.
             Defaults to "Configuration file.".
         default_value (TyperParameterValue, optional): default config parameter value.
             Defaults to None.
+        unknown_keys (str | None, optional): check the config keys against the
+            parameters of the command, see `use_config`. Defaults to None.
 
     Returns:
         TyperCommandDecorator: decorator to apply to command
     """
 
+    section_path = compile_section(section)
+
     callback = conf_callback_factory(
         loader_transformer(
             json_loader,
@@ -146,18 +282,26 @@ def use_json_config(
                 if default_value is not None
                 else None
             ),
-            config_transformer=lambda config: get_dict_section(config, section),
+            config_transformer=section_path,
         )
     )
 
-    return use_config(callback=callback, param_name=param_name, param_help=param_help)
+    return use_config(
+        callback=callback,
+        param_name=param_name,
+        param_help=param_help,
+        unknown_keys=unknown_keys,
+    )
 
 
-def use_yaml_config(
-    section: list[str] | None = None,
+def use_yaml_config(  # noqa: PLR0913
+    section: str | list[str] | None = None,
     param_name: TyperParameterName = "config",
     param_help: str = "Configuration file.",
     default_value: TyperParameterValue | None = None,
+    *,
+    document: int | Mapping[str, Any] | None = None,
+    unknown_keys: str | None = None,
 ) -> TyperCommandDecorator:
     """Decorator for using YAML configuration on a typer command.
 
@@ -175,21 +319,33 @@ def use_yaml_config(
         ```
 
     Args:
-        section (list[str], optional): List of nested sections to access in the config.
-            Defaults to None.
+        section (str | list[str], optional): section path expression (see
+            `typer_config.sections`) or list of nested sections to access in
+            the config. Defaults to None.
         param_name (str, optional): name of config parameter. Defaults to "config".
         param_help (str, optional): config parameter help string.
             Defaults to "Configuration file.".
         default_value (TyperParameterValue, optional): default config parameter value.
             Defaults to None.
+        document (int | Mapping[str, Any] | None, optional): document to use
+            from a multi-document file, by index or discriminator (e.g.
+            `{"env": "prod"}`). See `yaml_loader`. Defaults to None.
+        unknown_keys (str | None, optional): check the config keys against the
+            parameters of the command, see `use_config`. Defaults to None.
 
     Returns:
         TyperCommandDecorator: decorator to apply to command
     """
 
+    section_path = compile_section(section)
+
     callback = conf_callback_factory(
         loader_transformer(
-            yaml_loader,
+            (
+                yaml_loader
+                if document is None
+                else partial(yaml_loader, document=document)
+            ),
             loader_conditional=lambda param_value: (
                 file_exists_and_warn(param_value) if param_value else param_value
             ),
@@ -198,18 +354,25 @@ def use_yaml_config(
                 if default_value is not None
                 else None
             ),
-            config_transformer=lambda config: get_dict_section(config, section),
+            config_transformer=section_path,
         )
     )
 
-    return use_config(callback=callback, param_name=param_name, param_help=param_help)
+    return use_config(
+        callback=callback,
+        param_name=param_name,
+        param_help=param_help,
+        unknown_keys=unknown_keys,
+    )
 
 
 def use_toml_config(
-    section: list[str] | None = None,
+    section: str | list[str] | None = None,
     param_name: TyperParameterName = "config",
     param_help: str = "Configuration file.",
     default_value: TyperParameterValue | None = None,
+    *,
+    unknown_keys: str | None = None,
 ) -> TyperCommandDecorator:
     """Decorator for using TOML configuration on a typer command.
 
@@ -227,18 +390,23 @@ def use_toml_config(
         ```
 
     Args:
-        section (list[str], optional): List of nested sections to access in the config.
-            Defaults to None.
+        section (str | list[str], optional): section path expression (see
+            `typer_config.sections`) or list of nested sections to access in
+            the config. Defaults to None.
         param_name (str, optional): name of config parameter. Defaults to "config".
         param_help (str, optional): config parameter help string.
             Defaults to "Configuration file.".
         default_value (TyperParameterValue, optional): default config parameter value.
             Defaults to None.
+        unknown_keys (str | None, optional): check the config keys against the
+            parameters of the command, see `use_config`. Defaults to None.
 
     Returns:
         TyperCommandDecorator: decorator to apply to command
     """
 
+    section_path = compile_section(section)
+
     callback = conf_callback_factory(
         loader_transformer(
             toml_loader,
@@ -250,18 +418,25 @@ def use_toml_config(
                 if default_value is not None
                 else None
             ),
-            config_transformer=lambda config: get_dict_section(config, section),
+            config_transformer=section_path,
         )
     )
 
-    return use_config(callback=callback, param_name=param_name, param_help=param_help)
+    return use_config(
+        callback=callback,
+        param_name=param_name,
+        param_help=param_help,
+        unknown_keys=unknown_keys,
+    )
 
 
 def use_dotenv_config(
-    section: list[str] | None = None,
+    section: str | list[str] | None = None,
     param_name: TyperParameterName = "config",
     param_help: str = "Configuration file.",
     default_value: TyperParameterValue | None = None,
+    *,
+    unknown_keys: str | None = None,
 ) -> TyperCommandDecorator:
     """Decorator for using dotenv configuration on a typer command.
 
@@ -279,18 +454,23 @@ def use_dotenv_config(
         ```
 
     Args:
-        section (list[str], optional): List of nested sections to access in the config.
-            Defaults to None.
+        section (str | list[str], optional): section path expression (see
+            `typer_config.sections`) or list of nested sections to access in
+            the config. Defaults to None.
         param_name (str, optional): name of config parameter. Defaults to "config".
         param_help (str, optional): config parameter help string.
             Defaults to "Configuration file.".
         default_value (TyperParameterValue, optional): default config parameter value.
             Defaults to None.
+        unknown_keys (str | None, optional): check the config keys against the
+            parameters of the command, see `use_config`. Defaults to None.
 
     Returns:
         TyperCommandDecorator: decorator to apply to command
     """
 
+    section_path = compile_section(section)
+
     callback = conf_callback_factory(
         loader_transformer(
             dotenv_loader,
@@ -302,18 +482,25 @@ def use_dotenv_config(
                 if default_value is not None
                 else None
             ),
-            config_transformer=lambda config: get_dict_section(config, section),
+            config_transformer=section_path,
         )
     )
 
-    return use_config(callback=callback, param_name=param_name, param_help=param_help)
+    return use_config(
+        callback=callback,
+        param_name=param_name,
+        param_help=param_help,
+        unknown_keys=unknown_keys,
+    )
 
 
 def use_ini_config(
-    section: list[str],
+    section: str | list[str],
     param_name: TyperParameterName = "config",
     param_help: str = "Configuration file.",
     default_value: TyperParameterValue | None = None,
+    *,
+    unknown_keys: str | None = None,
 ) -> TyperCommandDecorator:
     """Decorator for using INI configuration on a typer command.
 
@@ -331,20 +518,27 @@ def use_ini_config(
         ```
 
     Args:
-        section (list[str]): List of nested sections to access in the INI file.
+        section (str | list[str]): section path expression (see
+            `typer_config.sections`) or list of nested sections to access in
+            the INI file.
         param_name (str, optional): name of config parameter. Defaults to "config".
         param_help (str, optional): config parameter help string.
             Defaults to "Configuration file.".
         default_value (TyperParameterValue, optional): default config parameter value.
             Defaults to None.
+        unknown_keys (str | None, optional): check the config keys against the
+            parameters of the command, see `use_config`. Defaults to None.
 
     Returns:
         TyperCommandDecorator: decorator to apply to command
     """
 
+    section_path = compile_section(section)
+
     callback = conf_callback_factory(
         loader_transformer(
-            ini_loader,
+            # only parse the INI section that is used
+            partial(ini_loader, sections=section_path.head),
             loader_conditional=lambda param_value: (
                 file_exists_and_warn(param_value) if param_value else param_value
             ),
@@ -353,18 +547,29 @@ def use_ini_config(
                 if default_value is not None
                 else None
             ),
-            config_transformer=lambda config: get_dict_section(config, section),
+            config_transformer=section_path,
         )
     )
 
-    return use_config(callback=callback, param_name=param_name, param_help=param_help)
+    return use_config(
+        callback=callback,
+        param_name=param_name,
+        param_help=param_help,
+        unknown_keys=unknown_keys,
+    )
 
 
-def use_multifile_config(
+def use_multifile_config(  # noqa: PLR0913
     default_files: list[TyperParameterValue],
-    section: list[str] | None = None,
+    section: str | list[str] | None = None,
     param_name: TyperParameterName = "config",
     param_help: str = "Configuration file.",
+    *,
+    process_pool_threshold: int | None = None,
+    cache_dir: FilePath | None = None,
+    stream_format: str | None = None,
+    unknown_keys: str | None = None,
+    merge_strategies: Mapping[str, str] | None = None,
 ) -> TyperCommandDecorator:
     """Decorator for using multiple configuration files on a typer command.
 
@@ -398,37 +603,88 @@ def use_multifile_config(
     Args:
         default_files (list[TyperParameterValue]): List of default file paths to load.
             Files are processed in order, with later files overriding earlier ones.
-            Missing files are silently skipped.
-        section (list[str], optional): List of nested sections to access in the config.
-            Defaults to None.
+            Missing files are silently skipped. File sources such as
+            `typer_config.discovery.upwards(...)` are expanded on invocation.
+        section (str | list[str], optional): section path expression (see
+            `typer_config.sections`) or list of nested sections to access in
+            the config. Defaults to None.
         param_name (TyperParameterName, optional): name of config parameter.
             Defaults to "config".
         param_help (str, optional): config parameter help string.
             Defaults to "Configuration file.".
+        process_pool_threshold (int | None, optional): combined file size in
+            bytes above which files are parsed in a process pool, e.g.
+            `PROCESS_POOL_THRESHOLD` (see `multifile_loader`).
+            Defaults to None (no process pool).
+        cache_dir (FilePath | None, optional): directory to cache the loaded
+            config in (see `typer_config.cache.snapshot_loader`).
+            Defaults to None (no caching).
+        stream_format (str | None, optional): format of a config read from a
+            stream (`--config -` for stdin or `/dev/fd/N`). Defaults to None
+            (detect it from the content).
+        unknown_keys (str | None, optional): check the config keys against the
+            parameters of the command, see `use_config`. Defaults to None.
+        merge_strategies (Mapping[str, str] | None, optional): how lists are
+            merged by key path, e.g. `{"plugins": "union"}` (see
+            `typer_config.merging`). Defaults to None (later lists replace
+            earlier ones).
 
     Returns:
         TyperCommandDecorator: decorator to apply to command
     """
 
+    section_path = compile_section(section)
+    strategies = (
+        MergeStrategies(merge_strategies) if merge_strategies is not None else None
+    )
+
+    loader = loader_transformer(
+        partial(
+            multifile_loader,
+            process_pool_threshold=process_pool_threshold,
+            stream_format=stream_format,
+            merge_strategies=strategies,
+        ),
+        config_transformer=section_path,
+    )
+
+    if cache_dir is not None:
+        namespace = f"multifile:{section}"
+        if strategies is not None:
+            namespace = f"{namespace}:{strategies.strategies}"
+        loader = snapshot_loader(loader, cache_dir, namespace=namespace)
+
+    def files(param_value: TyperParameterValue) -> list[TyperParameterValue]:
+        if param_value:
+            return [*expand_file_sources(default_files), param_value]
+        return expand_file_sources(default_files)
+
     callback = conf_callback_factory(
         loader_transformer(
-            multifile_loader,
+            loader,
             loader_conditional=lambda _: True,  # always load
-            param_transformer=lambda param_value: (
-                [*default_files, param_value] if param_value else default_files
-            ),
-            config_transformer=lambda config: get_dict_section(config, section),
-        )
+            param_transformer=files,
+        ),
+        config_files=files,
     )
 
-    return use_config(callback=callback, param_name=param_name, param_help=param_help)
+    return use_config(
+        callback=callback,
+        param_name=param_name,
+        param_help=param_help,
+        unknown_keys=unknown_keys,
+    )
 
 
-def use_fallback_config(
+def use_fallback_config(  # noqa: PLR0913
     fallback_files: list[TyperParameterValue],
-    section: list[str] | None = None,
+    section: str | list[str] | None = None,
     param_name: TyperParameterName = "config",
     param_help: str = "Configuration file.",
+    *,
+    cache_dir: FilePath | None = None,
+    stream_format: str | None = None,
+    unknown_keys: str | None = None,
 ) -> TyperCommandDecorator:
     """Decorator for using a fallback list of configuration files.
 
@@ -460,30 +716,58 @@ def use_fallback_config(
     Args:
         fallback_files (list[TyperParameterValue]): List of file paths to try,
             in order of priority (first has highest priority).
-            The first existing file will be used.
-        section (list[str], optional): List of nested sections to access in the config.
-            Defaults to None.
+            The first existing file will be used. File sources such as
+            `typer_config.discovery.upwards(...)` are expanded on invocation.
+        section (str | list[str], optional): section path expression (see
+            `typer_config.sections`) or list of nested sections to access in
+            the config. Defaults to None.
         param_name (TyperParameterName, optional): name of config parameter.
             Defaults to "config".
         param_help (str, optional): config parameter help string.
             Defaults to "Configuration file.".
+        cache_dir (FilePath | None, optional): directory to cache the loaded
+            config in (see `typer_config.cache.snapshot_loader`).
+            Defaults to None (no caching).
+        stream_format (str | None, optional): format of a config read from a
+            stream (`--config -` for stdin or `/dev/fd/N`). Defaults to None
+            (detect it from the content).
+        unknown_keys (str | None, optional): check the config keys against the
+            parameters of the command, see `use_config`. Defaults to None.
 
     Returns:
         TyperCommandDecorator: decorator to apply to command
     """
 
+    section_path = compile_section(section)
+
+    loader = loader_transformer(
+        partial(multifile_fallback_loader, stream_format=stream_format),
+        config_transformer=section_path,
+    )
+
+    if cache_dir is not None:
+        loader = snapshot_loader(loader, cache_dir, namespace=f"fallback:{section}")
+
+    def files(param_value: TyperParameterValue) -> list[TyperParameterValue]:
+        if param_value:
+            return [param_value, *expand_file_sources(fallback_files)]
+        return expand_file_sources(fallback_files)
+
     callback = conf_callback_factory(
         loader_transformer(
-            multifile_fallback_loader,
+            loader,
             loader_conditional=lambda _: True,  # always load
-            param_transformer=lambda param_value: (
-                [param_value, *fallback_files] if param_value else fallback_files
-            ),
-            config_transformer=lambda config: get_dict_section(config, section),
-        )
+            param_transformer=files,
+        ),
+        config_files=files,
     )
 
-    return use_config(callback=callback, param_name=param_name, param_help=param_help)
+    return use_config(
+        callback=callback,
+        param_name=param_name,
+        param_help=param_help,
+        unknown_keys=unknown_keys,
+    )
 
 
 def dump_config(dumper: ConfigDumper, location: FilePath) -> TyperCommandDecorator:
@@ -615,3 +899,94 @@ def dump_toml_config(location: FilePath) -> TyperCommandDecorator:
         TyperCommandDecorator: command decorator
     """
     return dump_config(dumper=toml_dumper, location=location)
+
+
+def dump_run_log(
+    location: FilePath, max_bytes: int | None = None
+) -> TyperCommandDecorator:
+    """Decorator for appending the parameters of each invocation
+    of a typer command to a JSON lines run log.
+
+    Usage:
+        ```py
+        import typer
+        from typer.decorators import dump_run_log
+
+        app = typer.Typer()
+
+        @app.command()
+        # NOTE: @dump_run_log MUST BE AFTER @app.command()
+        @dump_run_log("config_dump_dir/runs.jsonl")
+        def cmd(...):
+            ...
+        ```
+
+    Args:
+        location (FilePath): run log to append to
+        max_bytes (int | None, optional): rotate the log before it grows beyond
+            this size. See `RunLogDumper`. Defaults to None (never rotate).
+
+    Returns:
+        TyperCommandDecorator: command decorator
+    """
+    return dump_config(dumper=RunLogDumper(max_bytes=max_bytes), location=location)
+
+
+def memoize_result(
+    cache_dir: FilePath, *, hash_files: bool = False, max_bytes: int | None = None
+) -> TyperCommandDecorator:
+    """Decorator for caching the return value of a typer command
+    by the fingerprint of its parameters.
+
+    When a command is invoked again with the same effective parameters
+    (from the command line, config files or defaults), the stored result is
+    returned without running the command. See `typer_config.cache.fingerprint`
+    and `typer_config.cache.ResultStore`.
+
+    Usage:
+        ```py
+        import typer
+        from typer.decorators import memoize_result
+
+        app = typer.Typer()
+
+        @app.command()
+        # NOTE: @memoize_result MUST BE AFTER @app.command()
+        @memoize_result("~/.cache/myapp/results", hash_files=True)
+        def cmd(...):
+            ...
+        ```
+
+    Note:
+        Only the return value is cached, not side effects such as output.
+
+    Args:
+        cache_dir (FilePath): directory of the result store
+        hash_files (bool, optional): include the contents of `Path`
+            parameters in the fingerprint. Defaults to False.
+        max_bytes (int | None, optional): maximum size of the result store.
+            Defaults to None (unbounded).
+
+    Returns:
+        TyperCommandDecorator: command decorator
+    """
+    store = ResultStore(cache_dir, max_bytes=max_bytes)
+
+    def decorator(cmd: TyperCommand) -> TyperCommand:
+        namespace = f"{cmd.__module__}:{cmd.__qualname__}"
+
+        @wraps(cmd)
+        def inner(*args, **kwargs):  # noqa: ANN202,ANN002,ANN003
+            bound_args = signature(cmd).bind(*args, **kwargs).arguments
+            key = fingerprint(bound_args, namespace, hash_files=hash_files)
+
+            hit, result = store.get(key)
+            if not hit:
+                result = cmd(*args, **kwargs)
+                store.put(key, result)
+
+            return result
+
+        return inner
+
+    return decorator
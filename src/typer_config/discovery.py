@@ -0,0 +1,245 @@
+"""Configuration File Discovery.
+
+Find project config files (e.g. `pyproject.toml`) in the current directory
+or any of its parents, stopping at a project boundary such as `.git`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from functools import partial
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from threading import Lock
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable, Iterable
+
+    from .__typing import FilePath, TyperParameterValue
+
+DEFAULT_BOUNDARIES = (".git", ".hg")
+"""Markers of a project root where the upward search stops."""
+
+# (directory, names, boundaries) -> (found files, is boundary)
+_DirectoryScan = tuple[tuple[str, ...], bool]
+_SCAN_CACHE: dict[tuple[str, tuple[str, ...], tuple[str, ...]], _DirectoryScan] = {}
+_SCAN_CACHE_LOCK = Lock()
+
+
+def _scan_directory(
+    directory: str, names: tuple[str, ...], boundaries: tuple[str, ...]
+) -> _DirectoryScan:
+    """Look for config files and boundary markers in a single directory.
+
+    Args:
+        directory (str): directory to scan
+        names (tuple[str, ...]): config file names
+        boundaries (tuple[str, ...]): boundary marker names
+
+    Returns:
+        _DirectoryScan: found config files and whether this is a boundary
+    """
+    found = tuple(
+        path
+        for path in (os.path.join(directory, name) for name in names)
+        if os.path.isfile(path)
+    )
+    is_boundary = any(
+        os.path.exists(os.path.join(directory, marker)) for marker in boundaries
+    )
+    return found, is_boundary
+
+
+def _directory_mtime(directory: str) -> int | None:
+    try:
+        return os.stat(directory).st_mtime_ns
+    except OSError:
+        return None
+
+
+class _PersistentScans:
+    """Directory scans stored on disk, validated by directory mtimes.
+
+    Creating, deleting or renaming an entry changes the mtime of its
+    directory, so a stored scan stays valid as long as the mtime matches.
+    """
+
+    def __init__(
+        self: _PersistentScans,
+        cache_dir: FilePath,
+        names: tuple[str, ...],
+        boundaries: tuple[str, ...],
+    ) -> None:
+        digest = hashlib.sha256(
+            json.dumps([names, boundaries]).encode("utf-8")
+        ).hexdigest()
+        self.path = Path(cache_dir).expanduser() / f"discovery-{digest[:32]}.json"
+        self.changed = False
+        try:
+            with open(self.path, encoding="utf-8") as _file:
+                self.entries: dict[str, Any] = json.load(_file)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def get(self: _PersistentScans, directory: str) -> _DirectoryScan | None:
+        entry = self.entries.get(directory)
+        if entry is None or entry[0] != _directory_mtime(directory):
+            return None
+        return tuple(entry[1]), entry[2]
+
+    def put(self: _PersistentScans, directory: str, scan: _DirectoryScan) -> None:
+        self.entries[directory] = [_directory_mtime(directory), list(scan[0]), scan[1]]
+        self.changed = True
+
+    def save(self: _PersistentScans) -> None:
+        if not self.changed:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with NamedTemporaryFile(
+                "w", dir=self.path.parent, prefix=self.path.name, delete=False
+            ) as _file:
+                json.dump(self.entries, _file)
+            os.replace(_file.name, self.path)
+        except OSError:  # pragma: no cover
+            pass
+
+
+def search_upwards(
+    names: Iterable[str],
+    *,
+    start: FilePath | None = None,
+    boundaries: Iterable[str] = DEFAULT_BOUNDARIES,
+    nearest_first: bool = True,
+    cache_dir: FilePath | None = None,
+) -> list[str]:
+    """Find config files in a directory and its ancestors.
+
+    The search starts in `start` and walks up the parent directories. It
+    stops after the first directory that contains one of the `boundaries`
+    (e.g. the repository root) or at the filesystem root.
+
+    Note:
+        Each directory scan is memoized for the life of the process, so
+        repeated searches (also from different subdirectories of the same
+        project) don't touch the filesystem again. With `cache_dir`, scans
+        are also stored on disk and revalidated with one `stat` per directory.
+
+    Args:
+        names (Iterable[str]): config file names to look for, in order of
+            preference within one directory
+        start (FilePath | None, optional): directory to start in.
+            Defaults to None (current working directory).
+        boundaries (Iterable[str], optional): names of files or directories
+            that mark the top of a project. Defaults to DEFAULT_BOUNDARIES.
+        nearest_first (bool, optional): order the results from the nearest
+            directory to the farthest. Use False for `use_multifile_config`,
+            where later files override earlier ones. Defaults to True.
+        cache_dir (FilePath | None, optional): directory to persist the
+            directory scans in. Defaults to None (memory only).
+
+    Returns:
+        list[str]: paths of the config files found
+    """
+    names = tuple(names)
+    boundaries = tuple(boundaries)
+    directory = os.path.abspath(os.getcwd() if start is None else start)
+    persistent = (
+        None if cache_dir is None else _PersistentScans(cache_dir, names, boundaries)
+    )
+
+    found: list[str] = []
+
+    while True:
+        key = (directory, names, boundaries)
+        scan = _SCAN_CACHE.get(key)
+
+        if scan is None and persistent is not None:
+            scan = persistent.get(directory)
+
+        if scan is None:
+            scan = _scan_directory(directory, names, boundaries)
+            if persistent is not None:
+                persistent.put(directory, scan)
+
+        with _SCAN_CACHE_LOCK:
+            _SCAN_CACHE[key] = scan
+
+        found.extend(scan[0])
+
+        parent = os.path.dirname(directory)
+        if scan[1] or parent == directory:
+            break
+        directory = parent
+
+    if persistent is not None:
+        persistent.save()
+
+    return found if nearest_first else found[::-1]
+
+
+def upwards(
+    names: Iterable[str],
+    *,
+    start: FilePath | None = None,
+    boundaries: Iterable[str] = DEFAULT_BOUNDARIES,
+    nearest_first: bool = True,
+    cache_dir: FilePath | None = None,
+) -> Callable[[], list[str]]:
+    """File source for the multifile decorators that searches upwards.
+
+    Usage:
+        ```py
+        @app.command()
+        @use_fallback_config([upwards(["myapp.toml", "pyproject.toml"])])
+        def main(...):
+            ...
+        ```
+
+    Args:
+        names (Iterable[str]): config file names to look for
+        start (FilePath | None, optional): see `search_upwards`.
+        boundaries (Iterable[str], optional): see `search_upwards`.
+        nearest_first (bool, optional): see `search_upwards`.
+        cache_dir (FilePath | None, optional): see `search_upwards`.
+
+    Returns:
+        Callable[[], list[str]]: file source that runs the search when called
+    """
+    return partial(
+        search_upwards,
+        tuple(names),
+        start=start,
+        boundaries=tuple(boundaries),
+        nearest_first=nearest_first,
+        cache_dir=cache_dir,
+    )
+
+
+def clear_discovery_cache() -> None:
+    """Forget all memoized directory scans."""
+    with _SCAN_CACHE_LOCK:
+        _SCAN_CACHE.clear()
+
+
+def expand_file_sources(
+    files: Iterable[TyperParameterValue],
+) -> list[TyperParameterValue]:
+    """Expand file sources (callables like `upwards(...)`) into paths.
+
+    Args:
+        files (Iterable[TyperParameterValue]): paths and file sources
+
+    Returns:
+        list[TyperParameterValue]: paths
+    """
+    expanded: list[TyperParameterValue] = []
+    for file_path in files:
+        if callable(file_path):
+            expanded.extend(file_path())
+        else:
+            expanded.append(file_path)
+    return expanded
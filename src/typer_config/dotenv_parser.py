@@ -0,0 +1,212 @@
+"""Dotenv Parser.
+
+A small, dependency-free parser that is compatible with
+`dotenv.dotenv_values` from [python-dotenv](https://github.com/theskumar/python-dotenv):
+`export` prefixes, single/double quoting with escapes, multiline quoted values,
+inline comments, keys without values (`None`) and `${VAR:-default}` expansion.
+"""
+
+from __future__ import annotations
+
+import codecs
+import os
+import re
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterator, Mapping
+
+_MULTILINE_WHITESPACE = re.compile(r"\s*", re.MULTILINE)
+_WHITESPACE = re.compile(r"[^\S\r\n]*")
+_EXPORT = re.compile(r"(?:export[^\S\r\n]+)?")
+_SINGLE_QUOTED_KEY = re.compile(r"'([^']+)'")
+_UNQUOTED_KEY = re.compile(r"([^=\#\s]+)")
+_EQUAL_SIGN = re.compile(r"=[^\S\r\n]*")
+_SINGLE_QUOTED_VALUE = re.compile(r"'((?:\\.|[^'\\])*)'", re.DOTALL)
+_DOUBLE_QUOTED_VALUE = re.compile(r'"((?:\\.|[^"\\])*)"', re.DOTALL)
+_UNQUOTED_VALUE = re.compile(r"[^\r\n]*")
+_INLINE_COMMENT = re.compile(r"\s+#.*")
+_COMMENT = re.compile(r"(?:[^\S\r\n]*#[^\r\n]*)?")
+_END_OF_LINE = re.compile(r"[^\S\r\n]*(?:\r\n|\n|\r|$)")
+_REST_OF_LINE = re.compile(r"[^\r\n]*(?:\r|\n|\r\n)?")
+_DOUBLE_QUOTE_ESCAPES = re.compile(r"\\[\\'\"abfnrtv]")
+_SINGLE_QUOTE_ESCAPES = re.compile(r"\\[\\']")
+_VARIABLE = re.compile(r"\$\{(?P<name>[^\}:]*)(?::-(?P<default>[^\}]*))?\}")
+
+
+class _ParseError(Exception):
+    """Statement could not be parsed."""
+
+    def __init__(self: _ParseError, pos: int) -> None:
+        super().__init__(pos)
+        self.pos = pos
+
+
+def _decode_escape(match: re.Match[str]) -> str:
+    return codecs.decode(match.group(0), "unicode-escape")
+
+
+def _match(regex: re.Pattern[str], text: str, pos: int) -> re.Match[str]:
+    match = regex.match(text, pos)
+    if match is None:
+        raise _ParseError(pos)
+    return match
+
+
+def _parse_value(text: str, pos: int) -> tuple[str, int]:
+    char = text[pos : pos + 1]
+
+    if char == "'":
+        match = _match(_SINGLE_QUOTED_VALUE, text, pos)
+        return _SINGLE_QUOTE_ESCAPES.sub(_decode_escape, match.group(1)), match.end()
+
+    if char == '"':
+        match = _match(_DOUBLE_QUOTED_VALUE, text, pos)
+        return _DOUBLE_QUOTE_ESCAPES.sub(_decode_escape, match.group(1)), match.end()
+
+    if char in {"", "\n", "\r"}:
+        return "", pos
+
+    match = _match(_UNQUOTED_VALUE, text, pos)
+    return _INLINE_COMMENT.sub("", match.group(0)).rstrip(), match.end()
+
+
+def _parse_binding(text: str, pos: int) -> tuple[str | None, str | None, int]:
+    """Parse one `KEY=value` statement.
+
+    Args:
+        text (str): dotenv source
+        pos (int): position of the statement
+
+    Raises:
+        _ParseError: malformed statement
+
+    Returns:
+        tuple[str | None, str | None, int]: key (None for blanks/comments),
+            value (None when there is no `=`) and the position after it
+    """
+    pos = _MULTILINE_WHITESPACE.match(text, pos).end()  # type: ignore
+    if pos >= len(text):
+        return None, None, pos
+
+    pos = _EXPORT.match(text, pos).end()  # type: ignore
+
+    key: str | None = None
+    char = text[pos : pos + 1]
+    if char != "#":
+        match = _match(_SINGLE_QUOTED_KEY if char == "'" else _UNQUOTED_KEY, text, pos)
+        key, pos = match.group(1), match.end()
+
+    pos = _WHITESPACE.match(text, pos).end()  # type: ignore
+
+    value: str | None = None
+    if text[pos : pos + 1] == "=":
+        equal_sign = _match(_EQUAL_SIGN, text, pos)
+        has_space, pos = equal_sign.end() - pos > 1, equal_sign.end()
+        # `KEY= # comment` is empty, but `KEY=#value` is not
+        if has_space and text[pos : pos + 1] == "#":
+            value = ""
+        else:
+            value, pos = _parse_value(text, pos)
+
+    pos = _COMMENT.match(text, pos).end()  # type: ignore
+    pos = _match(_END_OF_LINE, text, pos).end()
+
+    return key, value, pos
+
+
+def parse_dotenv(text: str) -> Iterator[tuple[str, str | None]]:
+    """Parse dotenv source into `(key, value)` pairs without expansion.
+
+    Statements that can't be parsed are skipped (like python-dotenv does).
+
+    Args:
+        text (str): dotenv source
+
+    Yields:
+        tuple[str, str | None]: key and raw value (None if there is no `=`)
+    """
+    text = text.removeprefix("\ufeff")
+    pos = 0
+
+    while pos < len(text):
+        try:
+            key, value, pos = _parse_binding(text, pos)
+        except _ParseError as err:
+            # skip the rest of the line the statement failed on
+            pos = _REST_OF_LINE.match(text, err.pos).end()  # type: ignore
+            continue
+
+        if key is not None:
+            yield key, value
+
+
+def _expand(
+    value: str, values: Mapping[str, str | None], environ: Mapping[str, str]
+) -> str:
+    """Expand `${VAR}` and `${VAR:-default}` references.
+
+    Args:
+        value (str): raw value
+        values (Mapping[str, str | None]): values defined earlier in the file
+        environ (Mapping[str, str]): environment variables
+
+    Returns:
+        str: expanded value
+    """
+
+    def _replace(match: re.Match[str]) -> str:
+        name = match.group("name")
+        if name in values:
+            return values[name] or ""
+        default = match.group("default")
+        return environ.get(name, "" if default is None else default)
+
+    return _VARIABLE.sub(_replace, value)
+
+
+def referenced_variables(text: str) -> set[str]:
+    """Names of the variables that `${VAR}` references in dotenv source.
+
+    Args:
+        text (str): dotenv source
+
+    Returns:
+        set[str]: variable names
+    """
+    return {
+        name
+        for _, value in parse_dotenv(text)
+        if value is not None and "${" in value
+        for name in (match.group("name") for match in _VARIABLE.finditer(value))
+    }
+
+
+def dotenv_values(
+    text: str, *, interpolate: bool = True, environ: Mapping[str, str] | None = None
+) -> dict[str, str | None]:
+    """Parse dotenv source into a dictionary.
+
+    Equivalent to `dotenv.dotenv_values(stream=...)`. Variables are expanded
+    in a single pass: values defined earlier in the file take precedence
+    over the environment.
+
+    Args:
+        text (str): dotenv source
+        interpolate (bool, optional): expand `${VAR}` references.
+            Defaults to True.
+        environ (Mapping[str, str] | None, optional): environment variables.
+            Defaults to None (`os.environ`).
+
+    Returns:
+        dict[str, str | None]: parsed values
+    """
+    environ = os.environ if environ is None else environ
+    values: dict[str, str | None] = {}
+
+    for key, value in parse_dotenv(text):
+        if interpolate and value is not None and "${" in value:
+            value = _expand(value, values, environ)  # noqa: PLW2901
+        values[key] = value
+
+    return values
@@ -1,9 +1,17 @@
 """Config Dictionary Dumpers."""
 
+import atexit
 import json
+import os
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from threading import Lock, Timer
 
 from .__optional_imports import try_import
 from .__typing import ConfigDict, FilePath
+from .binary import encode_config
+from .compression import open_file
 
 
 def json_dumper(config: ConfigDict, location: FilePath) -> None:
@@ -13,7 +21,7 @@ def json_dumper(config: ConfigDict, location: FilePath) -> None:
         config (ConfigDict): configuration
         location (FilePath): file to write
     """
-    with open(location, "w", encoding="utf-8") as _file:
+    with open_file(location, "w", encoding="utf-8") as _file:
         json.dump(config, _file)
 
 
@@ -34,7 +42,7 @@ def yaml_dumper(config: ConfigDict, location: FilePath) -> None:
         message = "Please install the pyyaml library."
         raise ModuleNotFoundError(message)
 
-    with open(location, "w", encoding="utf-8") as _file:
+    with open_file(location, "w", encoding="utf-8") as _file:
         yaml.dump(config, _file)
 
 
@@ -55,5 +63,166 @@ def toml_dumper(config: ConfigDict, location: FilePath) -> None:
         message = "Please install the toml library to write TOML files."
         raise ModuleNotFoundError(message)
 
-    with open(location, "w", encoding="utf-8") as _file:
+    with open_file(location, "w", encoding="utf-8") as _file:
         toml.dump(config, _file)
+
+
+def binary_dumper(config: ConfigDict, location: FilePath) -> None:
+    """Dump config to binary file.
+
+    See `typer_config.binary` for the format.
+
+    Args:
+        config (ConfigDict): configuration
+        location (FilePath): file to write
+    """
+    data = encode_config(config)
+    with open_file(location, "wb") as _file:
+        _file.write(data)
+
+
+@contextmanager
+def _file_lock(path: str) -> Iterator[None]:
+    """Exclusive lock that is held across processes.
+
+    Args:
+        path (str): lock file (created if missing)
+
+    Yields:
+        None: while the lock is held
+    """
+    fcntl = try_import("fcntl")
+    msvcrt = try_import("msvcrt")
+
+    with open(path, "a+b") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        elif msvcrt is not None:  # pragma: no cover
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+            elif msvcrt is not None:  # pragma: no cover
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class RunLogDumper:
+    """Dumper that appends each config as one JSON line to a run log.
+
+    Unlike the other dumpers, it never overwrites the file, so the history
+    of all invocations is kept in one place. Each record is written when it
+    is dumped, unless `buffer_size` is set: then records are buffered in
+    memory and written when the buffer is big or old enough (and at exit).
+    Buffered records are lost when a process ends without running `atexit`
+    handlers (e.g. a `ProcessPoolExecutor` worker), so call `flush` there.
+    Every write holds a lock file (`<location>.lock`), so several processes can
+    log to the same file. With `max_bytes`, the log is rotated like
+    `logging.handlers.RotatingFileHandler` does: `runs.jsonl` becomes
+    `runs.jsonl.1`, `runs.jsonl.1` becomes `runs.jsonl.2` and so on.
+
+    Usage:
+        ```py
+        @app.command()
+        @dump_config(RunLogDumper(max_bytes=10_000_000), "runs.jsonl")
+        def main(...):
+            ...
+        ```
+    """
+
+    def __init__(
+        self: "RunLogDumper",
+        buffer_size: int = 0,
+        flush_interval: float = 1.0,
+        max_bytes: int | None = None,
+        backup_count: int = 5,
+    ) -> None:
+        """Create a run log dumper.
+
+        Args:
+            buffer_size (int, optional): buffer records and write once the
+                buffered records of a log reach this many bytes. Defaults to 0
+                (write every record right away).
+            flush_interval (float, optional): write buffered records once the
+                oldest of them is this many seconds old. Defaults to 1 second.
+            max_bytes (int | None, optional): rotate a log before it grows
+                beyond this size. Defaults to None (never rotate).
+            backup_count (int, optional): number of rotated logs to keep.
+                Defaults to 5.
+        """
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+
+        # log path -> (time of oldest record, buffered records)
+        self._buffers: dict[str, tuple[float, list[bytes]]] = {}
+        self._lock = Lock()
+        self._timer: Timer | None = None
+        atexit.register(self.flush)
+
+    def __call__(self: "RunLogDumper", config: ConfigDict, location: FilePath) -> None:
+        """Buffer a config as a record of the run log.
+
+        Args:
+            config (ConfigDict): configuration
+            location (FilePath): run log to append to
+        """
+        # NOTE: values that aren't JSON types (e.g. paths) are logged as strings
+        record = (json.dumps(config, default=str) + "\n").encode("utf-8")
+        path = os.fspath(location)
+
+        with self._lock:
+            if self.buffer_size <= 0:
+                self._write(path, record)
+                return
+
+            started, records = self._buffers.setdefault(path, (time.monotonic(), []))
+            records.append(record)
+
+            if (
+                sum(map(len, records)) >= self.buffer_size
+                or time.monotonic() - started >= self.flush_interval
+            ):
+                self._write(path, b"".join(self._buffers.pop(path)[1]))
+            elif self._timer is None:
+                # an idle process still writes its records in time
+                self._timer = Timer(self.flush_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self: "RunLogDumper") -> None:
+        """Write all buffered records."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            buffers, self._buffers = self._buffers, {}
+            for path, (_, records) in buffers.items():
+                self._write(path, b"".join(records))
+
+    def _write(self: "RunLogDumper", path: str, data: bytes) -> None:
+        with _file_lock(path + ".lock"):
+            if self.max_bytes is not None:
+                try:
+                    size = os.path.getsize(path)
+                except OSError:
+                    size = 0
+                if size and size + len(data) > self.max_bytes:
+                    self._rotate(path)
+
+            with open(path, "ab") as _file:
+                _file.write(data)
+
+    def _rotate(self: "RunLogDumper", path: str) -> None:
+        if self.backup_count < 1:
+            os.remove(path)
+            return
+
+        for index in range(self.backup_count - 1, 0, -1):
+            if os.path.exists(f"{path}.{index}"):
+                os.replace(f"{path}.{index}", f"{path}.{index + 1}")
+        os.replace(path, f"{path}.1")
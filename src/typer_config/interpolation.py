@@ -0,0 +1,296 @@
+"""Configuration Value Interpolation.
+
+Templated string values such as `"${paths.root}/cache"` or `"${env:HOME}"`
+are compiled once and resolved in dependency order with memoization.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Mapping
+
+    from .__typing import ConfigDict
+
+TEMPLATE_RE = re.compile(r"\$(\$?)\{([^{}]*)\}")
+"""Matches `${reference}` (and the escaped literal form `$${reference}`)."""
+
+ENV_PREFIX = "env:"
+
+ConfigPath = tuple[Any, ...]
+
+
+class InterpolationError(ValueError):
+    """Raised when a templated value cannot be resolved."""
+
+
+class _Reference(NamedTuple):
+    """Reference to another config value or an environment variable."""
+
+    path: ConfigPath
+    env: str | None = None
+
+
+Template = tuple[str | _Reference, ...]
+"""Compiled template: literal string chunks and references."""
+
+
+def compile_template(value: str) -> Template | None:
+    """Compile a templated string.
+
+    Args:
+        value (str): string that may contain `${...}` references
+
+    Raises:
+        InterpolationError: empty reference
+
+    Returns:
+        Template | None: compiled template or None if `value` has no references
+    """
+    if "${" not in value:
+        return None
+
+    parts: list[str | _Reference] = []
+    literal: list[str] = []
+    has_reference = False
+    pos = 0
+
+    for match in TEMPLATE_RE.finditer(value):
+        literal.append(value[pos : match.start()])
+        pos = match.end()
+        escaped, body = match.groups()
+
+        if escaped:
+            literal.append("${" + body + "}")
+            continue
+
+        body = body.strip()
+        if not body:
+            msg = f"Empty reference in '{value}'."
+            raise InterpolationError(msg)
+
+        chunk = "".join(literal)
+        if chunk:
+            parts.append(chunk)
+        literal = []
+
+        if body.startswith(ENV_PREFIX):
+            parts.append(_Reference((), env=body[len(ENV_PREFIX) :]))
+        else:
+            parts.append(_Reference(tuple(body.split("."))))
+        has_reference = True
+
+    literal.append(value[pos:])
+    tail = "".join(literal)
+
+    if not has_reference:
+        # only escapes, no references: keep the unescaped string as a literal
+        return (tail,)
+
+    if tail:
+        parts.append(tail)
+
+    return tuple(parts)
+
+
+class _Resolver:
+    """Resolves all templates of a config in dependency order."""
+
+    def __init__(
+        self: _Resolver, config: ConfigDict, environ: Mapping[str, str]
+    ) -> None:
+        self.config = config
+        self.environ = environ
+        self.resolved: dict[ConfigPath, Any] = {}
+        self.templates: dict[str, Template | None] = {}
+
+    def compile(self: _Resolver, value: str) -> Template | None:
+        # identical strings are only compiled once
+        try:
+            return self.templates[value]
+        except KeyError:
+            template = self.templates[value] = compile_template(value)
+            return template
+
+    def lookup(self: _Resolver, path: ConfigPath, origin: ConfigPath) -> ConfigPath:
+        """Normalize a reference path against the raw config.
+
+        List indices are converted to `int` so that every value has exactly
+        one canonical path (which is what the memoization is keyed on).
+        """
+        node: Any = self.config
+        canonical: list[Any] = []
+
+        for key in path:
+            if isinstance(node, dict) and key in node:
+                node = node[key]
+                canonical.append(key)
+            elif isinstance(node, list) and key.lstrip("-").isdigit():
+                index = int(key)
+                if not -len(node) <= index < len(node):
+                    break
+                index %= len(node)
+                node = node[index]
+                canonical.append(index)
+            else:
+                if isinstance(node, str) and self.compile(node):
+                    msg = (
+                        f"Cannot reference '{'.'.join(path)}' from "
+                        f"'{_dotted(origin)}': it traverses an interpolated value."
+                    )
+                    raise InterpolationError(msg)
+                break
+        else:
+            return tuple(canonical)
+
+        msg = f"Unknown reference '{'.'.join(path)}' in '{_dotted(origin)}'."
+        raise InterpolationError(msg)
+
+    def value_at(self: _Resolver, path: ConfigPath) -> Any:  # noqa: ANN401
+        node: Any = self.config
+        for key in path:
+            node = node[key]
+        return node
+
+    def dependencies(
+        self: _Resolver, path: ConfigPath, raw: Any  # noqa: ANN401
+    ) -> list[ConfigPath]:
+        if isinstance(raw, dict):
+            return [(*path, key) for key in raw]
+        if isinstance(raw, list):
+            return [(*path, index) for index in range(len(raw))]
+        if isinstance(raw, str):
+            template = self.compile(raw)
+            if template is not None:
+                return [
+                    self.lookup(part.path, path)
+                    for part in template
+                    if isinstance(part, _Reference) and part.env is None
+                ]
+        return []
+
+    def build(self: _Resolver, path: ConfigPath, raw: Any) -> Any:  # noqa: ANN401
+        # NOTE: all dependencies are already resolved at this point.
+        if isinstance(raw, dict):
+            return {key: self.resolved[(*path, key)] for key in raw}
+        if isinstance(raw, list):
+            return [self.resolved[(*path, index)] for index in range(len(raw))]
+        if not isinstance(raw, str):
+            return raw
+
+        template = self.compile(raw)
+        if template is None:
+            return raw
+
+        values = [self.render(part, path) for part in template]
+
+        # a lone reference keeps the type of the referenced value
+        if len(values) == 1 and isinstance(template[0], _Reference):
+            return values[0]
+
+        for value in values:
+            if isinstance(value, (dict, list)):
+                msg = (
+                    f"Cannot embed a {type(value).__name__} in the string "
+                    f"'{raw}' at '{_dotted(path)}'."
+                )
+                raise InterpolationError(msg)
+
+        return "".join(str(value) for value in values)
+
+    def render(
+        self: _Resolver, part: str | _Reference, origin: ConfigPath
+    ) -> Any:  # noqa: ANN401
+        if isinstance(part, str):
+            return part
+        if part.env is not None:
+            try:
+                return self.environ[part.env]
+            except KeyError:
+                msg = (
+                    f"Environment variable '{part.env}' referenced in "
+                    f"'{_dotted(origin)}' is not set."
+                )
+                raise InterpolationError(msg) from None
+        return self.resolved[self.lookup(part.path, origin)]
+
+    def resolve(self: _Resolver) -> ConfigDict:
+        # Iterative depth-first traversal so that long reference chains
+        # don't hit the recursion limit. Every path is expanded once and
+        # built once, so the total work is linear in the number of values
+        # plus the number of references.
+        in_progress: set[ConfigPath] = set()
+        stack: list[ConfigPath] = [()]
+
+        while stack:
+            path = stack[-1]
+
+            if path in self.resolved:
+                stack.pop()
+                continue
+
+            raw = self.value_at(path)
+
+            if path in in_progress:
+                # second visit: every dependency has been resolved
+                self.resolved[path] = self.build(path, raw)
+                in_progress.discard(path)
+                stack.pop()
+                continue
+
+            in_progress.add(path)
+
+            for dep in self.dependencies(path, raw):
+                if dep in self.resolved:
+                    continue
+                if dep in in_progress:
+                    msg = (
+                        f"Circular reference: '{_dotted(path)}' depends on "
+                        f"'{_dotted(dep)}'."
+                    )
+                    raise InterpolationError(msg)
+                stack.append(dep)
+
+        return self.resolved[()]
+
+
+def _dotted(path: ConfigPath) -> str:
+    return ".".join(str(key) for key in path)
+
+
+def interpolate_config(
+    config: ConfigDict, environ: Mapping[str, str] | None = None
+) -> ConfigDict:
+    """Resolve `${...}` references in configuration values.
+
+    References use dotted paths from the root of the config
+    (`${paths.root}`, `${servers.0.host}`) or read environment variables
+    (`${env:HOME}`). A value that consists of a single reference keeps the
+    type of the referenced value; otherwise the values are formatted into
+    the string. Use `$${...}` for a literal `${...}`.
+
+    Note:
+        This is a `ConfigDictTransformer`, so it plugs directly into
+        `loader_transformer`:
+        ```py
+        interpolated_loader = loader_transformer(
+            yaml_loader,
+            config_transformer=interpolate_config,
+        )
+        ```
+
+    Args:
+        config (ConfigDict): configuration to interpolate (not modified)
+        environ (Mapping[str, str] | None, optional): environment variables.
+            Defaults to None (`os.environ`).
+
+    Raises:
+        InterpolationError: unknown or circular reference
+
+    Returns:
+        ConfigDict: interpolated configuration
+    """
+    return _Resolver(config, os.environ if environ is None else environ).resolve()
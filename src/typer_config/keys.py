@@ -0,0 +1,126 @@
+"""Config Key Checks.
+
+Config keys must match the parameter names of a command, so a typo (or
+`max-workers` for `max_workers`) is silently ignored by click. A `KeyIndex`
+of the accepted spellings of every parameter is built once, when a config
+decorator is applied, and each loaded config is normalized to parameter
+names and checked against it in a single pass over its keys.
+"""
+
+from __future__ import annotations
+
+from difflib import get_close_matches
+from typing import TYPE_CHECKING, Any
+
+from .profiles import PROFILES_KEY
+from .utils import show_simple_warning
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Collection, Iterable
+
+    from typer import Context
+
+    from .__typing import ConfigDict
+
+UNKNOWN_KEYS_MODES = ("ignore", "warn", "error")
+"""What to do about config keys that aren't parameters of the command."""
+
+KEYS_META = "typer_config.keys"
+"""`ctx.meta` key of the key index (and mode) of the command."""
+
+
+class UnknownKeysError(ValueError):
+    """Config keys that aren't parameters of the command."""
+
+
+class KeyIndex:
+    """Accepted config key spellings of a command's parameters.
+
+    Parameter names are accepted as they are and with dashes instead of
+    underscores (`max_workers` and `max-workers`).
+    """
+
+    def __init__(
+        self: KeyIndex,
+        names: Iterable[str],
+        reserved: Collection[str] = (PROFILES_KEY,),
+    ) -> None:
+        """Build the index.
+
+        Args:
+            names (Iterable[str]): parameter names
+            reserved (Collection[str], optional): other keys that are accepted
+                as they are. Defaults to (PROFILES_KEY,).
+        """
+        self.names: dict[str, str] = {}
+        for name in names:
+            self.names[name] = name
+            self.names.setdefault(name.replace("_", "-"), name)
+        for key in reserved:
+            self.names.setdefault(key, key)
+
+    def _describe(self: KeyIndex, key: str) -> str:
+        matches = get_close_matches(key.replace("-", "_"), self.names.values(), n=1)
+        return f"'{key}' (did you mean '{matches[0]}'?)" if matches else f"'{key}'"
+
+    def normalize(
+        self: KeyIndex,
+        config: ConfigDict,
+        mode: str = "warn",
+        subcommands: Collection[str] = (),
+    ) -> ConfigDict:
+        """Rename config keys to parameter names and check for unknown keys.
+
+        Args:
+            config (ConfigDict): loaded config
+            mode (str, optional): one of UNKNOWN_KEYS_MODES. Defaults to "warn".
+            subcommands (Collection[str], optional): subcommand names, which
+                are accepted as keys of their sections. Defaults to ().
+
+        Raises:
+            UnknownKeysError: unknown or repeated keys in "error" mode
+
+        Returns:
+            ConfigDict: config keyed by parameter names (`config` itself if
+                nothing was renamed)
+        """
+        normalized: ConfigDict = {}
+        renamed = False
+        problems: list[str] = []
+
+        for key, value in config.items():
+            name = self.names.get(key)
+            if name is None:
+                name = key
+                if key not in subcommands:
+                    problems.append(f"unknown key {self._describe(key)}")
+            elif name in normalized:
+                problems.append(f"'{name}' is given more than once")
+            renamed = renamed or name != key
+            normalized[name] = value
+
+        if problems and mode != "ignore":
+            message = f"Config: {', '.join(problems)}."
+            if mode == "error":
+                raise UnknownKeysError(message)
+            show_simple_warning(message, UserWarning)
+
+        return normalized if renamed else config
+
+
+def check_keys(ctx: Context, config: ConfigDict) -> ConfigDict:
+    """Normalize a config with the key index of the command, if it has one.
+
+    Args:
+        ctx (typer.Context): typer context
+        config (ConfigDict): loaded config
+
+    Returns:
+        ConfigDict: normalized config
+    """
+    if KEYS_META not in ctx.meta:
+        return config
+
+    index, mode = ctx.meta[KEYS_META]
+    subcommands: Any = getattr(ctx.command, "commands", ())
+    return index.normalize(config, mode, subcommands)
@@ -1,19 +1,33 @@
 """Configuration File Loaders.
 
 These loaders must implement the `typer_config.__typing.ConfigLoader` interface.
+
+The file loaders also read compressed files (e.g. `config.json.gz`, see
+`typer_config.compression`), files inside zip archives (e.g.
+`zip://app.pyz!/config.yml` or `importlib.resources` traversables, see
+`typer_config.archives`) and streams (`-` for stdin or `/dev/fd/N`, see
+`typer_config.streams`).
 """
 
 from __future__ import annotations
 
 import json
-from collections.abc import Mapping
-from configparser import ConfigParser
-from pathlib import Path
+import os
+from concurrent.futures import ProcessPoolExecutor
+from configparser import DEFAULTSECT, ConfigParser
 from typing import TYPE_CHECKING, Any
 
 from .__optional_imports import try_import
+from .archives import config_exists, is_traversable
+from .binary import BINARY_SUFFIX, decode_config
+from .compression import open_file, strip_compression_suffix
+from .dotenv_parser import dotenv_values
+from .merging import MergeStrategies, _deep_merge
+from .streams import STREAM_FORMATS, is_stream, sniff_stream_format
 
 if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Collection, Iterable, Mapping
+
     from .__typing import (
         ConfigDict,
         ConfigDictTransformer,
@@ -95,17 +109,104 @@ def loader_transformer(
     return _loader
 
 
-def yaml_loader(param_value: TyperParameterValue) -> ConfigDict:
+def _select_yaml_document(
+    loader: Any,  # noqa: ANN401
+    document: int | Mapping[str, Any],
+) -> ConfigDict:
+    """Construct the selected document of a YAML stream.
+
+    Documents are composed (parsed into nodes) one at a time and only the
+    selected one is constructed into python objects. Parsing stops as soon
+    as it is found, so the rest of the stream is never read.
+
+    Args:
+        loader (Any): pyyaml loader of the stream
+        document (int | Mapping[str, Any]): index of the document or
+            discriminator keys and values its top level must contain
+
+    Returns:
+        ConfigDict: selected document or empty dictionary if there is none
+    """
+    index = 0
+
+    while loader.check_node():
+        node = loader.get_node()
+
+        if isinstance(document, int):
+            selected = index == document
+        else:
+            selected = _yaml_node_matches(loader, node, document)
+
+        if selected:
+            return loader.construct_document(node)
+
+        index += 1
+
+    return {}
+
+
+def _yaml_node_matches(
+    loader: Any,  # noqa: ANN401
+    node: Any,  # noqa: ANN401
+    discriminator: Mapping[str, Any],
+) -> bool:
+    """Check whether a document node has the discriminator keys and values.
+
+    Only the top-level scalar keys and values of the node are constructed.
+
+    Args:
+        loader (Any): pyyaml loader of the stream
+        node (Any): composed document node
+        discriminator (Mapping[str, Any]): keys and values to look for
+
+    Returns:
+        bool: whether all discriminator keys have the given values
+    """
+    if node.id != "mapping":
+        return False
+
+    found = {}
+    for key_node, value_node in node.value:
+        if key_node.id != "scalar":
+            continue
+        key = loader.construct_document(key_node)
+        if key in discriminator and value_node.id == "scalar":
+            found[key] = loader.construct_document(value_node)
+
+    return all(
+        key in found and found[key] == value for key, value in discriminator.items()
+    )
+
+
+def yaml_loader(
+    param_value: TyperParameterValue,
+    *,
+    document: int | Mapping[str, Any] | None = None,
+) -> ConfigDict:
     """YAML file loader.
 
+    Note:
+        Use `document` to load one document of a multi-document (`---`
+        separated) file, e.g. to keep all environments in one file:
+        ```py
+        prod_loader = partial(yaml_loader, document={"env": "prod"})
+        ```
+
     Args:
         param_value (TyperParameterValue): path of YAML file
+        document (int | Mapping[str, Any] | None, optional): document to load
+            from a multi-document file, either by (zero-based) index or by
+            discriminator keys and values at its top level. The file is only
+            parsed up to the selected document and the other documents are
+            never constructed. Defaults to None (the file must contain a
+            single document).
 
     Raises:
         ModuleNotFoundError: pyyaml library is not installed
 
     Returns:
-        ConfigDict: dictionary loaded from file
+        ConfigDict: dictionary loaded from file (empty if the selected
+            document doesn't exist)
     """
 
     yaml = try_import("yaml")
@@ -114,10 +215,17 @@ def yaml_loader(param_value: TyperParameterValue) -> ConfigDict:
         message = "Please install the pyyaml library."
         raise ModuleNotFoundError(message)
 
-    with open(param_value, encoding="utf-8") as _file:
-        conf: ConfigDict = yaml.safe_load(_file)
+    with open_file(param_value, encoding="utf-8") as _file:
+        if document is None:
+            conf: ConfigDict = yaml.safe_load(_file)
+            return conf
 
-    return conf
+        # the libyaml based loader (if available) composes documents much faster
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)(_file)
+        try:
+            return _select_yaml_document(loader, document)
+        finally:
+            loader.dispose()
 
 
 def json_loader(param_value: TyperParameterValue) -> ConfigDict:
@@ -130,12 +238,28 @@ def json_loader(param_value: TyperParameterValue) -> ConfigDict:
         ConfigDict: dictionary loaded from file
     """
 
-    with open(param_value, encoding="utf-8") as _file:
+    with open_file(param_value, encoding="utf-8") as _file:
         conf: ConfigDict = json.load(_file)
 
     return conf
 
 
+def binary_loader(param_value: TyperParameterValue) -> ConfigDict:
+    """Binary config file loader.
+
+    See `typer_config.binary` for the format.
+
+    Args:
+        param_value (TyperParameterValue): path of binary config file
+
+    Returns:
+        ConfigDict: dictionary loaded from file
+    """
+
+    with open_file(param_value, "rb") as _file:
+        return decode_config(_file.read())
+
+
 def toml_loader(param_value: TyperParameterValue) -> ConfigDict:
     """TOML file loader.
 
@@ -153,7 +277,7 @@ def toml_loader(param_value: TyperParameterValue) -> ConfigDict:
     tomllib = try_import("tomllib")
 
     if tomllib is not None:
-        with open(param_value, "rb") as _file:
+        with open_file(param_value, "rb") as _file:
             return tomllib.load(_file)
 
     # couldn't find `tommllib`, so try `toml`
@@ -163,15 +287,24 @@ def toml_loader(param_value: TyperParameterValue) -> ConfigDict:
         message = "Please install the toml library."
         raise ModuleNotFoundError(message)
 
-    with open(param_value, encoding="utf-8") as _file:
+    with open_file(param_value, encoding="utf-8") as _file:
         return toml.load(_file)
 
 
-def dotenv_loader(param_value: TyperParameterValue) -> ConfigDict:
+def dotenv_loader(
+    param_value: TyperParameterValue, *, use_python_dotenv: bool = False
+) -> ConfigDict:
     """Dotenv file loader.
 
+    Note:
+        By default, files are parsed with the built-in
+        `typer_config.dotenv_parser`, which gives the same results as
+        python-dotenv's `dotenv_values` without importing it at startup.
+
     Args:
         param_value (TyperParameterValue): path of Dotenv file
+        use_python_dotenv (bool, optional): parse with the python-dotenv
+            library instead. Defaults to False.
 
     Raises:
         ModuleNotFoundError: python-dotenv library is not installed
@@ -180,13 +313,17 @@ def dotenv_loader(param_value: TyperParameterValue) -> ConfigDict:
         ConfigDict: dictionary loaded from file
     """
 
+    if not use_python_dotenv:
+        with open_file(param_value, encoding="utf-8") as _file:
+            return dotenv_values(_file.read())
+
     dotenv = try_import("dotenv")
 
     if dotenv is None:  # pragma: no cover
         message = "Please install the python-dotenv library."
         raise ModuleNotFoundError(message)
 
-    with open(param_value, encoding="utf-8") as _file:
+    with open_file(param_value, encoding="utf-8") as _file:
         # NOTE: I'm using a stream here so that the loader
         # will raise an exception when the file doesn't exist.
         conf: ConfigDict = dotenv.dotenv_values(stream=_file)
@@ -194,7 +331,35 @@ def dotenv_loader(param_value: TyperParameterValue) -> ConfigDict:
     return conf
 
 
-def ini_loader(param_value: TyperParameterValue) -> ConfigDict:
+def _read_ini_sections(_file: Iterable[str], sections: Collection[str]) -> str:
+    """Extract the text of some sections (and DEFAULT) from an INI file.
+
+    Args:
+        _file (Iterable[str]): lines of the INI file
+        sections (Collection[str]): names of sections to keep
+
+    Returns:
+        str: INI text with only the requested sections
+    """
+    keep = False
+    lines: list[str] = []
+
+    for line in _file:
+        # NOTE: indented lines are continuations of the previous value
+        if line[:1] == "[":
+            match = ConfigParser.SECTCRE.match(line.rstrip())
+            if match is not None:
+                name = match.group("header")
+                keep = name in sections or name == DEFAULTSECT
+        if keep:
+            lines.append(line)
+
+    return "".join(lines)
+
+
+def ini_loader(
+    param_value: TyperParameterValue, *, sections: Collection[str] | None = None
+) -> ConfigDict:
     """INI file loader.
 
     Note:
@@ -204,21 +369,30 @@ def ini_loader(param_value: TyperParameterValue) -> ConfigDict:
         For example:
         ```py
         ini_section_loader = loader_transformer(
-            ini_loader,
+            partial(ini_loader, sections=["section"]),
             config_transformer=lambda config: config["section"],
         )
         ```
 
     Args:
         param_value (TyperParameterValue): path of INI file
+        sections (Collection[str] | None, optional): only parse (and interpolate)
+            these sections. The file is scanned for their headers and all other
+            sections are skipped, which is much faster for files with many
+            sections. Defaults to None (all sections).
 
     Returns:
         ConfigDict: dictionary loaded from file
     """
 
     ini_parser = ConfigParser()
-    with open(param_value, encoding="utf-8") as _file:
-        ini_parser.read_file(_file)
+    with open_file(param_value, encoding="utf-8") as _file:
+        if sections is None:
+            ini_parser.read_file(_file)
+        else:
+            ini_parser.read_string(
+                _read_ini_sections(_file, sections), source=str(param_value)
+            )
 
     conf: ConfigDict = {
         sect: dict(ini_parser.items(sect)) for sect in ini_parser.sections()
@@ -227,37 +401,45 @@ def ini_loader(param_value: TyperParameterValue) -> ConfigDict:
     return conf
 
 
-def _deep_merge(base: dict[str, Any], override: Mapping[str, Any]) -> dict[str, Any]:
-    """Deep merge two dictionaries.
-
-    Values from `override` take precedence over `base`.
-    Nested dictionaries are merged recursively.
+def _get_loader_for_format(fmt: str) -> ConfigLoader:
+    """Get the loader of a config format.
 
     Args:
-        base (dict[str, Any]): Base dictionary.
-        override (Mapping[str, Any]): Dictionary with values to override.
+        fmt (str): one of `typer_config.streams.STREAM_FORMATS`
 
     Returns:
-        dict[str, Any]: Merged dictionary.
+        ConfigLoader: Loader function for the format.
+
+    Raises:
+        ValueError: If the format is not supported.
     """
-    result = dict(base)
-    for key, value in override.items():
-        if (
-            key in result
-            and isinstance(result[key], dict)
-            and isinstance(value, Mapping)
-        ):
-            result[key] = _deep_merge(result[key], value)
-        else:
-            result[key] = value
-    return result
+    loaders: dict[str, ConfigLoader] = {
+        "json": json_loader,
+        "yaml": yaml_loader,
+        "toml": toml_loader,
+        "ini": ini_loader,
+        "env": dotenv_loader,
+        "binary": binary_loader,
+    }
+    if fmt not in loaders:
+        msg = f"Unsupported config format '{fmt}', expected one of {STREAM_FORMATS}."
+        raise ValueError(msg)
+    return loaders[fmt]
 
 
-def _get_loader_for_file(file_path: str) -> ConfigLoader:  # pragma: no cover
+def _get_loader_for_file(  # noqa: PLR0911
+    file_path: TyperParameterValue, stream_format: str | None = None
+) -> ConfigLoader:  # pragma: no cover
     """Get the appropriate loader based on file extension.
 
+    Streams have no extension, so their format is `stream_format` or
+    detected from their first bytes.
+
     Args:
-        file_path (str): Path to the configuration file.
+        file_path (TyperParameterValue): Path to the configuration file
+            (or an `importlib.resources` traversable or a stream).
+        stream_format (str | None, optional): format of streams.
+            Defaults to None (detect it).
 
     Returns:
         ConfigLoader: Loader function for the file type.
@@ -265,6 +447,13 @@ def _get_loader_for_file(file_path: str) -> ConfigLoader:  # pragma: no cover
     Raises:
         ValueError: If file format is not supported.
     """
+    if is_stream(file_path):
+        return _get_loader_for_format(stream_format or sniff_stream_format(file_path))
+
+    # compressed files (e.g. `config.json.gz`) are opened by `open_file`
+    file_path = strip_compression_suffix(
+        file_path.name if is_traversable(file_path) else str(file_path)
+    )
     if file_path.endswith(".json"):
         return json_loader
     if file_path.endswith((".yaml", ".yml")):
@@ -275,20 +464,128 @@ def _get_loader_for_file(file_path: str) -> ConfigLoader:  # pragma: no cover
         return ini_loader
     if file_path.endswith(".env"):
         return dotenv_loader
+    if file_path.endswith(BINARY_SUFFIX):
+        return binary_loader
     msg = f"Unsupported file format for '{file_path}'."
     raise ValueError(msg)
 
 
-def multifile_loader(
+PROCESS_POOL_THRESHOLD = 4 * 1024 * 1024
+"""Suggested combined file size (bytes) above which `multifile_loader` parses
+in processes, when the process pool is enabled."""
+
+
+def _load_file(
+    file_path: TyperParameterValue, stream_format: str | None = None
+) -> ConfigDict:
+    """Load a single file with the loader for its extension.
+
+    Note:
+        This is a module level function so that it can be sent to
+        worker processes.
+
+    Args:
+        file_path (TyperParameterValue): path of configuration file
+        stream_format (str | None, optional): format of streams.
+            Defaults to None (detect it).
+
+    Returns:
+        ConfigDict: dictionary loaded from file
+    """
+    return _get_loader_for_file(file_path, stream_format)(file_path)
+
+
+def _available_cpus() -> int:
+    """Number of CPUs this process may run on.
+
+    Returns:
+        int: usable CPU count (at least 1)
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1  # pragma: no cover
+
+
+def _file_size(file_path: TyperParameterValue) -> int:
+    """Size of a file in bytes (0 if it can't be accessed).
+
+    Args:
+        file_path (TyperParameterValue): file path
+
+    Returns:
+        int: file size
+    """
+    try:
+        return os.stat(file_path).st_size
+    except OSError:
+        return 0
+
+
+def _load_files(
+    files: list[TyperParameterValue],
+    process_pool_threshold: int | None,
+    stream_format: str | None = None,
+) -> list[ConfigDict]:
+    """Load files, parsing them in a process pool when they are large enough.
+
+    Parsers like pyyaml hold the GIL, so threads don't help with big files.
+    Spawning worker processes is only worth it when there is enough parsing
+    work to outweigh the pool startup cost.
+
+    Args:
+        files (list[TyperParameterValue]): files to load
+        process_pool_threshold (int | None): combined size in bytes above which
+            a process pool is used. None disables the process pool.
+        stream_format (str | None, optional): format of streams.
+            Defaults to None (detect it).
+
+    Returns:
+        list[ConfigDict]: loaded configs in the same order as `files`
+    """
+    workers = min(len(files), _available_cpus())
+
+    if (
+        process_pool_threshold is None
+        or workers < 2  # noqa: PLR2004
+        # traversables and streams can't be sent to worker processes
+        or any(is_traversable(file_path) or is_stream(file_path) for file_path in files)
+        or sum(_file_size(file_path) for file_path in files) < process_pool_threshold
+    ):
+        return [_load_file(file_path, stream_format) for file_path in files]
+
+    # fail early (and in this process) on unsupported formats
+    for file_path in files:
+        _get_loader_for_file(file_path)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_load_file, files))
+
+
+def multifile_loader(  # noqa: PLR0913
     files: list[TyperParameterValue],
     *,
     skip_missing: bool = True,
     deep_merge: bool = True,
+    process_pool_threshold: int | None = None,
+    stream_format: str | None = None,
+    merge_strategies: Mapping[str, str] | MergeStrategies | None = None,
 ) -> ConfigDict:
     """Loader that merges multiple configuration files into one dictionary.
 
     Files are processed in order, with later files overriding earlier ones.
-    Missing files are skipped by default.
+    Missing files are skipped by default. Files can also be streams (`-` for
+    stdin or `/dev/fd/N`), whose format is `stream_format` or detected from
+    their content.
+
+    With a `process_pool_threshold` (e.g. `PROCESS_POOL_THRESHOLD`), files
+    whose combined size exceeds it are parsed in parallel worker processes
+    (bounded by the available CPUs) and merged in this process in precedence
+    order.
+
+    Warning:
+        Worker processes may import `__main__` again (the `spawn` and
+        `forkserver` start methods), so only enable the process pool in
+        scripts with an `if __name__ == "__main__":` guard.
 
     Args:
         files (list[TyperParameterValue]): List of paths to configuration files.
@@ -296,31 +593,44 @@ def multifile_loader(
             Defaults to True.
         deep_merge (bool, optional): Deep merge nested dictionaries.
             Defaults to True.
+        process_pool_threshold (int | None, optional): Combined file size in
+            bytes above which files are parsed in a process pool.
+            Defaults to None (no process pool).
+        stream_format (str | None, optional): format of streams, one of
+            `typer_config.streams.STREAM_FORMATS`. Defaults to None (detect it).
+        merge_strategies (Mapping[str, str] | MergeStrategies | None, optional):
+            how lists are merged by key path when deep merging, see
+            `typer_config.merging`. Defaults to None (later lists replace
+            earlier ones).
 
     Returns:
         ConfigDict: Merged dictionary loaded from all files.
     """
     merged_config: ConfigDict = {}
 
-    for file_path in files:
-        if not file_path:
-            continue
+    if merge_strategies is not None and not isinstance(
+        merge_strategies, MergeStrategies
+    ):
+        merge_strategies = MergeStrategies(merge_strategies)
 
-        if skip_missing and not Path(file_path).is_file():
-            continue
-
-        loader = _get_loader_for_file(file_path)
-        config = loader(file_path)
+    files = [
+        file_path
+        for file_path in files
+        if file_path and not (skip_missing and not config_exists(file_path))
+    ]
 
+    for config in _load_files(files, process_pool_threshold, stream_format):
         if deep_merge:
-            merged_config = _deep_merge(merged_config, config)
+            merged_config = _deep_merge(merged_config, config, merge_strategies)
         else:
             merged_config.update(config)
 
     return merged_config
 
 
-def multifile_fallback_loader(files: list[TyperParameterValue]) -> ConfigDict:
+def multifile_fallback_loader(
+    files: list[TyperParameterValue], *, stream_format: str | None = None
+) -> ConfigDict:
     """Loader that uses the first existing configuration file from a list.
 
     Files are checked in order. The first file that exists is loaded and returned.
@@ -329,6 +639,8 @@ def multifile_fallback_loader(files: list[TyperParameterValue]) -> ConfigDict:
     Args:
         files (list[TyperParameterValue]): List of paths to configuration files,
             in order of priority (first has highest priority).
+        stream_format (str | None, optional): format of streams (`-` for stdin
+            or `/dev/fd/N`). Defaults to None (detect it).
 
     Returns:
         ConfigDict: Dictionary loaded from the first existing file,
@@ -336,8 +648,8 @@ def multifile_fallback_loader(files: list[TyperParameterValue]) -> ConfigDict:
     """
     for file_path in files:
 
-        if Path(file_path).is_file():
-            loader = _get_loader_for_file(file_path)
+        if config_exists(file_path):
+            loader = _get_loader_for_file(file_path, stream_format)
             return loader(file_path)
 
     return {}
@@ -0,0 +1,292 @@
+"""Config Merging.
+
+Layered configs are deep merged: nested dictionaries are merged and other
+values (including lists) are replaced. The lists at some key paths can be
+merged with another strategy instead:
+
+| strategy             | result                                            |
+| -------------------- | ------------------------------------------------- |
+| `replace`            | the later list (the default)                      |
+| `append`             | earlier items, then later items                   |
+| `prepend`            | later items, then earlier items                   |
+| `union`              | `append` without repeated items                   |
+| `union_by_key:FIELD` | dictionaries with the same `FIELD` deep merged    |
+
+Key paths are dotted and `*` matches any key, e.g.
+`{"plugins": "union", "tenants.*.include_paths": "append"}`. For the same
+list, an exact path takes priority over a wildcard. Unions hash the items
+(or their keys) together with their types, so they take linear time and
+`1`, `1.0` and `True` stay different items. Nested lists, tuples, sets and
+mappings (and arrays) are hashed by their contents, and only values that
+can't be hashed at all (e.g. bytearrays) are compared one by one.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Mapping
+from typing import Any
+
+MERGE_STRATEGIES = ("replace", "append", "prepend", "union", "union_by_key")
+"""List merge strategies (`union_by_key` takes a field, `union_by_key:name`)."""
+
+# trie of key paths: segment (or "*") -> node, None -> strategy
+_Node = dict[Any, Any]
+
+
+class MergeStrategies:
+    """Compiled list merge strategies by key path."""
+
+    def __init__(self: MergeStrategies, strategies: Mapping[str, str]) -> None:
+        """Compile strategies.
+
+        Args:
+            strategies (Mapping[str, str]): strategy by dotted key path
+
+        Raises:
+            ValueError: unknown strategy
+        """
+        self.strategies = dict(strategies)
+        self.root: _Node = {}
+
+        for path, strategy in strategies.items():
+            name, _, field = strategy.partition(":")
+            if name not in MERGE_STRATEGIES or bool(field) != (name == "union_by_key"):
+                message = (
+                    f"Unknown merge strategy '{strategy}' for '{path}', expected"
+                    f" one of {MERGE_STRATEGIES}."
+                )
+                raise ValueError(message)
+
+            node = self.root
+            for segment in path.split("."):
+                node = node.setdefault(segment, {})
+            node[None] = (name, field)
+
+        _inherit(self.root)
+
+    def __repr__(self: MergeStrategies) -> str:
+        """Representation of the strategies.
+
+        Returns:
+            str: representation
+        """
+        return f"{type(self).__name__}({self.strategies!r})"
+
+
+def _graft(target: _Node, source: _Node) -> None:
+    """Copy the rules of `source` into `target`, keeping those of `target`.
+
+    Args:
+        target (_Node): trie node
+        source (_Node): trie node
+    """
+    for segment, child in source.items():
+        if segment is None:
+            target.setdefault(None, child)
+        else:
+            _graft(target.setdefault(segment, {}), child)
+
+
+def _inherit(node: _Node) -> None:
+    """Add the `*` rules of every trie node to its named siblings.
+
+    So the rules of a key are found in one node, and exact paths take
+    priority over wildcards for the same list.
+
+    Args:
+        node (_Node): trie node
+    """
+    wildcard = node.get("*")
+    for segment, child in node.items():
+        if segment is None:
+            continue
+        if wildcard is not None and segment != "*":
+            _graft(child, wildcard)
+        _inherit(child)
+
+
+def _freeze(value: Any) -> Any:  # noqa: ANN401
+    """Hashable key of a (nested) config value.
+
+    Types are part of the key, so that e.g. `1`, `1.0` and `True` (which
+    compare equal) are different items.
+
+    Args:
+        value (Any): config value
+
+    Raises:
+        TypeError: the value (or one of its items) can't be hashed
+
+    Returns:
+        Any: hashable key
+    """
+    if isinstance(value, Mapping):
+        return (
+            dict,
+            frozenset(
+                zip(map(_freeze, value), map(_freeze, value.values()), strict=True)
+            ),
+        )
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(map(_freeze, value)))
+    if isinstance(value, array):
+        # e.g. compacted lists (see `typer_config.compaction`)
+        return (array, value.typecode, value.tobytes())
+    if isinstance(value, (set, frozenset)):
+        # sets and frozensets with the same items are equal
+        return (frozenset, frozenset(map(_freeze, value)))
+    key = (type(value), value)
+    hash(key)
+    return key
+
+
+_SCALARS = frozenset({str, int, float, bool, type(None)})
+
+
+def _key(value: Any) -> Any:  # noqa: ANN401
+    """Hashable key of a config value (see `_freeze`), fast for scalars.
+
+    Args:
+        value (Any): config value
+
+    Returns:
+        Any: hashable key
+    """
+    if type(value) in _SCALARS:
+        return (type(value), value)
+    return _freeze(value)
+
+
+class _Seen:
+    """Positions of the items seen so far, by hashable key or else by equality."""
+
+    def __init__(self: _Seen) -> None:
+        self.keys: dict[Any, int] = {}
+        # items that can't be hashed (e.g. bytearrays) are compared one by one
+        self.unhashable: list[tuple[Any, int]] = []
+
+    def setdefault(self: _Seen, item: Any, position: int) -> int:  # noqa: ANN401
+        """Position of the first item equal to `item`.
+
+        Args:
+            item (Any): item
+            position (int): position of `item`, kept if it is new
+
+        Returns:
+            int: position of the first equal item (`position` if it's new)
+        """
+        try:
+            key = _key(item)
+        except TypeError:
+            for other, first in self.unhashable:
+                if type(other) is type(item) and other == item:
+                    return first
+            self.unhashable.append((item, position))
+            return position
+        return self.keys.setdefault(key, position)
+
+
+def _union(base: list[Any], override: list[Any]) -> list[Any]:
+    items = [*base, *override]
+
+    if all(type(item) in _SCALARS for item in items):
+        # dicts keep insertion order, so first occurrences keep their place
+        # (and assigning in reverse keeps the first occurrence of each item)
+        keys = [(type(item), item) for item in items]
+        first = dict(zip(reversed(keys), reversed(items), strict=True))
+        return list(map(first.__getitem__, dict.fromkeys(keys)))
+
+    merged: list[Any] = []
+    seen = _Seen()
+    for item in items:
+        if seen.setdefault(item, len(merged)) == len(merged):
+            merged.append(item)
+    return merged
+
+
+def _union_by_key(base: list[Any], override: list[Any], field: str) -> list[Any]:
+    merged: list[Any] = []
+    positions = _Seen()
+
+    for item in (*base, *override):
+        if not isinstance(item, (dict, Mapping)) or field not in item:
+            merged.append(item)
+            continue
+
+        position = positions.setdefault(item[field], len(merged))
+        if position == len(merged):
+            merged.append(item)
+        else:
+            merged[position] = _deep_merge(merged[position], item)
+
+    return merged
+
+
+def _merge_lists(
+    base: list[Any], override: list[Any], strategy: tuple[str, str]
+) -> list[Any]:
+    """Merge two lists.
+
+    Args:
+        base (list[Any]): earlier list
+        override (list[Any]): later list
+        strategy (tuple[str, str]): strategy name and field
+
+    Returns:
+        list[Any]: merged list
+    """
+    name, field = strategy
+    if name == "append":
+        return [*base, *override]
+    if name == "prepend":
+        return [*override, *base]
+    if name == "union":
+        return _union(base, override)
+    if name == "union_by_key":
+        return _union_by_key(base, override, field)
+    return override
+
+
+def _deep_merge(
+    base: dict[str, Any],
+    override: Mapping[str, Any],
+    strategies: MergeStrategies | _Node | None = None,
+) -> dict[str, Any]:
+    """Deep merge two dictionaries.
+
+    Values from `override` take precedence over `base`.
+    Nested dictionaries are merged recursively.
+
+    Args:
+        base (dict[str, Any]): Base dictionary.
+        override (Mapping[str, Any]): Dictionary with values to override.
+        strategies (MergeStrategies | None, optional): list merge strategies.
+            Defaults to None (replace lists).
+
+    Returns:
+        dict[str, Any]: Merged dictionary.
+    """
+    if isinstance(strategies, MergeStrategies):
+        strategies = strategies.root
+
+    result = dict(base)
+    for key, value in override.items():
+        node = strategies and (strategies.get(key) or strategies.get("*"))
+
+        if key in result:
+            current = result[key]
+            if isinstance(current, dict) and isinstance(value, Mapping):
+                result[key] = _deep_merge(current, value, node)
+                continue
+            if (
+                node
+                and None in node
+                and isinstance(current, list)
+                and isinstance(value, list)
+            ):
+                result[key] = _merge_lists(current, value, node[None])
+                continue
+
+        result[key] = value
+    return result
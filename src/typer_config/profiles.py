@@ -0,0 +1,156 @@
+"""Configuration Profiles.
+
+Keep overrides for several environments in one config file and select one
+with a `--profile` option or an environment variable:
+
+```yaml
+opt1: default
+opt2: default
+profiles:
+  prod:
+    opt1: production
+```
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from threading import Lock
+from typing import TYPE_CHECKING, Any
+
+from .cache import environ_dependencies, files_manifest
+from .loaders import _deep_merge
+from .streams import is_stream
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Sequence
+
+    from .__typing import ConfigDict, TyperParameterValue
+
+PROFILES_KEY = "profiles"
+"""Config key that holds the profile overrides."""
+
+PROFILE_META = "typer_config.profile"
+"""`ctx.meta` key of the selected profile (and its views)."""
+
+CONFIG_META = "typer_config.config"
+"""`ctx.meta` key of the loaded config (and the context that loaded it), for
+profiles selected after loading."""
+
+
+def apply_profile(
+    config: ConfigDict, profile: str | None, key: str = PROFILES_KEY
+) -> ConfigDict:
+    """Effective config of a profile.
+
+    The profile overrides are deep merged over the rest of the config.
+    Subtrees the profile doesn't override are shared with `config`, not copied.
+
+    Args:
+        config (ConfigDict): config with profile overrides under `key`
+        profile (str | None): profile name, None for the base config
+        key (str, optional): config key of the profiles. Defaults to PROFILES_KEY.
+
+    Raises:
+        ValueError: unknown profile, or profiles that aren't mappings
+
+    Returns:
+        ConfigDict: config without the profiles key and with the profile applied
+    """
+    base = {name: value for name, value in config.items() if name != key}
+
+    if not profile:
+        return base
+
+    profiles = config.get(key) or {}
+    if not isinstance(profiles, Mapping):
+        message = f"'{key}' must be a mapping of profile names to overrides."
+        raise ValueError(message)  # noqa: TRY004
+    if profile not in profiles:
+        message = f"Unknown profile '{profile}'."
+        raise ValueError(message)
+
+    overrides = profiles[profile]
+    if not isinstance(overrides, Mapping):
+        message = (
+            f"Profile '{profile}' must be a mapping of overrides,"
+            f" not {type(overrides).__name__}."
+        )
+        raise ValueError(message)  # noqa: TRY004
+
+    return _deep_merge(base, overrides)
+
+
+class ProfileViews:
+    """Cache of the effective config of each profile.
+
+    Views are computed once per loader and version of the config files
+    (checked with a `stat` of every file the config was loaded from, and the
+    environment variables that dotenv files expand) and reused by later
+    invocations in the same process. Configs that don't come from files
+    (e.g. streams) are not cached.
+    """
+
+    def __init__(self: ProfileViews, key: str = PROFILES_KEY) -> None:
+        """Create an empty cache.
+
+        Args:
+            key (str, optional): config key of the profiles.
+                Defaults to PROFILES_KEY.
+        """
+        self.key = key
+        # (source, file paths) -> (files manifest, profile -> view)
+        self._views: dict[
+            tuple[Any, tuple[str, ...]],
+            tuple[tuple[Any, ...], dict[str | None, ConfigDict]],
+        ]
+        self._views = {}
+        self._lock = Lock()
+
+    def __call__(
+        self: ProfileViews,
+        config: ConfigDict,
+        profile: str | None,
+        files: Sequence[TyperParameterValue] = (),
+        source: Any = None,  # noqa: ANN401
+    ) -> ConfigDict:
+        """Effective config of a profile.
+
+        Args:
+            config (ConfigDict): config loaded from `files`
+            profile (str | None): profile name
+            files (Sequence[TyperParameterValue], optional): candidate config
+                files the config was loaded from. Defaults to () (not cached).
+            source (Any, optional): hashable identity of what loaded the
+                config (e.g. the loader), so that different loaders or
+                sections of the same files have their own views.
+                Defaults to None.
+
+        Returns:
+            ConfigDict: effective config (see `apply_profile`)
+        """
+        files = [file_path for file_path in files if file_path]
+        manifest = () if any(map(is_stream, files)) else files_manifest(files)
+
+        # only paths: none of the files exist
+        if all(len(identity) <= 1 for identity in manifest):
+            return apply_profile(config, profile, self.key)
+
+        key = (source, tuple(identity[0] for identity in manifest))
+        manifest = (*manifest, tuple(environ_dependencies(files).items()))
+
+        with self._lock:
+            cached_manifest, views = self._views.get(key, ((), {}))
+            if cached_manifest == manifest and profile in views:
+                return views[profile]
+
+        view = apply_profile(config, profile, self.key)
+
+        with self._lock:
+            cached_manifest, views = self._views.get(key, ((), {}))
+            if cached_manifest != manifest:
+                views = {}
+                self._views[key] = (manifest, views)
+            views[profile] = view
+
+        return view
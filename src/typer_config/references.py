@@ -0,0 +1,123 @@
+"""Lazy Secret References.
+
+Config values can refer to secrets instead of containing them:
+
+```yaml
+db_password: {"$file": "/run/secrets/db"}
+api_token: {"$env": "API_TOKEN"}
+```
+
+References are put in the click default map as lazy placeholders (click
+calls callable defaults), so a secret is only read when click resolves the
+default of that parameter, i.e. not at all when the parameter is given on
+the command line or the command exits early. The value is read once per
+invocation.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING, Any
+
+from typer import BadParameter
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .__typing import ConfigDict
+
+FILE_REFERENCE = "$file"
+"""Key of a reference to a file, e.g. `{"$file": "/run/secrets/db"}`."""
+
+ENV_REFERENCE = "$env"
+"""Key of a reference to an environment variable, e.g. `{"$env": "TOKEN"}`."""
+
+_UNRESOLVED = object()
+
+
+class LazyReference:
+    """Placeholder of a referenced value that is read when it is called."""
+
+    __slots__ = ("_value", "kind", "target")
+
+    def __init__(self: LazyReference, kind: str, target: str) -> None:
+        """Create a placeholder.
+
+        Args:
+            kind (str): FILE_REFERENCE or ENV_REFERENCE
+            target (str): file path or environment variable name
+        """
+        self.kind = kind
+        self.target = target
+        self._value: Any = _UNRESOLVED
+
+    def __repr__(self: LazyReference) -> str:
+        """Representation that never contains the secret.
+
+        Returns:
+            str: representation
+        """
+        return f"{type(self).__name__}({{{self.kind!r}: {self.target!r}}})"
+
+    def _read(self: LazyReference) -> str:
+        if self.kind == ENV_REFERENCE:
+            if self.target not in os.environ:
+                message = f"Environment variable '{self.target}' is not set."
+                raise BadParameter(message)
+            return os.environ[self.target]
+
+        try:
+            with open(os.path.expanduser(self.target), encoding="utf-8") as _file:
+                # files written with `echo` end with a newline
+                return _file.read().rstrip("\r\n")
+        except OSError as ex:
+            message = f"Can't read '{self.target}': {ex.strerror}."
+            raise BadParameter(message) from ex
+
+    def __call__(self: LazyReference) -> str:
+        """Read the referenced value (once).
+
+        Raises:
+            BadParameter: the file can't be read or the variable isn't set
+
+        Returns:
+            str: referenced value
+        """
+        if self._value is _UNRESOLVED:
+            self._value = self._read()
+        return self._value
+
+
+def _as_reference(value: dict[str, Any]) -> LazyReference | None:
+    if len(value) != 1:
+        return None
+    ((kind, target),) = value.items()
+    if kind not in {FILE_REFERENCE, ENV_REFERENCE} or not isinstance(target, str):
+        return None
+    return LazyReference(kind, target)
+
+
+def bind_references(config: ConfigDict) -> ConfigDict:
+    """Replace references with lazy placeholders.
+
+    References are found at the top level and in subcommand sections (nested
+    dictionaries). Only dictionaries that contain references are copied.
+
+    Args:
+        config (ConfigDict): loaded config
+
+    Returns:
+        ConfigDict: config with placeholders (`config` itself if it has no
+            references)
+    """
+    bound: ConfigDict | None = None
+
+    for key, value in config.items():
+        if not isinstance(value, dict):
+            continue
+
+        replacement = _as_reference(value) or bind_references(value)
+        if replacement is not value:
+            if bound is None:
+                bound = dict(config)
+            bound[key] = replacement
+
+    return config if bound is None else bound
@@ -0,0 +1,240 @@
+"""Config Section Paths.
+
+A section path selects the part of a config a command uses. It is either a
+list of keys (`["tool", "my_tool"]`) or a path expression:
+
+| expression               | selects                                       |
+| ------------------------ | --------------------------------------------- |
+| `tool.my_tool`           | nested keys                                   |
+| `tool."my.tool"`         | a key that contains dots (also `["my.tool"]`) |
+| `tool.my_tool.stages[2]` | a list item (`[-1]` is the last one)          |
+| `tenants.*.limits`       | `limits` of every tenant, keyed by tenant     |
+| `stages[*].name`         | `name` of every list item, as a list          |
+
+Expressions are compiled once (and cached), and evaluating them only
+follows references into the config: nothing is copied, except for the
+containers that wildcards build. A path that doesn't exist selects an
+empty section.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable, Mapping
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Sequence
+
+_KEY, _INDEX, _WILDCARD = range(3)
+
+_TOKEN = re.compile(
+    r"""(?P<dot>\.)?(?:
+        \[(?P<index>-?\d+|\*)\]
+        |\[(?P<bracket>"[^"]*"|'[^']*')\]
+        |(?P<quoted>"[^"]*"|'[^']*')
+        |(?P<name>[^.\[\]"']+)
+    )""",
+    re.VERBOSE,
+)
+
+_MISSING = object()
+
+Steps = tuple[tuple[int, Any], ...]
+
+
+def _is_mapping(value: Any) -> bool:  # noqa: ANN401
+    # `dict` first: checks against the ABC are slow, and configs are dicts
+    return isinstance(value, (dict, Mapping))
+
+
+def _lookup(value: Any, steps: Steps) -> Any:  # noqa: ANN401
+    """Follow key and index steps.
+
+    Args:
+        value (Any): value to start from
+        steps (Steps): key and index steps
+
+    Returns:
+        Any: selected value or _MISSING
+    """
+    for kind, step in steps:
+        if kind == _KEY:
+            if not _is_mapping(value) or step not in value:
+                return _MISSING
+        elif not isinstance(value, list) or not -len(value) <= step < len(value):
+            return _MISSING
+        value = value[step]
+    return value
+
+
+def _selector(steps: Steps) -> Callable[[Any], Any]:
+    """Build the function that evaluates steps.
+
+    Args:
+        steps (Steps): steps
+
+    Returns:
+        Callable[[Any], Any]: selector returning the value or _MISSING
+    """
+    kinds = [kind for kind, _ in steps]
+    if _WILDCARD not in kinds:
+        return lambda value: _lookup(value, steps)
+
+    position = kinds.index(_WILDCARD)
+    before, after = steps[:position], steps[position + 1 :]
+    rest = _selector(after)
+    # the common `*.key` case is evaluated without a call per item
+    key = after[0][1] if len(after) == 1 and after[0][0] == _KEY else _MISSING
+
+    def _select(value: Any) -> Any:  # noqa: ANN401
+        value = _lookup(value, before)
+
+        if _is_mapping(value):
+            if key is not _MISSING:
+                return {
+                    name: item[key]
+                    for name, item in value.items()
+                    if _is_mapping(item) and key in item
+                }
+            return {
+                name: selected
+                for name, item in value.items()
+                if (selected := rest(item)) is not _MISSING
+            }
+
+        if isinstance(value, list):
+            if key is not _MISSING:
+                return [
+                    item[key] for item in value if _is_mapping(item) and key in item
+                ]
+            return [
+                selected for item in value if (selected := rest(item)) is not _MISSING
+            ]
+
+        return _MISSING
+
+    return _select
+
+
+class SectionPath:
+    """Compiled section path, see `compile_section`."""
+
+    __slots__ = ("_select", "expression", "steps")
+
+    def __init__(self: SectionPath, expression: str, steps: Steps) -> None:
+        """Create a section path.
+
+        Args:
+            expression (str): source of the path, for messages
+            steps (Steps): (kind, key or index) steps
+        """
+        self.expression = expression
+        self.steps = steps
+        self._select = _selector(steps)
+
+    def __repr__(self: SectionPath) -> str:
+        """Representation of the path.
+
+        Returns:
+            str: representation
+        """
+        return f"SectionPath({self.expression!r})"
+
+    def __str__(self: SectionPath) -> str:
+        """Source of the path.
+
+        Returns:
+            str: expression
+        """
+        return self.expression
+
+    @property
+    def head(self: SectionPath) -> list[str] | None:
+        """First key of the path (e.g. the INI section to parse).
+
+        Returns:
+            list[str] | None: first key or None if it isn't a plain key
+        """
+        if self.steps and self.steps[0][0] == _KEY:
+            return [self.steps[0][1]]
+        return None
+
+    def __call__(self: SectionPath, config: Any) -> Any:  # noqa: ANN401
+        """Select the section of a config.
+
+        Args:
+            config (Any): config
+
+        Returns:
+            Any: section (empty if the path doesn't exist)
+        """
+        section = self._select(config)
+        return {} if section is _MISSING else section
+
+
+def _parse(expression: str) -> Steps:
+    """Parse a path expression.
+
+    Args:
+        expression (str): path expression
+
+    Raises:
+        ValueError: invalid expression
+
+    Returns:
+        Steps: steps
+    """
+    steps: list[tuple[int, Any]] = []
+    position = 0
+
+    while position < len(expression):
+        match = _TOKEN.match(expression, position)
+        bracketed = match is not None and (
+            match["index"] is not None or match["bracket"] is not None
+        )
+        # keys are separated by dots, brackets follow directly
+        if match is None or (bool(match["dot"]) != (bool(steps) and not bracketed)):
+            message = f"Invalid section path '{expression}' at position {position}."
+            raise ValueError(message)
+
+        if match["index"] == "*" or match["name"] == "*":
+            steps.append((_WILDCARD, None))
+        elif match["index"] is not None:
+            steps.append((_INDEX, int(match["index"])))
+        elif match["name"] is not None:
+            steps.append((_KEY, match["name"]))
+        else:
+            steps.append((_KEY, (match["bracket"] or match["quoted"])[1:-1]))
+
+        position = match.end()
+
+    return tuple(steps)
+
+
+@lru_cache(maxsize=256)
+def _compile(expression: str) -> SectionPath:
+    return SectionPath(expression, _parse(expression))
+
+
+def compile_section(section: str | Sequence[Any] | SectionPath | None) -> SectionPath:
+    """Compile a section path.
+
+    Args:
+        section (str | Sequence[Any] | SectionPath | None): path expression,
+            list of keys (taken literally) or None for the whole config
+
+    Raises:
+        ValueError: invalid expression
+
+    Returns:
+        SectionPath: compiled path
+    """
+    if isinstance(section, SectionPath):
+        return section
+    if section is None:
+        return _compile("")
+    if isinstance(section, str):
+        return _compile(section)
+    return SectionPath(str(list(section)), tuple((_KEY, key) for key in section))
@@ -0,0 +1,250 @@
+"""Configs From Streams.
+
+A config can be piped in instead of written to a temporary file: `-` reads
+stdin and `/dev/fd/N` (e.g. from bash process substitution `<(...)`) reads
+an inherited file descriptor. The config is parsed straight from the pipe.
+
+Streams have no file extension, so loaders that dispatch on it (e.g.
+`multifile_loader`) take an explicit format or detect it from the first
+bytes of the stream with `sniff_format`.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import re
+import sys
+from threading import Lock
+from typing import IO, TYPE_CHECKING, Any
+
+from .binary import BINARY_MAGIC
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .__typing import TyperParameterValue
+
+STDIN = "-"
+"""Config path that reads stdin."""
+
+STREAM_FORMATS = ("json", "yaml", "toml", "ini", "env", "binary")
+"""Config formats of streams."""
+
+SNIFF_SIZE = 8 * 1024
+"""Maximum number of bytes `sniff_stream_format` looks at."""
+
+_FD_PATH = re.compile(r"/dev/stdin|/dev/fd/\d+|/proc/self/fd/\d+")
+_SECTION = re.compile(r"\[\[?[^\]=]+\]\]?")
+_ASSIGNMENT = re.compile(r"(export\s+)?([\w.\"'-]+)(\s*)=(\s*)(.*)")
+_ENV_KEY = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+_YAML_KEY = re.compile(r"(\"[^\"]*\"|'[^']*'|[^\s#:][^#:]*):(\s|$)")
+_TOML_VALUE = re.compile(
+    r"""["'\[{]|[+-]?(\d|inf\b|nan\b)|(true|false)\s*(#|$)""", re.IGNORECASE
+)
+
+# file descriptor streams that were opened to sniff their format
+_SNIFFED: dict[str, IO[bytes]] = {}
+_SNIFFED_LOCK = Lock()
+
+
+def is_stream(file_path: TyperParameterValue) -> bool:
+    """Check whether a config path is stdin or a file descriptor.
+
+    Args:
+        file_path (TyperParameterValue): config path
+
+    Returns:
+        bool: whether the config is read from a stream
+    """
+    if isinstance(file_path, os.PathLike):
+        file_path = os.fspath(file_path)
+    if not isinstance(file_path, str):
+        return False
+    return file_path == STDIN or _FD_PATH.fullmatch(file_path) is not None
+
+
+def stream_exists(file_path: TyperParameterValue) -> bool:
+    """Check whether a stream can be read.
+
+    Args:
+        file_path (TyperParameterValue): stream path
+
+    Returns:
+        bool: whether the stream exists (stdin always does)
+    """
+    file_path = os.fspath(file_path)
+    return file_path == STDIN or os.path.exists(file_path)
+
+
+class _Borrowed(io.RawIOBase):
+    """Stream wrapper that leaves the wrapped stream open (e.g. stdin)."""
+
+    def __init__(self: _Borrowed, stream: IO[bytes]) -> None:
+        self._stream = stream
+
+    def readable(self: _Borrowed) -> bool:
+        return True
+
+    def readinto(self: _Borrowed, buffer: Any) -> int:  # noqa: ANN401
+        # `read1` returns what is available instead of waiting for more
+        data = getattr(self._stream, "read1", self._stream.read)(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+
+def _stdin() -> IO[bytes]:
+    return sys.stdin.buffer
+
+
+def _peek(stream: IO[bytes], size: int) -> bytes:
+    """Read the first bytes of a stream without consuming them.
+
+    Args:
+        stream (IO[bytes]): binary stream
+        size (int): maximum number of bytes
+
+    Returns:
+        bytes: first (buffered) bytes of the stream
+    """
+    if hasattr(stream, "peek"):
+        return stream.peek(size)[:size]
+
+    position = stream.tell()
+    head = stream.read(size)
+    stream.seek(position)
+    return head
+
+
+def open_stream(
+    file_path: TyperParameterValue, mode: str = "r", encoding: str | None = None
+) -> IO[Any]:
+    """Open stdin or a file descriptor for reading.
+
+    Args:
+        file_path (TyperParameterValue): stream path
+        mode (str, optional): "r" or "rb". Defaults to "r".
+        encoding (str | None, optional): text encoding. Defaults to None.
+
+    Raises:
+        ValueError: not a read mode
+
+    Returns:
+        IO[Any]: file object (closing it leaves stdin open)
+    """
+    if mode not in {"r", "rb"}:
+        message = f"Config streams are read-only (mode '{mode}')."
+        raise ValueError(message)
+
+    file_path = os.fspath(file_path)
+    if file_path == STDIN:
+        stream: IO[bytes] = io.BufferedReader(_Borrowed(_stdin()))
+    else:
+        with _SNIFFED_LOCK:
+            sniffed = _SNIFFED.pop(file_path, None)
+        stream = sniffed or open(file_path, "rb")  # noqa: SIM115
+
+    if mode == "rb":
+        return stream
+    return io.TextIOWrapper(stream, encoding=encoding)
+
+
+def sniff_format(head: bytes) -> str | None:  # noqa: PLR0911
+    """Guess the format of a config from its first bytes.
+
+    Args:
+        head (bytes): start of the config
+
+    Returns:
+        str | None: one of STREAM_FORMATS or None if it is unclear
+    """
+    if head.startswith(BINARY_MAGIC):
+        return "binary"
+
+    lines = [
+        line.strip()
+        for line in head.decode("utf-8", errors="ignore").lstrip("\ufeff").splitlines()
+    ]
+    lines = [line for line in lines if line and not line.startswith(("#", ";"))]
+    if not lines:
+        return None
+
+    first = lines[0]
+    if first.startswith(("---", "%YAML")):
+        return "yaml"
+    if first.startswith("{"):
+        return "json"
+
+    if _SECTION.fullmatch(first):
+        # TOML and INI share section headers, but only TOML quotes strings
+        values = [
+            match.group(5)
+            for match in map(_ASSIGNMENT.fullmatch, lines[1:])
+            if match is not None
+        ]
+        if all(_TOML_VALUE.match(value) for value in values):
+            return "toml"
+        return "ini"
+
+    assignment = _ASSIGNMENT.fullmatch(first)
+    if assignment is not None:
+        export, key, before, after, value = assignment.groups()
+        if export or (_ENV_KEY.fullmatch(key) and not before and not after):
+            return "env"
+        if _TOML_VALUE.match(value):
+            return "toml"
+
+    if _YAML_KEY.match(first):
+        return "yaml"
+
+    return None
+
+
+def _discard_sniffed(file_path: str) -> None:
+    """Close a stream opened for sniffing that won't be loaded.
+
+    Args:
+        file_path (str): stream path
+    """
+    with _SNIFFED_LOCK:
+        stream = _SNIFFED.pop(file_path, None)
+    if stream is not None:
+        stream.close()
+
+
+def sniff_stream_format(file_path: TyperParameterValue) -> str:
+    """Guess the format of a stream without consuming it.
+
+    Only the bytes that are already available (at most SNIFF_SIZE) are
+    looked at, and they are still read by the loader afterwards.
+
+    Args:
+        file_path (TyperParameterValue): stream path
+
+    Raises:
+        ValueError: the format can't be detected
+
+    Returns:
+        str: one of STREAM_FORMATS
+    """
+    file_path = os.fspath(file_path)
+    if file_path == STDIN:
+        stream = _stdin()
+    else:
+        with _SNIFFED_LOCK:
+            stream = _SNIFFED.get(file_path)
+            if stream is None:
+                stream = _SNIFFED[file_path] = open(file_path, "rb")  # noqa: SIM115
+
+    try:
+        fmt = sniff_format(_peek(stream, SNIFF_SIZE))
+    except BaseException:
+        _discard_sniffed(file_path)
+        raise
+
+    if fmt is None:
+        # the stream won't be loaded, so nothing would close it
+        _discard_sniffed(file_path)
+        message = (
+            f"Can't detect the config format of '{file_path}', pass it explicitly."
+        )
+        raise ValueError(message)
+    return fmt
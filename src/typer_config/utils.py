@@ -2,50 +2,168 @@
 
 from __future__ import annotations
 
+import sys
 import warnings
+from collections.abc import Callable, Iterator, Mapping, Sequence
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 from warnings import showwarning
 
+from .archives import config_exists
+from .sections import compile_section
+
 if TYPE_CHECKING:  # pragma: no cover
     from types import TracebackType
 
+    from .__typing import TyperParameterValue
+
 ORIGINAL_WARNING_FORMATTER = warnings.formatwarning
 
 
+RESPONSE_FILE_PREFIX = "@"
+"""Prefix of a list value that points to a file with one item per line."""
+
+RESPONSE_FILE_KEY = "from_file"
+"""Key of a mapping list value that points to a file with one item per line."""
+
+_READ_HINT = 1 << 16
+
+
+class FileLines(Sequence[str]):
+    """Lines of a text file, read lazily.
+
+    Iterating streams the file in bulk reads without keeping it in memory.
+    Indexing or `len()` reads the file once and keeps the lines.
+    Blank lines are skipped and line endings are stripped.
+    """
+
+    def __init__(self: FileLines, file_path: Path | str) -> None:
+        self.file_path = Path(file_path)
+        self._lines: list[str] | None = None
+
+    def __iter__(self: FileLines) -> Iterator[str]:  # noqa: D105
+        if self._lines is not None:
+            yield from self._lines
+            return
+
+        with open(self.file_path, encoding="utf-8") as _file:
+            # readlines(hint) reads big chunks at a time
+            for chunk in iter(lambda: _file.readlines(_READ_HINT), []):
+                for line in chunk:
+                    item = line.rstrip("\r\n")
+                    if item:
+                        yield item
+
+    def _materialize(self: FileLines) -> list[str]:
+        if self._lines is None:
+            self._lines = list(iter(self))
+        return self._lines
+
+    def __len__(self: FileLines) -> int:  # noqa: D105
+        return len(self._materialize())
+
+    def __getitem__(self: FileLines, index: Any) -> Any:  # noqa: ANN401, D105
+        return self._materialize()[index]
+
+    def __eq__(self: FileLines, other: object) -> bool:  # noqa: D105
+        if isinstance(other, FileLines):
+            return self.file_path == other.file_path
+        if isinstance(other, Sequence):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self: FileLines) -> str:  # noqa: D105
+        return f"{type(self).__name__}({str(self.file_path)!r})"
+
+
+def response_file(value: Any) -> Any:  # noqa: ANN401
+    """Expand a list value that points to a file with one item per line.
+
+    Both `"@inputs.txt"` and `{"from_file": "inputs.txt"}` become
+    `FileLines("inputs.txt")`. Other values are returned unchanged.
+
+    Args:
+        value (Any): config value
+
+    Returns:
+        Any: lazy file lines or the original value
+    """
+    if isinstance(value, str) and value.startswith(RESPONSE_FILE_PREFIX):
+        return FileLines(value[len(RESPONSE_FILE_PREFIX) :])
+    if isinstance(value, Mapping) and set(value) == {RESPONSE_FILE_KEY}:
+        return FileLines(value[RESPONSE_FILE_KEY])
+    return value
+
+
 def get_dict_section(
-    _dict: dict[Any, Any], keys: list[Any] | None = None
+    _dict: dict[Any, Any], keys: str | list[Any] | None = None
 ) -> dict[Any, Any]:
     """Get section of a dictionary.
 
     Args:
         _dict (dict[str, Any]): dictionary to access
-        keys (list[str]): list of keys to successively access in the dictionary
+        keys (str | list[str]): list of keys to successively access in the
+            dictionary, or a section path expression (see `typer_config.sections`)
 
     Returns:
         dict[str, Any]: section of dictionary requested
     """
-    if keys is not None:
-        for key in keys:
-            _dict = _dict.get(key, {})
+    return compile_section(keys)(_dict)
 
-    return _dict
 
+class _SimpleWarningFile:
+    """Warning "file" that writes `Category: message` lines to stderr."""
 
-class SimpleWarningFormat:
-    """Simple Warning Formatter."""
+    def __init__(
+        self: _SimpleWarningFile, message: Warning | str, category: type[Warning]
+    ) -> None:
+        self.message = message
+        self.category = category
+
+    def write(self: _SimpleWarningFile, _text: str) -> None:
+        """Write the warning in the simple format (instead of `_text`).
+
+        Args:
+            _text (str): warning formatted by `warnings.formatwarning`
+        """
+        sys.stderr.write(f"{self.category.__name__}: {self.message}\n")
 
-    def __enter__(self: SimpleWarningFormat) -> None:  # noqa: D105
-        def _fmt(
-            message: Warning | str,
-            category: type[Warning],
-            filename: str,  # noqa: ARG001
-            lineno: int,  # noqa: ARG001
-            line: str | None = None,  # noqa: ARG001
-        ) -> str:
-            return f"{category.__name__}: {message}\n"
 
-        warnings.formatwarning = _fmt  # type: ignore
+def show_simple_warning(
+    message: Warning | str, category: type[Warning] = UserWarning
+) -> None:
+    """Show a warning as `Category: message`, without a source location.
+
+    The warning still goes through `warnings.showwarning` (so it can be
+    recorded or logged), but `warnings.formatwarning` is neither used nor
+    modified, which makes this safe to use from concurrent threads.
+
+    Args:
+        message (Warning | str): warning message
+        category (type[Warning], optional): warning category.
+            Defaults to UserWarning.
+    """
+    showwarning(message, category, "", 0, file=_SimpleWarningFile(message, category))
+
+
+class SimpleWarningFormat:
+    """Simple Warning Formatter.
+
+    Note:
+        `warnings.formatwarning` is left untouched. The context yields
+        `show_simple_warning`, which should be used to show the warnings:
+        ```py
+        with SimpleWarningFormat() as show:
+            show("No such file", UserWarning)
+        ```
+    """
+
+    def __enter__(  # noqa: D105
+        self: SimpleWarningFormat,
+    ) -> Callable[[Warning | str, type[Warning]], None]:
+        return show_simple_warning
 
     def __exit__(  # noqa: D105
         self: SimpleWarningFormat,
@@ -53,25 +171,24 @@ class SimpleWarningFormat:
         exc_value: BaseException | None,
         exc_tb: TracebackType | None,
     ) -> None:
-        warnings.formatwarning = ORIGINAL_WARNING_FORMATTER
+        pass
 
 
-def file_exists_and_warn(file_path: Path | str) -> bool:
+def file_exists_and_warn(file_path: TyperParameterValue) -> bool:
     """Check if file exists and warn if it doesn't exist.
 
     Args:
-        file_path (Path | str): file path to check
+        file_path (TyperParameterValue): file path (or traversable) to check
 
     Returns:
         bool: whether file exists
     """
 
-    file_path_exists = Path(file_path).is_file()
+    file_path_exists = config_exists(file_path)
 
     if not file_path_exists:
         msg = f"No such file: '{file_path}'"
 
-        with SimpleWarningFormat():
-            showwarning(msg, UserWarning, "", 0)
+        show_simple_warning(msg, UserWarning)
 
     return file_path_exists
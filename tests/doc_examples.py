@@ -281,6 +281,7 @@ register_executor("yml", exec_file_fence)
 register_executor("toml", exec_file_fence)
 register_executor("dotenv", exec_file_fence)
 register_executor("ini", exec_file_fence)
+register_executor("text", exec_file_fence)
 
 
 def exec_python_fence(fence: Fence, globals_: dict | None = None):
@@ -0,0 +1,143 @@
+"""Tests for configs inside zip archives."""
+
+import gzip
+import os
+import zipfile
+from pathlib import Path
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from typer_config import archives
+from typer_config.cache import file_identity
+from typer_config.decorators import use_fallback_config
+from typer_config.loaders import (
+    _get_loader_for_file,
+    multifile_fallback_loader,
+    multifile_loader,
+)
+
+HERE = Path(__file__).parent.absolute()
+
+RUNNER = CliRunner()
+
+NAMES = ["config.json", "config.yml", "config.toml", "config.ini", "config.env"]
+
+
+@pytest.fixture
+def archive(tmp_path: Path) -> Path:
+    """Zip archive with the test configs under `defaults/`."""
+    path = tmp_path / "app.pyz"
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zip_file:
+        for name in NAMES:
+            zip_file.write(HERE / name, f"defaults/{name}")
+        zip_file.writestr("defaults/override.json.gz", gzip.compress(b'{"arg1": "z"}'))
+    return path
+
+
+@pytest.mark.parametrize("name", NAMES)
+def test_archive_path(archive: Path, name: str):
+    """Configs load from `zip://archive!/member` like from the filesystem."""
+    path = f"zip://{archive}!/defaults/{name}"
+
+    loader = _get_loader_for_file(path)
+    assert loader(path) == loader(HERE / name)
+
+
+@pytest.mark.parametrize("name", NAMES)
+def test_traversable(archive: Path, name: str):
+    """Configs load from `importlib.resources`-style traversables."""
+    resource = zipfile.Path(archive) / "defaults" / name
+
+    loader = _get_loader_for_file(resource)
+    assert loader(resource) == loader(HERE / name)
+
+
+def test_compressed_member(archive: Path):
+    """Compressed files inside archives are decompressed."""
+    path = f"zip://{archive}!/defaults/override.json.gz"
+
+    assert _get_loader_for_file(path)(path) == {"arg1": "z"}
+
+
+def test_multifile(archive: Path, tmp_path: Path):
+    """Archived files, traversables and plain files can be stacked."""
+    local = tmp_path / "local.json"
+    local.write_text('{"opt1": "local"}')
+
+    config = multifile_loader(
+        [
+            f"zip://{archive}!/defaults/config.yml",
+            f"zip://{archive}!/defaults/missing.yml",
+            zipfile.Path(archive) / "defaults" / "override.json.gz",
+            str(local),
+        ],
+        process_pool_threshold=0,
+    )
+
+    assert config["arg1"] == "z"
+    assert config["opt1"] == "local"
+    assert config["opt2"] == "nothing"
+
+
+def test_fallback(archive: Path, tmp_path: Path):
+    """The packaged defaults are used when no local file exists."""
+    files = [
+        str(tmp_path / "missing.yml"),
+        zipfile.Path(archive) / "defaults" / "missing.yml",
+        f"zip://{archive}!/defaults/config.json",
+    ]
+
+    assert multifile_fallback_loader(files) == multifile_loader([HERE / "config.json"])
+
+    app = typer.Typer()
+
+    @app.command()
+    @use_fallback_config(files)
+    def main(opt1: str = "default"):
+        typer.echo(opt1)
+
+    result = RUNNER.invoke(app)
+    assert result.exit_code == 0, result.output
+    assert result.stdout.strip() == "things"
+
+
+def test_missing(archive: Path, tmp_path: Path):
+    """Missing members and archives are reported as missing files."""
+    member = f"zip://{archive}!/defaults/missing.yml"
+    no_archive = f"zip://{tmp_path / 'missing.pyz'}!/config.yml"
+
+    assert not archives.config_exists(member)
+    assert not archives.config_exists(no_archive)
+    assert multifile_loader([member, no_archive]) == {}
+
+    with pytest.raises(FileNotFoundError):
+        archives.open_archived(member)
+
+    with pytest.raises(ValueError, match="Expected"):
+        archives.split_archive_path(f"zip://{archive}")
+
+    with pytest.raises(ValueError, match="read-only"):
+        archives.open_archived(f"zip://{archive}!/defaults/config.yml", "w")
+
+
+def test_index_reuse(archive: Path):
+    """The archive index is built once and rebuilt when the archive changes."""
+    path = f"zip://{archive}!/defaults/config.json"
+    identity = file_identity(path)
+    assert identity[0] == path
+    assert len(identity) > 1
+
+    zip_file, _ = archives._open_archive(str(archive))
+    assert archives.config_exists(path)
+    assert archives._open_archive(str(archive))[0] is zip_file
+
+    with zipfile.ZipFile(archive, "a") as updated:
+        updated.writestr("defaults/new.json", '{"opt1": "new"}')
+    stat = archive.stat()
+    os.utime(archive, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert file_identity(path) != identity
+    assert archives._open_archive(str(archive))[0] is not zip_file
+    assert multifile_loader([f"zip://{archive}!/defaults/new.json"]) == {"opt1": "new"}
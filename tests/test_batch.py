@@ -0,0 +1,129 @@
+"""Tests for typer_config.batch."""
+
+import io
+import json
+from pathlib import Path
+
+import pytest
+import typer
+
+from typer_config.batch import OverridesError, read_overrides, run_batch
+from typer_config.decorators import use_json_config
+
+app = typer.Typer()
+
+
+@app.command()
+@use_json_config()
+def main(
+    name: str,
+    count: int = typer.Option(1),
+    greeting: str = typer.Option("Hello"),
+):
+    """Command run in batches."""
+    if count < 0:
+        message = "negative count"
+        raise typer.BadParameter(message)
+    return f"{greeting}, {name}" * count
+
+
+ROWS = [{"name": "a"}, {"name": "b", "count": 2}, {"count": -1}, {"count": "x"}]
+
+
+def test_read_overrides(tmp_path: Path):
+    """Overrides are read from JSONL and CSV."""
+    jsonl = tmp_path / "rows.jsonl"
+    jsonl.write_text('{"name": "a"}\n\n{"nested": {"x": 1}}\n')
+    assert list(read_overrides(jsonl)) == [{"name": "a"}, {"nested": {"x": 1}}]
+
+    stream = io.StringIO("name,count\na,\nb,2\n")
+    assert list(read_overrides(stream, "csv")) == [
+        {"name": "a"},
+        {"name": "b", "count": "2"},
+    ]
+
+    rows = list(read_overrides(io.StringIO('[1]\n{"name": \n{"name": "a"}\n'), "jsonl"))
+    assert isinstance(rows[0], OverridesError)
+    assert "Line 1 is not a JSON object" in str(rows[0])
+    assert isinstance(rows[1], OverridesError)
+    assert str(rows[1]).startswith("Line 2:")
+    assert rows[2] == {"name": "a"}
+
+    with pytest.raises(ValueError, match="Unknown overrides format"):
+        list(read_overrides(tmp_path / "rows.txt"))
+
+
+@pytest.mark.parametrize("processes", [False, True], ids=["threads", "processes"])
+def test_run_batch(processes):
+    """Every row is layered over the base and failures are reported."""
+    results = sorted(
+        run_batch(
+            "tests.test_batch:app" if processes else app,
+            ROWS,
+            base={"name": "base", "greeting": "Hi"},
+            workers=2,
+            processes=processes,
+            max_in_flight=2,
+        )
+    )
+
+    assert [result.index for result in results] == [0, 1, 2, 3]
+    assert [result.value for result in results[:2]] == ["Hi, a", "Hi, bHi, b"]
+    assert results[2].error is not None
+    assert "negative count" in str(results[2].error)
+    assert results[3].error is not None
+
+
+@pytest.mark.parametrize("max_in_flight", [1, 4])
+def test_bad_rows(max_in_flight):
+    """Rows that can't be read or merged fail without stopping the batch."""
+    stream = io.StringIO('{"name": "a"}\nnot json\n[1]\n\n{"name": "b"}\n')
+    rows = [*read_overrides(stream, "jsonl"), 5, {"name": "c"}]
+    results = sorted(
+        run_batch(app, rows, workers=1, max_in_flight=max_in_flight),
+        key=lambda result: result.index,
+    )
+
+    assert [result.index for result in results] == [0, 1, 2, 3, 4, 5]
+    assert [result.value for result in results] == [
+        "Hello, a",
+        None,
+        None,
+        "Hello, b",
+        None,
+        "Hello, c",
+    ]
+    assert isinstance(results[1].error, OverridesError)
+    assert isinstance(results[2].error, OverridesError)
+    assert results[4].overrides is rows[4]
+    assert results[4].error is not None
+
+
+def test_deep_merged_and_config_option(tmp_path: Path):
+    """Rows are deep merged and config options still work."""
+    conf = tmp_path / "config.json"
+    conf.write_text(json.dumps({"greeting": "Hey"}))
+
+    group = typer.Typer()
+    group.command()(main)
+
+    @group.callback()
+    def callback():
+        pass
+
+    results = list(
+        run_batch(
+            group,
+            [{"main": {"name": "a"}}],
+            base={"main": {"name": "base", "count": 2}},
+            args=["main", "--config", str(conf)],
+        )
+    )
+    assert results[0].error is None, results[0].error
+    assert results[0].value == "Hey, aHey, a"
+
+
+def test_processes_need_import_path():
+    """Process pools need an importable app."""
+    with pytest.raises(TypeError):
+        list(run_batch(app, ROWS, processes=True))
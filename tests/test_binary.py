@@ -0,0 +1,126 @@
+"""Tests for the binary config format."""
+
+import hashlib
+import random
+import struct
+from pathlib import Path
+
+import pytest
+
+from typer_config.binary import (
+    BINARY_FORMAT,
+    BINARY_MAGIC,
+    BinaryConfigError,
+    decode_config,
+    encode_config,
+)
+from typer_config.dumpers import binary_dumper
+from typer_config.loaders import _get_loader_for_file, binary_loader, json_loader
+
+HERE = Path(__file__).parent.absolute()
+
+CONFIG = {
+    "str": "é ü 中",
+    "int": 2**70,
+    "negative": -(2**70),
+    "float": 1.5,
+    "bool": True,
+    "none": None,
+    "list": [1, "a", [False], {"nested": {}}],
+    "numbers": [0, -1, 2**63 - 1, -(2**63), 0.5, float("inf")],
+    "shared": [{"a": 1, "b": [2]}, {"a": 3, "b": []}, [], [[]]],
+    "": "",
+}
+
+
+def test_roundtrip(tmp_path: Path):
+    """Configs survive a dump and load unchanged."""
+    path = tmp_path / "config.tcfg"
+    binary_dumper(CONFIG, path)
+
+    loaded = binary_loader(path)
+    assert loaded == CONFIG
+    assert loaded["bool"] is True
+    assert _get_loader_for_file(str(path)) is binary_loader
+
+
+def test_repo_config(tmp_path: Path):
+    """The example JSON config converts losslessly."""
+    config = json_loader(HERE / "config.json")
+    binary_dumper(config, tmp_path / "config.tcfg")
+    assert binary_loader(tmp_path / "config.tcfg") == config
+
+
+@pytest.mark.parametrize(
+    "config",
+    [{"a": (1, 2)}, {"a": {1: "int key"}}, {"a": b"bytes"}, {"a": {"b": {1, 2}}}],
+)
+def test_only_plain_data(config):
+    """Only plain data can be dumped."""
+    with pytest.raises(BinaryConfigError, match=r"Unsupported|Keys"):
+        encode_config(config)
+
+
+@pytest.mark.parametrize(
+    ("mangle", "match"),
+    [
+        (lambda _: b"{}", "Not a binary config"),
+        (lambda data: b"XXXX" + data[4:], "Not a binary config"),
+        (lambda data: BINARY_MAGIC + b"\x09" + data[5:], "version"),
+        (lambda data: data[:-1], "checksum"),
+        (lambda data: data[:-1] + bytes([data[-1] ^ 1]), "checksum"),
+    ],
+    ids=["json", "magic", "version", "truncated", "corrupted"],
+)
+def test_rejects_invalid_files(mangle, match):
+    """Foreign, unsupported, truncated and corrupted files are rejected."""
+    with pytest.raises(BinaryConfigError, match=match):
+        decode_config(mangle(encode_config(CONFIG)))
+
+
+@pytest.mark.parametrize("text", ["nul \0 inside", "\udcff surrogate"])
+def test_unusual_strings(text: str):
+    """Strings with NUL characters and surrogates survive."""
+    config = {"a": text, text: [text, "b"]}
+    assert decode_config(encode_config(config)) == config
+
+
+def _sign(payload: bytes) -> bytes:
+    """A binary config with a valid checksum for any payload."""
+    return (
+        BINARY_MAGIC
+        + bytes([BINARY_FORMAT])
+        + hashlib.sha256(payload).digest()
+        + payload
+    )
+
+
+def _is_plain(value) -> bool:
+    if type(value) is dict:
+        return all(type(key) is str and _is_plain(val) for key, val in value.items())
+    if type(value) is list:
+        return all(map(_is_plain, value))
+    return type(value) in {str, int, float, bool, type(None)}
+
+
+def test_crafted_payloads():
+    """Crafted files with valid checksums only ever decode to plain data."""
+    payload = bytearray(encode_config(CONFIG)[len(_sign(b"")) :])
+    rng = random.Random(0)
+
+    for _ in range(2000):
+        crafted = bytearray(payload)
+        for _ in range(rng.randint(1, 4)):
+            crafted[rng.randrange(len(crafted))] = rng.randrange(256)
+        try:
+            config = decode_config(_sign(bytes(crafted)))
+        except BinaryConfigError:
+            continue
+        assert type(config) is dict
+        assert _is_plain(config)
+
+
+def test_malformed_sections():
+    """Section sizes that don't add up are rejected."""
+    with pytest.raises(BinaryConfigError, match="Malformed"):
+        decode_config(_sign(struct.pack("<10Q", *[1] * 10)))
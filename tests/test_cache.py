@@ -0,0 +1,288 @@
+"""Tests for typer_config.cache."""
+
+import datetime as dt
+import json
+import os
+from enum import Enum
+from pathlib import Path
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from typer_config.cache import (
+    RESULT_SUFFIX,
+    ResultStore,
+    files_manifest,
+    fingerprint,
+    snapshot_loader,
+)
+from typer_config.decorators import (
+    memoize_result,
+    use_fallback_config,
+    use_json_config,
+    use_multifile_config,
+)
+from typer_config.loaders import multifile_loader
+
+RUNNER = CliRunner()
+
+
+def counting(loader):
+    """Wrap a loader and count its calls."""
+
+    def _loader(files):
+        _loader.calls += 1
+        return loader(files)
+
+    _loader.calls = 0
+    return _loader
+
+
+def bump(path: Path, text: str):
+    """Rewrite a file and make sure its mtime changes."""
+    stat = path.stat()
+    path.write_text(text)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestSnapshotLoader:
+    """Tests for snapshot_loader."""
+
+    def test_hit(self, tmp_path: Path):
+        """A second load with unchanged files is served from the snapshot."""
+        (tmp_path / "a.yml").write_text("opt1: a\n")
+        files = [str(tmp_path / "a.yml"), str(tmp_path / "b.yml")]
+        loader = counting(multifile_loader)
+        cached = snapshot_loader(loader, tmp_path / "cache")
+
+        assert cached(files) == {"opt1": "a"}
+        assert cached(files) == {"opt1": "a"}
+        assert loader.calls == 1
+
+    def test_changed_file(self, tmp_path: Path):
+        """Changing a file invalidates the snapshot."""
+        conf = tmp_path / "a.yml"
+        conf.write_text("opt1: a\n")
+        cached = snapshot_loader(multifile_loader, tmp_path / "cache")
+
+        assert cached([str(conf)]) == {"opt1": "a"}
+        bump(conf, "opt1: b\n")
+        assert cached([str(conf)]) == {"opt1": "b"}
+
+    def test_missing_file_appears(self, tmp_path: Path):
+        """A previously missing candidate that appears invalidates the snapshot."""
+        (tmp_path / "a.yml").write_text("opt1: a\n")
+        files = [str(tmp_path / "a.yml"), str(tmp_path / "b.yml")]
+        cached = snapshot_loader(multifile_loader, tmp_path / "cache")
+
+        assert cached(files) == {"opt1": "a"}
+        (tmp_path / "b.yml").write_text("opt1: b\n")
+        assert cached(files) == {"opt1": "b"}
+
+    def test_namespaces(self, tmp_path: Path):
+        """Different namespaces over the same files don't collide."""
+        (tmp_path / "a.yml").write_text("opt1: a\n")
+        files = [str(tmp_path / "a.yml")]
+        first = snapshot_loader(lambda _: {"x": 1}, tmp_path / "cache", "first")
+        second = snapshot_loader(lambda _: {"x": 2}, tmp_path / "cache", "second")
+
+        assert first(files) == {"x": 1}
+        assert second(files) == {"x": 2}
+
+    def test_unmarshalable(self, tmp_path: Path):
+        """Configs with non-plain data are not cached."""
+        date = dt.date(2020, 1, 1)
+        loader = counting(lambda _: {"date": date})
+        cached = snapshot_loader(loader, tmp_path / "cache")
+
+        assert cached([]) == {"date": date}
+        assert cached([]) == {"date": date}
+        assert loader.calls == 2  # noqa: PLR2004
+
+    def test_dotenv_environment(self, tmp_path: Path, monkeypatch):
+        """Changing a variable a dotenv file expands invalidates the snapshot."""
+        conf = tmp_path / "a.env"
+        conf.write_text("OPT1=${TYPER_CONFIG_TEST_NAME:-none}\n")
+        loader = counting(multifile_loader)
+        cached = snapshot_loader(loader, tmp_path / "cache")
+
+        monkeypatch.delenv("TYPER_CONFIG_TEST_NAME", raising=False)
+        assert cached([str(conf)]) == {"OPT1": "none"}
+        monkeypatch.setenv("TYPER_CONFIG_TEST_NAME", "a")
+        assert cached([str(conf)]) == {"OPT1": "a"}
+        assert cached([str(conf)]) == {"OPT1": "a"}
+        monkeypatch.setenv("TYPER_CONFIG_TEST_NAME", "b")
+        assert cached([str(conf)]) == {"OPT1": "b"}
+        assert loader.calls == 3  # noqa: PLR2004
+
+    def test_corrupt_snapshot(self, tmp_path: Path):
+        """Corrupt snapshot files are ignored."""
+        cached = snapshot_loader(lambda _: {"x": 1}, tmp_path / "cache")
+        cached([])
+        for snapshot in (tmp_path / "cache").iterdir():
+            snapshot.write_bytes(b"garbage")
+        assert cached([]) == {"x": 1}
+
+
+def test_manifest_records_missing(tmp_path: Path):
+    """Missing files are part of the manifest."""
+    manifest = files_manifest([str(tmp_path / "missing.yml"), ""])
+    assert manifest == ((str(tmp_path / "missing.yml"),),)
+
+
+def test_decorators(tmp_path: Path):
+    """The multifile decorators accept a cache directory."""
+    conf = tmp_path / "config.yml"
+    conf.write_text("opt1: things\nsection:\n  opt1: nested\n")
+
+    for decorator, kwargs in [
+        (use_multifile_config, {"default_files": [str(conf)]}),
+        (use_fallback_config, {"fallback_files": [str(conf)]}),
+    ]:
+        for section, expected in [(None, "things"), (["section"], "nested")]:
+            app = typer.Typer()
+
+            @app.command()
+            @decorator(**kwargs, section=section, cache_dir=tmp_path / "cache")
+            def main(opt1: str = typer.Option("default")):
+                typer.echo(opt1)
+
+            for _ in range(2):
+                result = RUNNER.invoke(app, [])
+                assert result.exit_code == 0, result.stdout
+                assert result.stdout.strip() == expected
+
+
+class Color(Enum):
+    """Dummy Enum."""
+
+    red = "red"
+    blue = "blue"
+
+
+class TestResultMemoization:
+    """Tests for fingerprints, ResultStore and memoize_result."""
+
+    def test_fingerprint(self, tmp_path: Path):
+        """Fingerprints are canonical and can include file contents."""
+        path = tmp_path / "input.txt"
+        path.write_text("a")
+
+        params = {"color": Color.red, "n": 1, "path": path, "tags": ("x", "y")}
+        same = {"tags": ["x", "y"], "path": path, "n": 1, "color": "red"}
+        assert fingerprint(params) == fingerprint(same)
+        assert fingerprint(params) != fingerprint({**params, "n": True})
+        assert fingerprint(params) != fingerprint(params, "other command")
+
+        hashed = fingerprint(params, hash_files=True)
+        assert fingerprint(params, hash_files=True) == hashed
+        path.write_text("b")
+        assert fingerprint(params, hash_files=True) != hashed
+
+    def test_store(self, tmp_path: Path):
+        """Results are stored and the least recently used ones evicted."""
+        store = ResultStore(tmp_path, max_bytes=250)
+
+        assert store.get("aa00") == (False, None)
+        store.put("aa00", None)
+        assert store.get("aa00") == (True, None)
+
+        store.put("aa01", lambda: None)  # can't be pickled
+        assert store.get("aa01") == (False, None)
+
+        for i in range(10):
+            store.put(f"bb{i:02}", "x" * 50)
+            os.utime(store._path(f"bb{i:02}"), ns=(i, i))
+
+        sizes = [path.stat().st_size for path in tmp_path.glob("*/*")]
+        assert sum(sizes) <= 250  # noqa: PLR2004
+        assert store.get("bb09")[0]
+        assert not store.get("bb00")[0]
+
+    @pytest.mark.parametrize(
+        ("data", "removed"),
+        [
+            (b"garbage", True),
+            (b"", True),
+            (b"\x80\x05\x95", True),
+            (b"cno_such_module_xyz\nThing\n.", False),
+            (b"cos\nno_such_attr\n.", False),
+        ],
+    )
+    def test_broken_results(self, tmp_path: Path, data: bytes, removed):
+        """Results that can't be loaded are misses; corrupt ones are removed."""
+        store = ResultStore(tmp_path)
+        store.put("aa00", 1)
+        store._path("aa00").write_bytes(data)
+
+        assert store.get("aa00") == (False, None)
+        assert store._path("aa00").exists() is not removed
+
+    def test_leftover_temporary_files(self, tmp_path: Path):
+        """Temporary files left behind by a crash are counted and evicted."""
+        store = ResultStore(tmp_path, max_bytes=1000)
+        store.put("aa00", "x")
+        leftover = store._path("aa00").with_name(f"aa00.tmp1234{RESULT_SUFFIX}")
+        leftover.write_bytes(b"x" * 2000)
+        os.utime(leftover, ns=(0, 0))
+
+        assert store.evict(1000) < 1000  # noqa: PLR2004
+        assert not leftover.exists()
+        assert store.get("aa00") == (True, "x")
+
+    def test_temporary_files_named_like_results(self, tmp_path: Path, monkeypatch):
+        """Results are written through files that `evict` would find."""
+        names = []
+        replace = os.replace
+        monkeypatch.setattr(
+            os, "replace", lambda src, dst: names.append(src) or replace(src, dst)
+        )
+
+        ResultStore(tmp_path).put("aa00", 1)
+        assert len(names) == 1
+        assert Path(names[0]).match(f"*/*{RESULT_SUFFIX}")
+
+    def test_store_scanned_rarely(self, tmp_path: Path, monkeypatch):
+        """Writes keep a running size instead of scanning the store."""
+        store = ResultStore(tmp_path, max_bytes=10_000)
+        scans = []
+        evict = store.evict
+        monkeypatch.setattr(
+            store,
+            "evict",
+            lambda *args, **kwargs: scans.append(args) or evict(*args, **kwargs),
+        )
+
+        for i in range(100):
+            store.put(f"{i:04}", "x" * 400)
+
+        sizes = [path.stat().st_size for path in tmp_path.glob("*/*")]
+        assert sum(sizes) <= 10_000  # noqa: PLR2004
+        assert len(scans) < 20  # noqa: PLR2004
+
+    def test_memoize_result(self, tmp_path: Path):
+        """Commands are only run once per set of effective parameters."""
+        calls = []
+
+        app = typer.Typer()
+
+        @app.command()
+        @memoize_result(tmp_path / "results")
+        @use_json_config()
+        def main(name: str, color: Color = typer.Option(Color.red)):
+            calls.append(name)
+            return f"{name} {color.value}"
+
+        conf = tmp_path / "config.json"
+        conf.write_text(json.dumps({"color": "blue"}))
+        command = typer.main.get_command(app)
+
+        def run(*args):
+            return command.main(list(args), standalone_mode=False)
+
+        assert run("a") == "a red"
+        assert run("a") == "a red"
+        assert run("a", "--color", "blue") == "a blue"
+        assert run("a", "--config", str(conf)) == "a blue"
+        assert calls == ["a", "a", "a"]
@@ -0,0 +1,138 @@
+"""Tests for typer_config.compaction."""
+
+import copy
+import json
+import pickle
+import sys
+from array import array
+from pathlib import Path
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from typer_config.callbacks import conf_callback_factory
+from typer_config.compaction import ConfigCompactor, FrozenDict
+from typer_config.decorators import use_config
+from typer_config.loaders import _deep_merge, json_loader, loader_transformer
+from typer_config.utils import get_dict_section
+
+RUNNER = CliRunner()
+
+
+def tenant(i: int) -> dict:
+    """Synthetic per-tenant config."""
+    return {
+        "name": f"tenant{i}",
+        "limits": {"cpu": 2, "memory": "4Gi"},
+        "regions": ["eu", "us"],
+        "weights": [0.5] * 10,
+        "ports": list(range(8000, 8010)),
+        "services": {f"svc{k}": {"replicas": 2} for k in range(20)},
+    }
+
+
+def test_equal_and_shared():
+    """Compacted configs are equal to the originals and share subtrees."""
+    compactor = ConfigCompactor()
+    first, second = compactor(tenant(1)), compactor(tenant(2))
+
+    assert json.loads(json.dumps(first, default=list)) == tenant(1)
+    assert first["limits"] is second["limits"]
+    assert first["regions"] is second["regions"]
+    assert first["services"]["svc0"] is second["services"]["svc19"]
+    assert isinstance(first["weights"], array)
+    assert first["weights"] is second["weights"]
+    assert first["ports"].typecode == "q"
+
+
+def test_keys_interned():
+    """Keys are interned."""
+    compactor = ConfigCompactor()
+    key = "".join(["some", "_key"])  # noqa: FLY002 (not interned)
+    (compacted_key,) = compactor({key: 1})
+    assert compacted_key is sys.intern("some_key")
+
+
+@pytest.mark.parametrize(
+    ("first", "second"),
+    [([1, 2], [True, 2]), ([1], [1.0]), ({"a": 0.0}, {"a": -0.0}), ({1: 1}, {True: 1})],
+)
+def test_equal_but_different_types_not_shared(first, second):
+    """Values that compare equal but differ in type are not shared."""
+    compactor = ConfigCompactor()
+    wrapped_first, wrapped_second = compactor({"x": first}), compactor({"x": second})
+    assert wrapped_first["x"] is not wrapped_second["x"]
+    assert repr(list(wrapped_second["x"])) == repr(list(second))
+
+
+def test_read_only():
+    """Shared mappings are read-only."""
+    compacted = ConfigCompactor()({"small": {"a": 1}})
+    with pytest.raises(TypeError):
+        compacted["small"]["a"] = 2
+    with pytest.raises(TypeError):
+        compacted["small"].update(a=2)
+
+
+def test_works_with_sections_and_merging():
+    """Compacted configs still work with sections and deep merging."""
+    compacted = ConfigCompactor()({"a": {"b": {"c": 1, "d": 2}}})
+    assert get_dict_section(compacted, ["a", "b"]) == {"c": 1, "d": 2}
+    assert _deep_merge(compacted, {"a": {"b": {"c": 3}}}) == {
+        "a": {"b": {"c": 3, "d": 2}}
+    }
+
+
+def test_config_transformer(tmp_path: Path):
+    """A compactor plugs into loader_transformer."""
+    conf = tmp_path / "config.json"
+    conf.write_text('{"opt1": "a", "opt2": ["x", "y"]}')
+
+    app = typer.Typer()
+
+    @app.command()
+    @use_config(
+        conf_callback_factory(
+            loader_transformer(
+                json_loader,
+                loader_conditional=lambda param_value: param_value,
+                config_transformer=ConfigCompactor(),
+            )
+        )
+    )
+    def main(opt1: str = typer.Option(...), opt2: list[str] = typer.Option([])):
+        typer.echo(f"{opt1} {opt2}")
+
+    result = RUNNER.invoke(app, ["--config", str(conf)])
+    assert result.exit_code == 0, result.stdout
+    assert result.stdout.strip() == "a ['x', 'y']"
+
+
+def test_root_stays_plain_dict():
+    """The root of a compacted config is a plain, mutable dict."""
+    compacted = ConfigCompactor()({"a": 1, "b": {"c": 2}})
+    assert type(compacted) is dict
+    assert isinstance(compacted["b"], FrozenDict)
+    compacted["a"] = 2
+
+
+def test_frozen_dict_repr():
+    """FrozenDict shows its type."""
+    assert repr(FrozenDict(a=1)) == "FrozenDict({'a': 1})"
+
+
+def test_frozen_dict_copies():
+    """Compacted configs (including arrays) can be pickled and copied."""
+    compacted = ConfigCompactor()({"x": {"a": 1, "weights": [0.5] * 10}})
+    frozen = compacted["x"]
+
+    for copied in (
+        pickle.loads(pickle.dumps(compacted)),
+        copy.deepcopy(compacted),
+        {"x": copy.copy(frozen)},
+    ):
+        assert copied == compacted
+        assert type(copied["x"]) is FrozenDict
+    with pytest.raises(TypeError, match="unhashable"):
+        hash(frozen)
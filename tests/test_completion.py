@@ -0,0 +1,119 @@
+"""Tests for config loading during shell completion."""
+
+from pathlib import Path
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from typer_config.callbacks import conf_callback_factory
+from typer_config.decorators import use_config
+from typer_config.loaders import loader_transformer, yaml_loader
+
+RUNNER = CliRunner()
+
+COMPLETION_ENV = {
+    "_MY_APP_COMPLETE": "complete_zsh",
+    "_TYPER_COMPLETE_ARGS": "my-app --config config.yml --na",
+}
+
+
+def make_app(calls: list, **kwargs) -> typer.Typer:
+    """App that records config loads and completes from the config."""
+
+    def loader(param_value):
+        calls.append(param_value)
+        return yaml_loader(param_value)
+
+    def complete_name(ctx: typer.Context, incomplete: str):
+        return [
+            name
+            for name in (ctx.default_map or {}).get("names", [])
+            if name.startswith(incomplete)
+        ]
+
+    app = typer.Typer()
+
+    @app.command()
+    @use_config(
+        conf_callback_factory(
+            loader_transformer(
+                loader, loader_conditional=lambda param_value: param_value
+            ),
+            **kwargs,
+        )
+    )
+    def main(
+        name: str = typer.Option("", autocompletion=complete_name),
+        names: list[str] = typer.Option([]),
+    ):
+        typer.echo(name)
+
+    return app
+
+
+@pytest.fixture
+def conf(tmp_path: Path, monkeypatch) -> Path:
+    """Config file in the current directory."""
+    monkeypatch.chdir(tmp_path)
+    path = tmp_path / "config.yml"
+    path.write_text("names: [alice, bob]\n")
+    return path
+
+
+def complete(app: typer.Typer, args: str) -> str:
+    """Run shell completion."""
+    env = {**COMPLETION_ENV, "_TYPER_COMPLETE_ARGS": f"my-app {args}"}
+    result = RUNNER.invoke(app, [], prog_name="my-app", env=env)
+    assert result.exit_code == 0, result.output
+    return result.output
+
+
+@pytest.mark.usefixtures("conf")
+def test_skip():
+    """By default, completion doesn't load the config."""
+    calls = []
+    app = make_app(calls)
+
+    assert "--name" in complete(app, "--config config.yml --na")
+    assert calls == []
+
+    # normal invocations still load it
+    assert RUNNER.invoke(app, ["--config", "config.yml"]).exit_code == 0
+    assert calls == ["config.yml"]
+
+
+@pytest.mark.usefixtures("conf")
+def test_load():
+    """The config can be loaded for completion functions."""
+    calls = []
+    app = make_app(calls, on_completion="load")
+
+    assert "alice" in complete(app, "--config config.yml --name a")
+    assert calls == ["config.yml"]
+
+
+def test_cache(conf: Path, tmp_path: Path):
+    """Completion can serve configs from a snapshot cache."""
+    calls = []
+    app = make_app(
+        calls, on_completion="cache", completion_cache_dir=tmp_path / "cache"
+    )
+
+    for _ in range(3):
+        assert "alice" in complete(app, "--config config.yml --name a")
+    assert calls == ["config.yml"]
+
+    conf.write_text("names: [anne]\n")
+    output = complete(app, "--config config.yml --name a")
+    assert "anne" in output
+    assert "alice" not in output
+    assert len(calls) == 2  # noqa: PLR2004
+
+
+def test_invalid_modes():
+    """Unknown modes and a cache without a directory are errors."""
+    with pytest.raises(ValueError, match="on_completion"):
+        conf_callback_factory(yaml_loader, on_completion="never")
+    with pytest.raises(ValueError, match="completion_cache_dir"):
+        conf_callback_factory(yaml_loader, on_completion="cache")
@@ -0,0 +1,68 @@
+"""Tests for compressed config files."""
+
+import bz2
+import gzip
+import lzma
+from pathlib import Path
+
+import pytest
+
+from typer_config.dumpers import binary_dumper, json_dumper, toml_dumper, yaml_dumper
+from typer_config.loaders import (
+    _get_loader_for_file,
+    binary_loader,
+    json_loader,
+    multifile_loader,
+    toml_loader,
+    yaml_loader,
+)
+
+HERE = Path(__file__).parent.absolute()
+
+CODECS = {".gz": gzip, ".bz2": bz2, ".xz": lzma}
+
+
+@pytest.mark.parametrize("suffix", CODECS)
+@pytest.mark.parametrize(
+    "name", ["config.json", "config.yml", "config.toml", "config.ini", "config.env"]
+)
+def test_loaders(tmp_path: Path, name: str, suffix: str):
+    """Compressed files load like their uncompressed originals."""
+    original = HERE / name
+    compressed = tmp_path / f"{name}{suffix}"
+    compressed.write_bytes(CODECS[suffix].compress(original.read_bytes()))
+
+    loader = _get_loader_for_file(str(compressed))
+    assert loader is _get_loader_for_file(str(original))
+    assert loader(compressed) == loader(original)
+
+
+@pytest.mark.parametrize("suffix", CODECS)
+@pytest.mark.parametrize(
+    ("dumper", "loader", "extension"),
+    [
+        (json_dumper, json_loader, ".json"),
+        (yaml_dumper, yaml_loader, ".yaml"),
+        (toml_dumper, toml_loader, ".toml"),
+        (binary_dumper, binary_loader, ".tcfg"),
+    ],
+)
+def test_dumpers(tmp_path: Path, dumper, loader, extension: str, suffix: str):
+    """Dumpers compress and the files can be loaded back."""
+    config = {"opt1": "a", "nested": {"opt2": [1, 2]}}
+    path = tmp_path / f"config{extension}{suffix}"
+
+    dumper(config, path)
+
+    assert CODECS[suffix].decompress(path.read_bytes())
+    assert loader(path) == config
+
+
+def test_multifile(tmp_path: Path):
+    """Compressed and uncompressed files can be mixed in a stack."""
+    (tmp_path / "base.yml.gz").write_bytes(gzip.compress(b"opt1: a\nopt2: a\n"))
+    (tmp_path / "override.json").write_text('{"opt2": "b"}')
+
+    assert multifile_loader(
+        [str(tmp_path / "base.yml.gz"), str(tmp_path / "override.json")]
+    ) == {"opt1": "a", "opt2": "b"}
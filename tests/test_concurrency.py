@@ -0,0 +1,49 @@
+"""Test concurrent invocations of config-decorated commands."""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import typer
+
+from typer_config.decorators import use_yaml_config
+
+THREADS = 16
+INVOCATIONS = 400
+
+
+def test_concurrent_invocations(tmp_path: Path):
+    """Concurrent invocations sharing a default map don't interfere."""
+    configs = []
+    for i in range(4):
+        conf = tmp_path / f"config{i}.yml"
+        conf.write_text(f"opt1: conf{i}\n")
+        configs.append(str(conf))
+
+    app = typer.Typer()
+
+    @app.command()
+    @use_yaml_config()
+    def main(
+        opt1: str = typer.Option("default"),
+        opt2: str = typer.Option("default"),
+    ):
+        return f"{opt1} {opt2}"
+
+    command = typer.main.get_command(app)
+    shared_default_map = {"opt2": "shared"}
+
+    def invoke(i: int):
+        args = ["--config", configs[i % len(configs)]] if i % 5 else []
+        expected = f"conf{i % len(configs)} shared" if i % 5 else "default shared"
+        result = command.main(
+            args,
+            standalone_mode=False,
+            default_map=shared_default_map,
+        )
+        return result, expected
+
+    with ThreadPoolExecutor(max_workers=THREADS) as pool:
+        for result, expected in pool.map(invoke, range(INVOCATIONS)):
+            assert result == expected
+
+    assert shared_default_map == {"opt2": "shared"}
@@ -0,0 +1,113 @@
+"""Tests for typer_config.discovery."""
+
+from pathlib import Path
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from typer_config.decorators import use_fallback_config, use_multifile_config
+from typer_config.discovery import clear_discovery_cache, search_upwards, upwards
+
+RUNNER = CliRunner()
+
+NAMES = ["myapp.yml", "pyproject.toml"]
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    clear_discovery_cache()
+    yield
+    clear_discovery_cache()
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """Project tree with a .git boundary and config files at several levels."""
+    (tmp_path / "pyproject.toml").write_text("")  # above the boundary
+    root = tmp_path / "root"
+    (root / ".git").mkdir(parents=True)
+    (root / "pyproject.toml").write_text('[tool.myapp]\nopt1 = "root"\n')
+    (root / "a" / "b" / "c").mkdir(parents=True)
+    (root / "a" / "b" / "myapp.yml").write_text("opt1: nearest\n")
+    return root
+
+
+def test_search_upwards(project: Path):
+    """Files are found from nearest to farthest, stopping at the boundary."""
+    start = project / "a" / "b" / "c"
+    expected = [str(project / "a" / "b" / "myapp.yml"), str(project / "pyproject.toml")]
+
+    assert search_upwards(NAMES, start=start) == expected
+    assert search_upwards(NAMES, start=start, nearest_first=False) == expected[::-1]
+
+
+def test_no_boundary(project: Path):
+    """Without boundaries the search continues to the filesystem root."""
+    found = search_upwards(["pyproject.toml"], start=project, boundaries=[])
+    assert str(project.parent / "pyproject.toml") in found
+
+
+def test_memoized(project: Path):
+    """Directory scans are memoized within the process."""
+    start = project / "a" / "b" / "c"
+    before = search_upwards(NAMES, start=start)
+    (start / "myapp.yml").write_text("")
+
+    assert search_upwards(NAMES, start=start) == before
+
+    clear_discovery_cache()
+    assert search_upwards(NAMES, start=start)[0] == str(start / "myapp.yml")
+
+
+def test_persistent(project: Path, tmp_path: Path):
+    """Persisted scans are revalidated with directory mtimes."""
+    start = project / "a" / "b" / "c"
+    cache_dir = tmp_path / "cache"
+    before = search_upwards(NAMES, start=start, cache_dir=cache_dir)
+    assert list(cache_dir.iterdir())
+
+    clear_discovery_cache()
+    assert search_upwards(NAMES, start=start, cache_dir=cache_dir) == before
+
+    clear_discovery_cache()
+    (start / "myapp.yml").write_text("")
+    assert search_upwards(NAMES, start=start, cache_dir=cache_dir) == [
+        str(start / "myapp.yml"),
+        *before,
+    ]
+
+
+@pytest.mark.parametrize(
+    ("decorator", "kwargs", "expected"),
+    [
+        (
+            use_fallback_config,
+            {"fallback_files": [upwards(NAMES, start=Path("a/b/c"))]},
+            "nearest",
+        ),
+        (
+            use_multifile_config,
+            {
+                "default_files": [
+                    upwards(["pyproject.toml"], start=Path("a/b/c")),
+                ],
+                "section": ["tool", "myapp"],
+            },
+            "root",
+        ),
+    ],
+)
+def test_decorators(project: Path, monkeypatch, decorator, kwargs, expected):
+    """File sources plug into the multifile decorators."""
+    monkeypatch.chdir(project)
+    app = typer.Typer()
+
+    @app.command()
+    @decorator(**kwargs)
+    def main(opt1: str = typer.Option("default")):
+        typer.echo(opt1)
+
+    result = RUNNER.invoke(app, [])
+    assert result.exit_code == 0, result.stdout
+    assert result.stdout.strip() == expected
@@ -0,0 +1,95 @@
+"""Conformance tests for typer_config.dotenv_parser against python-dotenv."""
+
+import io
+import os
+from pathlib import Path
+
+import pytest
+
+from typer_config.dotenv_parser import dotenv_values, referenced_variables
+from typer_config.loaders import dotenv_loader
+
+dotenv = pytest.importorskip("dotenv")
+
+HERE = Path(__file__).parent.absolute()
+
+CASES = [
+    "",
+    "a=b",
+    "a=b\nc=d\n",
+    "a=b\r\nc=d\r\n",
+    "a=b\rc=d",
+    "  a  =  b  ",
+    "export a=b",
+    "export  a=b\nexport=1",
+    "exporta=b",
+    "a",
+    "a\nb=",
+    "a=",
+    "a= # comment",
+    "a=#not a comment",
+    "a=b # comment",
+    "a=b#not a comment",
+    "# comment\na=b\n  # indented comment",
+    "a='b c'",
+    "a='b\\'c'",
+    "a='b\\\\c'",
+    "a='b\\nc'",
+    'a="b\\nc\\td\\"e\\\\f"',
+    'a="multi\nline"',
+    "a='multi\nline' # comment",
+    'a="b" c',
+    'a="unterminated\nb=c',
+    "'quoted key'=1",
+    "a b=c\nd=e",
+    "=nokey\na=1",
+    "a=1\na=2",
+    "a=1\nb=${a}\nc=${a}${b}",
+    "b=${a}\na=1",
+    "a=${MISSING}",
+    "a=${MISSING:-default}",
+    "a=${MISSING:-}",
+    "a=${TYPER_CONFIG_TEST_VAR}",
+    "TYPER_CONFIG_TEST_VAR=file\na=${TYPER_CONFIG_TEST_VAR}",
+    "a\nb=${a:-default}",
+    "a='${b}'\nb=1",
+    "b=1\na='${b}'",
+    'b=1\na="${b}"',
+    "a=$b ${ b} ${b:-x:-y} $${b}",
+    "\ufeffa=b",
+    "a=é ü 中",
+    'a="\\u00e9"',
+]
+
+
+@pytest.fixture(autouse=True)
+def _env(monkeypatch):
+    monkeypatch.setenv("TYPER_CONFIG_TEST_VAR", "from env")
+
+
+@pytest.mark.parametrize("source", CASES)
+@pytest.mark.parametrize("interpolate", [True, False])
+def test_conformance(source: str, interpolate):
+    """Built-in parser matches python-dotenv."""
+    expected = dotenv.dotenv_values(stream=io.StringIO(source), interpolate=interpolate)
+    actual = dotenv_values(source, interpolate=interpolate)
+    assert actual == dict(expected)
+    assert list(actual) == list(expected)
+
+
+def test_environ_argument():
+    """An explicit environment can be given."""
+    assert dotenv_values("a=${X}", environ={"X": "y"}) == {"a": "y"}
+    assert "X" not in os.environ
+
+
+def test_referenced_variables():
+    """Names of the expanded variables are found in (multiline) values."""
+    source = "a=${X}\nb='${Y}'\nc=\"${Z:-d}\n${X}\"\n# ${W}\ne"
+    assert referenced_variables(source) == {"X", "Y", "Z"}
+
+
+@pytest.mark.parametrize("fpath", [HERE / "config.env", HERE / "other.env"], ids=str)
+def test_loader_backends(fpath: Path):
+    """Both dotenv_loader backends give the same result."""
+    assert dotenv_loader(fpath) == dotenv_loader(fpath, use_python_dotenv=True)
@@ -1,5 +1,8 @@
 """Test Config Dumpers."""
 
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
 from pathlib import Path
 
@@ -9,6 +12,7 @@ from typer.testing import CliRunner
 
 import typer_config
 import typer_config.decorators as tcdec
+import typer_config.dumpers
 
 RUNNER = CliRunner()
 
@@ -103,3 +107,105 @@ def test_dump_config(dumper_app, dumper):
     }, f"{location} does not match original parameters"
 
     location.unlink()
+
+
+class TestRunLog:
+    """Tests for the append-only run log."""
+
+    def test_appends(self, dumper_app, tmp_path: Path):
+        """Every invocation is appended to the log."""
+        location = tmp_path / "runs.jsonl"
+        dumper = typer_config.dumpers.RunLogDumper(
+            buffer_size=64 * 1024, flush_interval=3600
+        )
+        _app = dumper_app(lambda loc: tcdec.dump_config(dumper, loc), location)
+
+        for opt1 in ("foo", "bar"):
+            result = RUNNER.invoke(_app, ["--opt1", opt1, "baz", "--things", "c"])
+            assert result.exit_code == 0, result.stdout
+
+        # buffered until flushed
+        assert not location.exists()
+        dumper.flush()
+
+        records = [json.loads(line) for line in location.read_text().splitlines()]
+        assert records == [
+            {
+                "arg1": "baz",
+                "config": "",
+                "opt1": opt1,
+                "opt2": "hello",
+                "things": "c",
+            }
+            for opt1 in ("foo", "bar")
+        ]
+
+    def test_flush_thresholds(self, tmp_path: Path):
+        """Records are written once the buffer is big or old enough."""
+        location = tmp_path / "runs.jsonl"
+
+        dumper = typer_config.dumpers.RunLogDumper(buffer_size=1, flush_interval=3600)
+        dumper({"a": 1}, location)
+        assert location.read_text() == '{"a": 1}\n'
+
+        dumper = typer_config.dumpers.RunLogDumper(buffer_size=1024, flush_interval=0)
+        dumper({"path": Path("x")}, location)
+        assert location.read_text().splitlines()[-1] == '{"path": "x"}'
+
+    def test_flush_idle(self, tmp_path: Path):
+        """Buffered records are written after flush_interval without new ones."""
+        location = tmp_path / "runs.jsonl"
+        dumper = typer_config.dumpers.RunLogDumper(
+            buffer_size=1024, flush_interval=0.05
+        )
+        dumper({"a": 1}, location)
+        assert not location.exists()
+
+        deadline = time.monotonic() + 5
+        while not location.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert location.read_text() == '{"a": 1}\n'
+
+    def test_unbuffered_workers(self, tmp_path: Path):
+        """Workers that exit without atexit handlers lose no records."""
+        location = tmp_path / "runs.jsonl"
+        with ProcessPoolExecutor(2) as executor:
+            list(executor.map(_log_unbuffered, [location] * 10, range(10)))
+
+        lines = location.read_text().splitlines()
+        assert sorted(json.loads(line)["run"] for line in lines) == list(range(10))
+
+    def test_rotation(self, tmp_path: Path):
+        """The log is rotated before it grows beyond max_bytes."""
+        location = tmp_path / "runs.jsonl"
+        dumper = typer_config.dumpers.RunLogDumper(
+            buffer_size=1, max_bytes=20, backup_count=2
+        )
+
+        for i in range(4):
+            dumper({"run": i, "x": "0123"}, location)
+
+        assert location.read_text() == '{"run": 3, "x": "0123"}\n'
+        assert location.with_suffix(".jsonl.1").read_text().startswith('{"run": 2')
+        assert location.with_suffix(".jsonl.2").read_text().startswith('{"run": 1')
+        assert not location.with_suffix(".jsonl.3").exists()
+
+    def test_concurrent_processes(self, tmp_path: Path):
+        """Several processes can append to the same log."""
+        location = tmp_path / "runs.jsonl"
+        with ProcessPoolExecutor(4) as executor:
+            list(executor.map(_log_runs, [location] * 4, range(4)))
+
+        lines = location.read_text().splitlines()
+        assert sorted(json.loads(line)["run"] for line in lines) == list(range(400))
+
+
+def _log_runs(location: Path, worker: int) -> None:
+    dumper = typer_config.dumpers.RunLogDumper(buffer_size=100)
+    for i in range(100):
+        dumper({"run": worker * 100 + i, "padding": "x" * 50}, location)
+    dumper.flush()
+
+
+def _log_unbuffered(location: Path, run: int) -> None:
+    typer_config.dumpers.RunLogDumper()({"run": run}, location)
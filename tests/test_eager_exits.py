@@ -0,0 +1,92 @@
+"""Tests for deferred config loading with eager exits (help, version)."""
+
+import builtins
+from pathlib import Path
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from typer_config.decorators import use_yaml_config
+
+RUNNER = CliRunner()
+
+
+def version_callback(value: bool):  # noqa: FBT001
+    """Print version and exit."""
+    if value:
+        typer.echo("1.0")
+        raise typer.Exit
+
+
+app = typer.Typer()
+
+
+@app.command()
+@use_yaml_config()
+def main(
+    opt1: str = typer.Option("default"),
+    version: bool = typer.Option(  # noqa: FBT001
+        default=False, callback=version_callback, is_eager=True
+    ),
+):
+    """Command with a config."""
+    typer.echo(opt1)
+
+
+@pytest.fixture
+def conf(tmp_path: Path) -> Path:
+    """Config file."""
+    path = tmp_path / "config.yml"
+    path.write_text("opt1: from config\n")
+    return path
+
+
+@pytest.fixture
+def opened(monkeypatch) -> list:
+    """Record every file opened with `open`."""
+    paths = []
+    original_open = builtins.open
+
+    def _open(file, *args, **kwargs):
+        paths.append(str(file))
+        return original_open(file, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "open", _open)
+    return paths
+
+
+@pytest.mark.parametrize(
+    ("args", "expected"),
+    [
+        (["--config", "{conf}", "--help"], "Command with a config."),
+        (["--help", "--config", "{conf}"], "Command with a config."),
+        (["--config", "{conf}", "--version"], "1.0"),
+    ],
+)
+def test_no_io_on_eager_exit(conf: Path, opened: list, args, expected):
+    """Eager exits don't read the config file."""
+    result = RUNNER.invoke(app, [arg.format(conf=conf) for arg in args])
+
+    assert result.exit_code == 0, result.output
+    assert expected in result.output
+    assert str(conf) not in opened
+
+
+def test_loaded_when_needed(conf: Path, opened: list):
+    """The config is still loaded for normal invocations."""
+    result = RUNNER.invoke(app, ["--config", str(conf)])
+
+    assert result.exit_code == 0, result.output
+    assert result.output.strip() == "from config"
+    assert opened.count(str(conf)) == 1
+
+
+def test_errors(tmp_path: Path):
+    """Loading errors are still reported for the config option."""
+    conf = tmp_path / "config.yml"
+    conf.write_text("opt1: [unterminated\n")
+
+    result = RUNNER.invoke(app, ["--config", str(conf)])
+    assert result.exit_code != 0
+    assert "--config" in result.output
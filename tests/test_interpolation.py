@@ -0,0 +1,142 @@
+"""Tests for typer_config.interpolation."""
+
+from pathlib import Path
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from typer_config.callbacks import conf_callback_factory
+from typer_config.decorators import use_config
+from typer_config.interpolation import (
+    InterpolationError,
+    compile_template,
+    interpolate_config,
+)
+from typer_config.loaders import loader_transformer, yaml_loader
+
+RUNNER = CliRunner()
+
+ENV = {"HOME": "/home/me"}
+
+
+class TestCompileTemplate:
+    """Tests for compile_template."""
+
+    def test_plain_string(self):
+        """Strings without references are not compiled."""
+        assert compile_template("plain") is None
+
+    def test_literal_and_references(self):
+        """Literal chunks and references are split apart."""
+        template = compile_template("${a.b}/x/${env:HOME}")
+        assert template is not None
+        assert template[0].path == ("a", "b")
+        assert template[1] == "/x/"
+        assert template[2].env == "HOME"
+
+    def test_escape(self):
+        """`$${...}` is a literal `${...}`."""
+        assert compile_template("$${a}") == ("${a}",)
+
+    def test_empty_reference(self):
+        """Empty references are rejected."""
+        with pytest.raises(InterpolationError):
+            compile_template("${ }")
+
+
+class TestInterpolateConfig:
+    """Tests for interpolate_config."""
+
+    def test_references(self):
+        """Nested references, env vars and list indices are resolved."""
+        config = {
+            "paths": {"root": "/srv", "cache": "${paths.root}/cache"},
+            "dirs": ["${paths.cache}/a", "${dirs.0}/b"],
+            "home": "${env:HOME}",
+        }
+        assert interpolate_config(config, ENV) == {
+            "paths": {"root": "/srv", "cache": "/srv/cache"},
+            "dirs": ["/srv/cache/a", "/srv/cache/a/b"],
+            "home": "/home/me",
+        }
+
+    def test_lone_reference_keeps_type(self):
+        """A value consisting of one reference keeps the referenced type."""
+        expected_port = 80
+        config = {
+            "port": expected_port,
+            "other": "${port}",
+            "copy": "${nested}",
+            "nested": {},
+        }
+        result = interpolate_config(config, ENV)
+        assert result["other"] == expected_port
+        assert result["copy"] == {}
+
+    def test_does_not_mutate_input(self):
+        """The input config is left untouched."""
+        config = {"a": "x", "b": {"c": "${a}"}}
+        interpolate_config(config, ENV)
+        assert config == {"a": "x", "b": {"c": "${a}"}}
+
+    def test_long_chain(self):
+        """Long reference chains don't hit the recursion limit."""
+        size = 5000
+        config = {f"k{i}": f"${{k{i - 1}}}" for i in range(1, size)}
+        config["k0"] = "end"
+        assert interpolate_config(config, ENV)[f"k{size - 1}"] == "end"
+
+    @pytest.mark.parametrize(
+        "config",
+        [
+            {"a": "${b}", "b": "${a}"},
+            {"a": "${a}"},
+            {"a": {"b": "x${a}"}},
+        ],
+        ids=["pair", "self", "ancestor"],
+    )
+    def test_cycle(self, config):
+        """Circular references are detected."""
+        with pytest.raises(InterpolationError, match="Circular"):
+            interpolate_config(config, ENV)
+
+    @pytest.mark.parametrize(
+        ("config", "match"),
+        [
+            ({"a": "${missing}"}, "Unknown reference"),
+            ({"a": [1], "b": "${a.3}"}, "Unknown reference"),
+            ({"a": "${env:NOT_SET}"}, "not set"),
+            ({"a": {"x": 1}, "b": "y${a}"}, "Cannot embed"),
+            ({"a": "${c}", "b": "${a.x}", "c": {"x": 1}}, "traverses"),
+        ],
+    )
+    def test_errors(self, config, match):
+        """Unresolvable references raise InterpolationError."""
+        with pytest.raises(InterpolationError, match=match):
+            interpolate_config(config, ENV)
+
+
+def test_config_transformer(tmp_path: Path):
+    """interpolate_config plugs into loader_transformer."""
+    conf = tmp_path / "config.yml"
+    conf.write_text("root: /srv\nopt1: ${root}/cache\n")
+
+    app = typer.Typer()
+
+    @app.command()
+    @use_config(
+        conf_callback_factory(
+            loader_transformer(
+                yaml_loader,
+                loader_conditional=lambda param_value: param_value,
+                config_transformer=interpolate_config,
+            )
+        )
+    )
+    def main(opt1: str = typer.Option(...)):
+        typer.echo(opt1)
+
+    result = RUNNER.invoke(app, ["--config", str(conf)])
+    assert result.exit_code == 0, result.stdout
+    assert result.stdout.strip() == "/srv/cache"
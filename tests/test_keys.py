@@ -0,0 +1,193 @@
+"""Tests for config key normalization and unknown-key checks."""
+
+import warnings
+from pathlib import Path
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from typer_config.decorators import use_profile, use_yaml_config
+from typer_config.keys import KeyIndex, UnknownKeysError
+
+RUNNER = CliRunner()
+
+
+@pytest.fixture
+def index():
+    """Key index of a command with two parameters."""
+    return KeyIndex(["max_workers", "verbose"])
+
+
+def test_normalize(index: KeyIndex):
+    """Dashed spellings are renamed to parameter names."""
+    config = {"max-workers": 4, "verbose": True, "profiles": {}}
+
+    assert index.normalize(config, "error") == {
+        "max_workers": 4,
+        "verbose": True,
+        "profiles": {},
+    }
+
+
+def test_unchanged(index: KeyIndex):
+    """Configs that only use parameter names aren't copied."""
+    config = {"max_workers": 4}
+
+    assert index.normalize(config, "error") is config
+
+
+def test_error(index: KeyIndex):
+    """Strict mode reports unknown keys with suggestions."""
+    with pytest.raises(UnknownKeysError, match="did you mean 'max_workers'"):
+        index.normalize({"max_wrokers": 4}, "error")
+
+    with pytest.raises(UnknownKeysError, match="more than once"):
+        index.normalize({"max_workers": 4, "max-workers": 5}, "error")
+
+
+def test_warn(index: KeyIndex):
+    """Lenient mode warns and keeps the unknown keys."""
+    with pytest.warns(UserWarning, match="unknown key 'color'"):
+        config = index.normalize({"color": "red", "max-workers": 1}, "warn")
+
+    assert config == {"color": "red", "max_workers": 1}
+
+
+def test_ignore(index: KeyIndex):
+    """Unknown keys can be ignored while dashes are still accepted."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        config = index.normalize({"color": "red", "max-workers": 1}, "ignore")
+
+    assert config == {"color": "red", "max_workers": 1}
+
+
+def test_subcommands(index: KeyIndex):
+    """Subcommand sections are accepted."""
+    assert index.normalize({"sub": {}}, "error", subcommands={"sub"}) == {"sub": {}}
+
+
+def _app(**dec_kwargs):
+    app = typer.Typer()
+
+    @app.command()
+    @use_yaml_config(**dec_kwargs)
+    @use_profile()
+    def main(max_workers: int = 1, label: str = "none"):
+        typer.echo(f"{max_workers} {label}")
+
+    return app
+
+
+@pytest.mark.parametrize("mode", ["ignore", "warn", "error"])
+def test_decorator(tmp_path: Path, mode: str):
+    """Dashed keys are applied in every mode."""
+    config = tmp_path / "config.yml"
+    config.write_text("max-workers: 4\nlabel: run\n")
+
+    result = RUNNER.invoke(_app(unknown_keys=mode), ["--config", str(config)])
+
+    assert result.exit_code == 0, result.output
+    assert result.stdout.strip() == "4 run"
+
+
+def test_decorator_legacy(tmp_path: Path):
+    """Without `unknown_keys`, keys must match the parameter names."""
+    config = tmp_path / "config.yml"
+    config.write_text("max-workers: 4\n")
+
+    result = RUNNER.invoke(_app(), ["--config", str(config)])
+
+    assert result.exit_code == 0, result.output
+    assert result.stdout.strip() == "1 none"
+
+
+def test_dashed_response_file(tmp_path: Path):
+    """Dashed keys of list parameters can point to response files."""
+    (tmp_path / "items.txt").write_text("a\nb\n")
+    config = tmp_path / "config.yml"
+    config.write_text(f"input-files: '@{tmp_path / 'items.txt'}'\n")
+
+    app = typer.Typer()
+
+    @app.command()
+    @use_yaml_config(unknown_keys="warn")
+    def main(input_files: list[str] = typer.Option([])):
+        typer.echo(",".join(input_files))
+
+    result = RUNNER.invoke(app, ["--config", str(config)])
+
+    assert result.exit_code == 0, result.output
+    assert result.stdout.strip() == "a,b"
+
+
+def test_decorator_error(tmp_path: Path):
+    """Strict mode fails the command on a typo."""
+    config = tmp_path / "config.yml"
+    config.write_text("max_wrokers: 4\n")
+
+    result = RUNNER.invoke(_app(unknown_keys="error"), ["--config", str(config)])
+
+    assert result.exit_code == 2  # noqa: PLR2004
+    assert "max_wrokers" in result.output
+
+
+def test_decorator_warn(tmp_path: Path):
+    """Lenient mode runs the command and warns."""
+    config = tmp_path / "config.yml"
+    config.write_text("max_wrokers: 4\n")
+
+    result = RUNNER.invoke(_app(unknown_keys="warn"), ["--config", str(config)])
+
+    assert result.exit_code == 0, result.output
+    assert "unknown key 'max_wrokers'" in result.output
+    assert result.stdout.strip().endswith("1 none")
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["--profile", "prod", "--config", "{config}"],
+        ["--config", "{config}", "--profile", "prod"],
+    ],
+)
+def test_profiles(tmp_path: Path, args: list):
+    """Profile overrides are normalized, whenever the profile is selected."""
+    config = tmp_path / "config.yml"
+    config.write_text("max-workers: 4\nprofiles:\n  prod:\n    max-workers: 16\n")
+
+    result = RUNNER.invoke(
+        _app(unknown_keys="error"), [arg.format(config=config) for arg in args]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert result.stdout.strip() == "16 none"
+
+
+def test_group(tmp_path: Path):
+    """Config sections of subcommands aren't unknown keys."""
+    config = tmp_path / "config.yml"
+    config.write_text("name: group\nsub:\n  count: 3\n")
+
+    app = typer.Typer()
+
+    @app.callback()
+    @use_yaml_config(unknown_keys="error")
+    def main(name: str = "default"):
+        typer.echo(name)
+
+    @app.command()
+    def sub(count: int = 1):
+        typer.echo(count)
+
+    result = RUNNER.invoke(app, ["--config", str(config), "sub"])
+
+    assert result.exit_code == 0, result.output
+    assert result.stdout.split() == ["group", "3"]
+
+
+def test_invalid_mode():
+    """Unknown modes are rejected when the decorator is created."""
+    with pytest.raises(ValueError, match="unknown_keys"):
+        use_yaml_config(unknown_keys="strict")
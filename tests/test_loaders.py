@@ -0,0 +1,122 @@
+"""Tests for typer_config.loaders."""
+
+from pathlib import Path
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from typer_config.decorators import use_yaml_config
+from typer_config.loaders import ini_loader, yaml_loader
+
+yaml = pytest.importorskip("yaml")
+
+RUNNER = CliRunner()
+
+HERE = Path(__file__).parent.absolute()
+
+INI = """\
+[DEFAULT]
+root = /srv
+
+[first]
+path = %(root)s/first
+multi = line one
+    [not a header]
+    line three
+
+; comment
+[second]
+path = %(root)s/second
+ref = %(path)s/x
+
+[third]
+other = 3
+"""
+
+
+class TestIniSections:
+    """Tests for section-targeted INI parsing."""
+
+    @pytest.mark.parametrize(
+        "sections", [["first"], ["second"], ["first", "third"], [], ["missing"]]
+    )
+    def test_same_as_full_parse(self, tmp_path: Path, sections):
+        """Targeted parsing matches the full parse for the requested sections."""
+        path = tmp_path / "config.ini"
+        path.write_text(INI)
+        full = ini_loader(path)
+
+        assert ini_loader(path, sections=sections) == {
+            sect: full[sect] for sect in sections if sect in full
+        }
+
+    def test_repo_config(self):
+        """Targeted parsing of the example config."""
+        path = HERE / "config.ini"
+        assert ini_loader(path, sections=["simple_app"]) == {
+            "simple_app": ini_loader(path)["simple_app"]
+        }
+
+
+YAML_STREAM = """\
+env: dev
+opt1: dev
+---
+env: prod
+opt1: prod
+replicas: 3
+---
+- not a mapping
+---
+: [this document is invalid
+"""
+
+
+class TestYamlDocuments:
+    """Tests for multi-document YAML selection."""
+
+    @pytest.fixture
+    def path(self, tmp_path: Path) -> Path:
+        """Multi-document YAML file that is invalid after the third document."""
+        path = tmp_path / "envs.yml"
+        path.write_text(YAML_STREAM)
+        return path
+
+    @pytest.mark.parametrize(
+        "document",
+        [1, {"env": "prod"}, {"env": "prod", "replicas": 3}],
+        ids=["index", "discriminator", "typed discriminator"],
+    )
+    def test_select(self, path: Path, document):
+        """Documents are selected without parsing the rest of the stream."""
+        assert yaml_loader(path, document=document) == {
+            "env": "prod",
+            "opt1": "prod",
+            "replicas": 3,
+        }
+
+    @pytest.mark.parametrize("document", [{"env": "test"}, {"replicas": "3"}, 7])
+    def test_missing(self, tmp_path: Path, document):
+        """A missing document is empty."""
+        path = tmp_path / "envs.yml"
+        path.write_text(YAML_STREAM.rsplit("---", 1)[0])
+        assert yaml_loader(path, document=document) == {}
+
+    def test_single_document_unchanged(self, path: Path):
+        """Without a selection, multi-document files are still an error."""
+        with pytest.raises(yaml.composer.ComposerError):
+            yaml_loader(path)
+
+    def test_decorator(self, path: Path):
+        """The YAML decorator can select a document."""
+        app = typer.Typer()
+
+        @app.command()
+        @use_yaml_config(document={"env": "prod"})
+        def main(opt1: str = typer.Option("default")):
+            typer.echo(opt1)
+
+        result = RUNNER.invoke(app, ["--config", str(path)])
+        assert result.exit_code == 0, result.stdout
+        assert result.stdout.strip() == "prod"
@@ -0,0 +1,217 @@
+"""Tests for list merge strategies."""
+
+from array import array
+from pathlib import Path
+
+import pytest
+import typer
+import yaml
+from typer.testing import CliRunner
+
+from typer_config.decorators import use_multifile_config
+from typer_config.loaders import multifile_loader
+from typer_config.merging import MergeStrategies, _deep_merge
+
+RUNNER = CliRunner()
+
+BASE = {"plugins": ["a", "b"], "tenants": {"x": {"paths": ["/x"]}}}
+OVERRIDE = {"plugins": ["b", "c"], "tenants": {"x": {"paths": ["/y"]}}}
+
+
+@pytest.mark.parametrize(
+    ("strategy", "expected"),
+    [
+        ("replace", ["b", "c"]),
+        ("append", ["a", "b", "b", "c"]),
+        ("prepend", ["b", "c", "a", "b"]),
+        ("union", ["a", "b", "c"]),
+    ],
+)
+def test_list_strategies(strategy: str, expected: list):
+    """Lists are merged with the strategy of their key path."""
+    merged = _deep_merge(BASE, OVERRIDE, MergeStrategies({"plugins": strategy}))
+
+    assert merged["plugins"] == expected
+    # other lists are still replaced
+    assert merged["tenants"] == {"x": {"paths": ["/y"]}}
+
+
+def test_default_replaces_lists():
+    """Without strategies lists are replaced."""
+    assert _deep_merge(BASE, OVERRIDE)["plugins"] == ["b", "c"]
+
+
+def test_wildcard_path():
+    """`*` matches any key."""
+    strategies = MergeStrategies({"tenants.*.paths": "append"})
+
+    merged = _deep_merge(BASE, OVERRIDE, strategies)
+
+    assert merged["tenants"]["x"]["paths"] == ["/x", "/y"]
+
+
+def test_wildcard_and_exact_paths():
+    """Wildcard rules still apply to keys that also have exact rules."""
+    strategies = MergeStrategies(
+        {"tenants.*.plugins": "union", "tenants.acme.paths": "append"}
+    )
+    base = {
+        "tenants": {
+            "acme": {"plugins": ["a"], "paths": ["/a"]},
+            "other": {"plugins": ["a"], "paths": ["/a"]},
+        }
+    }
+    override = {
+        "tenants": {
+            "acme": {"plugins": ["a", "b"], "paths": ["/b"]},
+            "other": {"plugins": ["b"], "paths": ["/b"]},
+        }
+    }
+
+    merged = _deep_merge(base, override, strategies)["tenants"]
+
+    assert merged["acme"] == {"plugins": ["a", "b"], "paths": ["/a", "/b"]}
+    assert merged["other"] == {"plugins": ["a", "b"], "paths": ["/b"]}
+
+
+def test_exact_path_takes_priority():
+    """An exact path overrides a wildcard for the same list."""
+    strategies = MergeStrategies({"*.tags": "union", "acme.tags": "prepend"})
+
+    merged = _deep_merge(
+        {"acme": {"tags": ["a"]}, "x": {"tags": ["a"]}},
+        {"acme": {"tags": ["a"]}, "x": {"tags": ["a"]}},
+        strategies,
+    )
+
+    assert merged == {"acme": {"tags": ["a", "a"]}, "x": {"tags": ["a"]}}
+
+
+def test_union_keeps_types():
+    """Items of different types that compare equal are all kept."""
+    strategies = MergeStrategies({"items": "union", "servers": "union_by_key:id"})
+    base = {"items": [1, 2], "servers": [{"id": 1, "a": 1}]}
+    override = {"items": [True, 1.0, 3, 2], "servers": [{"id": True, "a": 2}]}
+
+    merged = _deep_merge(base, override, strategies)
+
+    assert [(type(item), item) for item in merged["items"]] == [
+        (int, 1),
+        (int, 2),
+        (bool, True),
+        (float, 1.0),
+        (int, 3),
+    ]
+    assert merged["servers"] == [{"id": 1, "a": 1}, {"id": True, "a": 2}]
+
+
+def test_union_nested_containers():
+    """Tuples with lists, sets, arrays and bytearrays can be in unions."""
+    strategies = MergeStrategies({"items": "union", "servers": "union_by_key:id"})
+    base = {
+        "items": [(1, [2]), {1, 2}, array("q", [1]), (True, [2])],
+        "servers": [
+            {"id": (1, [2]), "a": 1},
+            {"id": bytearray(b"x"), "a": 1},
+        ],
+    }
+    override = {
+        "items": [
+            (1, [2]),
+            frozenset({1, 2}),
+            array("q", [1]),
+            array("d", [1.0]),
+            bytearray(b"x"),
+            bytearray(b"x"),
+        ],
+        "servers": [
+            {"id": (1, [2]), "a": 2},
+            {"id": bytearray(b"x"), "a": 2},
+        ],
+    }
+
+    merged = _deep_merge(base, override, strategies)
+
+    assert merged["items"] == [
+        (1, [2]),
+        {1, 2},
+        array("q", [1]),
+        (True, [2]),
+        array("d", [1.0]),
+        bytearray(b"x"),
+    ]
+    assert type(merged["items"][3][0]) is bool
+    assert merged["servers"] == [
+        {"id": (1, [2]), "a": 2},
+        {"id": bytearray(b"x"), "a": 2},
+    ]
+
+
+def test_union_unhashable():
+    """Unions of dictionaries keep the first occurrence of each item."""
+    strategies = MergeStrategies({"items": "union"})
+    base = {"items": [{"a": 1}, {"b": [1, 2]}]}
+    override = {"items": [{"b": [1, 2]}, {"a": 2}, {"a": 1}]}
+
+    merged = _deep_merge(base, override, strategies)
+
+    assert merged["items"] == [{"a": 1}, {"b": [1, 2]}, {"a": 2}]
+
+
+def test_union_by_key():
+    """Dictionaries with the same key are deep merged in place."""
+    strategies = MergeStrategies({"servers": "union_by_key:name"})
+    base = {"servers": [{"name": "a", "port": 1, "tls": {"on": True}}, "raw"]}
+    override = {
+        "servers": [{"name": "b", "port": 2}, {"name": "a", "tls": {"cert": "c"}}]
+    }
+
+    merged = _deep_merge(base, override, strategies)
+
+    assert merged["servers"] == [
+        {"name": "a", "port": 1, "tls": {"on": True, "cert": "c"}},
+        "raw",
+        {"name": "b", "port": 2},
+    ]
+    # inputs are left alone
+    assert base["servers"][0] == {"name": "a", "port": 1, "tls": {"on": True}}
+
+
+@pytest.mark.parametrize("strategy", ["merge", "union_by_key", "append:name"])
+def test_unknown_strategy(strategy: str):
+    """Unknown strategies are rejected when they are compiled."""
+    with pytest.raises(ValueError, match="Unknown merge strategy"):
+        MergeStrategies({"plugins": strategy})
+
+
+def test_multifile_loader(tmp_path: Path):
+    """`multifile_loader` merges lists with the given strategies."""
+    files = []
+    for i, config in enumerate((BASE, OVERRIDE)):
+        path = tmp_path / f"layer{i}.yml"
+        path.write_text(yaml.safe_dump(config), encoding="utf-8")
+        files.append(str(path))
+
+    merged = multifile_loader(files, merge_strategies={"plugins": "union"})
+
+    assert merged["plugins"] == ["a", "b", "c"]
+
+
+def test_decorator(tmp_path: Path):
+    """`use_multifile_config` passes its strategies to the loader."""
+    (tmp_path / "base.yml").write_text("tags: [a, b]\n", encoding="utf-8")
+    (tmp_path / "local.yml").write_text("tags: [b, c]\n", encoding="utf-8")
+
+    app = typer.Typer()
+
+    @app.command()
+    @use_multifile_config(
+        [str(tmp_path / "base.yml")], merge_strategies={"tags": "union"}
+    )
+    def main(tags: list[str] = typer.Option([])):
+        typer.echo(",".join(tags))
+
+    result = RUNNER.invoke(app, ["--config", str(tmp_path / "local.yml")])
+
+    assert result.exit_code == 0, result.output
+    assert result.stdout.strip() == "a,b,c"
@@ -7,6 +7,7 @@ import typer
 from typer.testing import CliRunner
 
 import typer_config
+from typer_config import loaders
 from typer_config.loaders import multifile_fallback_loader, multifile_loader
 
 RUNNER = CliRunner()
@@ -112,6 +113,35 @@ class TestMultifileLoader:
         result = multifile_loader([])
         assert result == {}
 
+    def test_process_pool(self, monkeypatch):
+        """Test parsing in a process pool gives the same merged result."""
+        files = [
+            str(HERE / "nested_base.yml"),
+            str(HERE / "config.yml"),
+            str(HERE / "nested_override.yml"),
+        ]
+        pools = []
+
+        class Pool(loaders.ProcessPoolExecutor):
+            def __init__(self, *args, **kwargs):
+                pools.append(self)
+                super().__init__(*args, **kwargs)
+
+        # exercise the pool even on single CPU runners
+        monkeypatch.setattr(loaders, "_available_cpus", lambda: 2)
+        monkeypatch.setattr(loaders, "ProcessPoolExecutor", Pool)
+
+        sequential = multifile_loader(files)
+        assert not pools  # opt-in
+        assert multifile_loader(files, process_pool_threshold=0) == sequential
+        assert len(pools) == 1
+
+    def test_process_pool_unsupported_format(self):
+        """Test unsupported formats fail before the pool is started."""
+        files = [str(HERE / "config.yml"), str(HERE / "__init__.py")]
+        with pytest.raises(ValueError, match="Unsupported file format"):
+            multifile_loader(files, process_pool_threshold=0)
+
     def test_skip_empty_paths(self):
         """Test that empty paths are skipped."""
         files = [
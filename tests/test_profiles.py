@@ -0,0 +1,283 @@
+"""Tests for configuration profiles."""
+
+from pathlib import Path
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from typer_config.decorators import (
+    use_json_config,
+    use_multifile_config,
+    use_profile,
+    use_yaml_config,
+)
+from typer_config.profiles import ProfileViews, apply_profile
+
+RUNNER = CliRunner()
+
+CONFIG = {
+    "opt1": "base",
+    "nested": {"a": 1, "b": 2},
+    "shared": {"x": [1, 2, 3]},
+    "profiles": {"prod": {"opt1": "prod", "nested": {"b": 3}}},
+}
+
+
+def test_apply_profile():
+    """Profile overrides are deep merged and other subtrees are shared."""
+    view = apply_profile(CONFIG, "prod")
+
+    assert view == {
+        "opt1": "prod",
+        "nested": {"a": 1, "b": 3},
+        "shared": {"x": [1, 2, 3]},
+    }
+    assert view["shared"] is CONFIG["shared"]
+    assert CONFIG["nested"] == {"a": 1, "b": 2}
+
+    assert apply_profile(CONFIG, None) == {
+        key: value for key, value in CONFIG.items() if key != "profiles"
+    }
+
+    with pytest.raises(ValueError, match="Unknown profile 'test'"):
+        apply_profile(CONFIG, "test")
+
+
+@pytest.mark.parametrize(
+    ("profiles", "message"),
+    [
+        ({"prod": 1}, "Profile 'prod' must be a mapping of overrides, not int"),
+        (["prod"], "'profiles' must be a mapping"),
+    ],
+)
+def test_invalid_profiles(profiles, message):
+    """Profiles that aren't mappings are reported clearly."""
+    with pytest.raises(ValueError, match=message):
+        apply_profile({"opt1": "base", "profiles": profiles}, "prod")
+
+
+def test_views_cached_per_file_version(tmp_path: Path):
+    """Views are cached until the config file changes."""
+    conf = tmp_path / "config.json"
+    conf.write_text("{}")
+    views = ProfileViews()
+
+    first = views(CONFIG, "prod", [str(conf)])
+    assert views(CONFIG, "prod", [str(conf)]) is first
+    assert views(CONFIG, None, [str(conf)]) is not first
+
+    conf.write_text("{ }")
+    assert views(CONFIG, "prod", [str(conf)]) is not first
+
+    # not a file: not cached
+    assert views(CONFIG, "prod") is not views(CONFIG, "prod")
+    assert views(CONFIG, "prod", ["-"]) is not views(CONFIG, "prod", ["-"])
+
+
+def test_views_cached_per_stack_version(tmp_path: Path):
+    """Views of a merged stack are recomputed when any of its files changes."""
+    base = tmp_path / "base.yml"
+    base.write_text("opt1: base\nopt2: base\n")
+    over = tmp_path / "over.yml"
+    over.write_text("opt2: over\n")
+
+    app = typer.Typer()
+
+    @app.command()
+    @use_multifile_config([str(base)])
+    @use_profile()
+    def main(opt1: str = typer.Option("default"), opt2: str = typer.Option("default")):
+        typer.echo(f"{opt1} {opt2}")
+
+    result = RUNNER.invoke(app, ["--config", str(over)])
+    assert result.stdout.strip() == "base over"
+
+    base.write_text("opt1: edited\n")
+    result = RUNNER.invoke(app, ["--config", str(over)])
+    assert result.exit_code == 0, result.stdout
+    assert result.stdout.strip() == "edited over"
+
+
+def test_views_cached_per_loader(tmp_path: Path):
+    """Sections of the same file loaded by a group and a subcommand differ."""
+    conf = tmp_path / "config.yml"
+    conf.write_text("a:\n  x: 0\nb:\n  x: 2\n")
+
+    app = typer.Typer()
+
+    @app.callback()
+    @use_yaml_config(section=["a"])
+    @use_profile()
+    def main(x: int = typer.Option(-1)):
+        typer.echo(f"main {x}")
+
+    @app.command()
+    @use_yaml_config(section=["b"])
+    def sub(x: int = typer.Option(-1)):
+        typer.echo(f"sub {x}")
+
+    for _ in range(2):
+        result = RUNNER.invoke(
+            app, ["--config", str(conf), "sub", "--config", str(conf)]
+        )
+        assert result.exit_code == 0, result.output
+        assert result.stdout.split() == ["main", "0", "sub", "2"]
+
+
+def test_views_dotenv_environment(tmp_path: Path, monkeypatch):
+    """Views of dotenv files follow the variables they expand."""
+    conf = tmp_path / "config.env"
+    conf.write_text("OPT1=${TYPER_CONFIG_TEST_NAME}\n")
+    views = ProfileViews()
+
+    monkeypatch.setenv("TYPER_CONFIG_TEST_NAME", "a")
+    first = views({"OPT1": "a"}, None, [str(conf)])
+    assert views({"OPT1": "a"}, None, [str(conf)]) is first
+    monkeypatch.setenv("TYPER_CONFIG_TEST_NAME", "b")
+    assert views({"OPT1": "b"}, None, [str(conf)]) == {"OPT1": "b"}
+
+
+def test_profile_not_mapping(tmp_path: Path):
+    """A profile that isn't a mapping is a bad parameter."""
+    conf = tmp_path / "config.yml"
+    conf.write_text("opt1: base\nprofiles:\n  prod: 1\n")
+
+    app = typer.Typer()
+
+    @app.command()
+    @use_yaml_config()
+    @use_profile()
+    def main(opt1: str = typer.Option("default")):
+        typer.echo(opt1)
+
+    result = RUNNER.invoke(app, ["--config", str(conf), "--profile", "prod"])
+    assert result.exit_code != 0
+    assert "Profile 'prod' must be a mapping" in result.output
+
+
+@pytest.fixture
+def app() -> typer.Typer:
+    """App with a YAML config and profiles."""
+    _app = typer.Typer()
+
+    @_app.command()
+    @use_yaml_config()
+    @use_profile(envvar="TYPER_CONFIG_TEST_PROFILE")
+    def main(opt1: str = typer.Option("default"), opt2: str = typer.Option("default")):
+        typer.echo(f"{opt1} {opt2}")
+
+    return _app
+
+
+@pytest.fixture
+def conf(tmp_path: Path) -> str:
+    """YAML config with profiles."""
+    path = tmp_path / "config.yml"
+    path.write_text(
+        "opt1: base\nopt2: base\n"
+        "profiles:\n  dev:\n    opt1: dev\n  prod:\n    opt2: prod\n"
+    )
+    return str(path)
+
+
+@pytest.mark.parametrize(
+    ("args", "expected"),
+    [
+        ([], "base base"),
+        (["--profile", "dev"], "dev base"),
+        (["--profile", "prod", "--opt1", "cli"], "cli prod"),
+    ],
+)
+@pytest.mark.parametrize("profile_first", [False, True])
+def test_cli(app, conf, args, expected, profile_first):
+    """The profile is applied whether it's given before or after the config."""
+    cli = [*args, "--config", conf] if profile_first else ["--config", conf, *args]
+    result = RUNNER.invoke(app, cli)
+    assert result.exit_code == 0, result.stdout
+    assert result.stdout.strip() == expected
+
+
+def test_envvar(app, conf):
+    """The profile can be selected with an environment variable."""
+    result = RUNNER.invoke(
+        app, ["--config", conf], env={"TYPER_CONFIG_TEST_PROFILE": "dev"}
+    )
+    assert result.exit_code == 0, result.stdout
+    assert result.stdout.strip() == "dev base"
+
+
+@pytest.mark.parametrize("profile_first", [False, True])
+def test_unknown_profile(app, conf, profile_first):
+    """Unknown profiles are bad parameters."""
+    args = ["--config", conf]
+    args = (
+        ["--profile", "test", *args] if profile_first else [*args, "--profile", "test"]
+    )
+    result = RUNNER.invoke(app, args)
+    assert result.exit_code != 0
+    assert "Unknown profile 'test'" in result.output
+
+
+def test_without_config(tmp_path: Path):
+    """Without a config file, only the base profile is valid."""
+    app = typer.Typer()
+
+    @app.command()
+    @use_profile()
+    @use_json_config()
+    def main(opt1: str = typer.Option("default")):
+        typer.echo(opt1)
+
+    result = RUNNER.invoke(app, [])
+    assert result.exit_code == 0, result.stdout
+    assert result.stdout.strip() == "default"
+
+
+def test_subcommand_profile(tmp_path: Path):
+    """A subcommand's profile doesn't apply the parent's config to it."""
+    conf = tmp_path / "config.yml"
+    conf.write_text("name: parent\nsub:\n  name: child\n")
+
+    app = typer.Typer()
+
+    @app.callback()
+    @use_yaml_config()
+    def main(name: str = typer.Option("default")):
+        typer.echo(name)
+
+    @app.command()
+    @use_profile()
+    def sub(name: str = typer.Option("default")):
+        typer.echo(name)
+
+    result = RUNNER.invoke(app, ["--config", str(conf), "sub"])
+    assert result.exit_code == 0, result.stdout
+    assert result.stdout.split() == ["parent", "child"]
+
+
+@pytest.mark.parametrize("profile_first", [False, True])
+def test_profile_response_file(tmp_path: Path, profile_first):
+    """Profile overrides can point list parameters to response files."""
+    (tmp_path / "prod.txt").write_text("a\nb\n")
+    conf = tmp_path / "config.yml"
+    conf.write_text(
+        "input_files: [x]\n"
+        f"profiles:\n  prod:\n    input_files: '@{tmp_path / 'prod.txt'}'\n"
+    )
+
+    app = typer.Typer()
+
+    @app.command()
+    @use_yaml_config()
+    @use_profile()
+    def main(input_files: list[str] = typer.Option([])):
+        typer.echo(",".join(input_files))
+
+    args = ["--config", str(conf)]
+    args = (
+        ["--profile", "prod", *args] if profile_first else [*args, "--profile", "prod"]
+    )
+    result = RUNNER.invoke(app, args)
+    assert result.exit_code == 0, result.output
+    assert result.stdout.strip() == "a,b"
@@ -0,0 +1,131 @@
+"""Tests for lazy secret references."""
+
+import builtins
+from pathlib import Path
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from typer_config.decorators import use_json_config
+from typer_config.references import LazyReference, bind_references
+
+RUNNER = CliRunner()
+
+
+@pytest.fixture
+def secret(tmp_path: Path) -> Path:
+    """Secret file, written like `echo hunter2 > secret`."""
+    path = tmp_path / "db"
+    path.write_text("hunter2\n")
+    return path
+
+
+def _app():
+    app = typer.Typer()
+
+    @app.command()
+    @use_json_config()
+    def main(password: str = "none", token: str = "none"):
+        typer.echo(f"{password} {token}")
+
+    return app
+
+
+def _config(tmp_path: Path, password: str, token: str = "TOKEN") -> str:
+    path = tmp_path / "config.json"
+    path.write_text(
+        f'{{"password": {{"$file": "{password}"}}, "token": {{"$env": "{token}"}}}}'
+    )
+    return str(path)
+
+
+def test_bind():
+    """Only dictionaries with references are copied."""
+    plain = {"opt": 1, "section": {"opt": 2}}
+    assert bind_references(plain) is plain
+
+    config = {"opt": 1, "sub": {"token": {"$env": "TOKEN"}}, "other": {"opt": 2}}
+    bound = bind_references(config)
+
+    assert isinstance(bound["sub"]["token"], LazyReference)
+    assert bound["other"] is config["other"]
+    assert config["sub"]["token"] == {"$env": "TOKEN"}
+
+
+@pytest.mark.parametrize(
+    "value", [{"$env": "A", "$file": "b"}, {"$env": 1}, {"$other": "x"}]
+)
+def test_not_references(value):
+    """Other dictionaries are left alone."""
+    assert bind_references({"opt": value}) == {"opt": value}
+
+
+def test_memoized(monkeypatch: pytest.MonkeyPatch, secret: Path):
+    """A reference is read once and its repr doesn't leak the value."""
+    reference = LazyReference("$file", str(secret))
+    assert reference() == "hunter2"
+
+    secret.write_text("changed")
+    assert reference() == "hunter2"
+    assert "hunter2" not in repr(reference)
+
+    monkeypatch.setenv("TOKEN", "abc")
+    assert LazyReference("$env", "TOKEN")() == "abc"
+
+
+def test_decorator(monkeypatch: pytest.MonkeyPatch, tmp_path: Path, secret: Path):
+    """References are resolved as parameter defaults."""
+    monkeypatch.setenv("TOKEN", "abc")
+
+    result = RUNNER.invoke(_app(), ["--config", _config(tmp_path, str(secret))])
+
+    assert result.exit_code == 0, result.output
+    assert result.stdout.strip() == "hunter2 abc"
+
+
+def test_only_used_secrets_are_read(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, secret: Path
+):
+    """Secrets of parameters given on the command line are never read."""
+    config = _config(tmp_path, str(secret), token="UNSET_TOKEN")
+    monkeypatch.delenv("UNSET_TOKEN", raising=False)
+
+    opened = []
+    real_open = builtins.open
+
+    def _open(file, *args, **kwargs):
+        opened.append(str(file))
+        return real_open(file, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "open", _open)
+
+    result = RUNNER.invoke(
+        _app(), ["--config", config, "--password", "cli", "--token", "cli"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert result.stdout.strip() == "cli cli"
+    assert str(secret) not in opened
+
+
+@pytest.mark.parametrize(
+    ("password", "message"), [("missing", "Can't read"), (None, "is not set")]
+)
+def test_errors(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    secret: Path,
+    password: str,
+    message: str,
+):
+    """Unreadable references are reported for their parameter."""
+    monkeypatch.delenv("UNSET_TOKEN", raising=False)
+    config = _config(
+        tmp_path, str(tmp_path / password) if password else str(secret), "UNSET_TOKEN"
+    )
+
+    result = RUNNER.invoke(_app(), ["--config", config])
+
+    assert result.exit_code == 2  # noqa: PLR2004
+    assert message in result.output
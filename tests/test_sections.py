@@ -0,0 +1,128 @@
+"""Tests for section path expressions."""
+
+from pathlib import Path
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from typer_config.decorators import use_ini_config, use_toml_config
+from typer_config.sections import SectionPath, compile_section
+from typer_config.utils import get_dict_section
+
+RUNNER = CliRunner()
+
+HERE = Path(__file__).parent.absolute()
+
+CONFIG = {
+    "tool": {
+        "my.tool": {"opt1": "dotted"},
+        "ourtool": {"stages": [{"name": "a"}, {"name": "b"}, {"other": "c"}]},
+    },
+    "tenants": {
+        "acme": {"limits": {"cpu": 1}},
+        "globex": {"limits": {"cpu": 2}},
+        "initech": {},
+    },
+}
+
+
+@pytest.mark.parametrize(
+    ("section", "expected"),
+    [
+        (None, CONFIG),
+        ("", CONFIG),
+        ("tool.ourtool.stages[1]", {"name": "b"}),
+        ("tool.ourtool.stages[-1].other", "c"),
+        ('tool."my.tool".opt1', "dotted"),
+        ("tool['my.tool']", {"opt1": "dotted"}),
+        (["tool", "my.tool"], {"opt1": "dotted"}),
+        ("tenants.*.limits", {"acme": {"cpu": 1}, "globex": {"cpu": 2}}),
+        ("tenants.*.limits.cpu", {"acme": 1, "globex": 2}),
+        ("tool.ourtool.stages[*].name", ["a", "b"]),
+        ('"tenants"."*"', {}),
+        ("tool.missing.key", {}),
+        ("tool.ourtool.stages[3]", {}),
+        ("tool.ourtool.stages.name", {}),
+        ("tenants[0]", {}),
+    ],
+)
+def test_select(section, expected):
+    """Paths select keys, list items and wildcards."""
+    assert compile_section(section)(CONFIG) == expected
+
+
+def test_no_copies():
+    """Selections share the config's objects."""
+    path = compile_section("tenants.*.limits")
+    assert path(CONFIG)["acme"] is CONFIG["tenants"]["acme"]["limits"]
+    assert compile_section("tool.ourtool")(CONFIG) is CONFIG["tool"]["ourtool"]
+
+
+@pytest.mark.parametrize(
+    "expression",
+    ["tool.", ".tool", "tool..x", "tool[x]", "tool[1", "tool x[0]x", "a.[0]", "a'b'"],
+)
+def test_invalid(expression: str):
+    """Malformed expressions are rejected when they are compiled."""
+    with pytest.raises(ValueError, match="Invalid section path"):
+        compile_section(expression)
+
+
+def test_compiled_once():
+    """Expressions are compiled once and compiled paths are reused."""
+    path = compile_section("tool.ourtool.stages[0]")
+
+    assert compile_section("tool.ourtool.stages[0]") is path
+    assert compile_section(path) is path
+    assert isinstance(path, SectionPath)
+    assert str(path) == "tool.ourtool.stages[0]"
+    assert path.head == ["tool"]
+    assert compile_section("*.x").head is None
+
+
+def test_get_dict_section():
+    """`get_dict_section` accepts lists of keys and expressions."""
+    assert get_dict_section(CONFIG, ["tool", "ourtool", "stages"]) == (
+        get_dict_section(CONFIG, "tool.ourtool.stages")
+    )
+    assert get_dict_section(CONFIG, ["tool", "missing"]) == {}
+
+
+def _app(decorator, **dec_kwargs):
+    app = typer.Typer()
+
+    @app.command()
+    @decorator(**dec_kwargs)
+    def main(
+        arg1: str = typer.Argument("default_arg"),
+        opt1: str = typer.Option("default_opt1"),
+        opt2: str = typer.Option("default_opt2"),
+    ):
+        typer.echo(f"{opt1} {opt2} {arg1}")
+
+    return app
+
+
+@pytest.mark.parametrize(
+    ("decorator", "section", "name"),
+    [
+        (use_toml_config, "tool.my_tool.parameters", "pyproject.toml"),
+        (use_ini_config, "simple_app", "config.ini"),
+        (use_ini_config, ["simple_app"], "config.ini"),
+    ],
+)
+def test_decorators(decorator, section, name: str):
+    """Decorators accept section path expressions."""
+    result = RUNNER.invoke(
+        _app(decorator, section=section), ["--config", str(HERE / name)]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert result.stdout.strip() == "things nothing stuff"
+
+
+def test_decorator_invalid_section():
+    """Invalid expressions fail when the decorator is applied."""
+    with pytest.raises(ValueError, match="Invalid section path"):
+        use_toml_config(section="tool..my_tool")
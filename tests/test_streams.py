@@ -0,0 +1,214 @@
+"""Tests for configs read from stdin and file descriptors."""
+
+import os
+import threading
+from pathlib import Path
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from typer_config import streams
+from typer_config.decorators import (
+    use_fallback_config,
+    use_json_config,
+    use_multifile_config,
+    use_toml_config,
+    use_yaml_config,
+)
+from typer_config.dumpers import binary_dumper
+from typer_config.loaders import multifile_loader
+from typer_config.streams import sniff_format, sniff_stream_format
+
+RUNNER = CliRunner()
+
+HERE = Path(__file__).parent.absolute()
+
+FORMATS = {
+    "config.json": "json",
+    "config.yml": "yaml",
+    "config.toml": "toml",
+    "config.ini": "ini",
+    "config.env": "env",
+}
+
+needs_fd_paths = pytest.mark.skipif(
+    not os.path.isdir("/dev/fd"), reason="no /dev/fd on this platform"
+)
+
+
+def _app(decorator, **dec_kwargs):
+    app = typer.Typer()
+
+    @app.command()
+    @decorator(**dec_kwargs)
+    def main(
+        arg1: str = typer.Argument("default_arg"),
+        opt1: str = typer.Option("default_opt1"),
+        opt2: str = typer.Option("default_opt2"),
+    ):
+        typer.echo(f"{opt1} {opt2} {arg1}")
+
+    return app
+
+
+def _pipe(data: bytes) -> str:
+    """Path of a pipe that yields `data`, like bash's `<(...)`."""
+    read_fd, write_fd = os.pipe()
+
+    def _write():
+        with os.fdopen(write_fd, "wb") as _file:
+            _file.write(data)
+
+    threading.Thread(target=_write, daemon=True).start()
+    return f"/dev/fd/{read_fd}"
+
+
+@pytest.mark.parametrize(("name", "fmt"), FORMATS.items())
+def test_sniff_format(name: str, fmt: str):
+    """The test configs are recognized from their content."""
+    assert sniff_format((HERE / name).read_bytes()) == fmt
+
+
+@pytest.mark.parametrize(
+    ("head", "fmt"),
+    [
+        (b"---\nopt1: a\n", "yaml"),
+        (b"# comment\nurl: http://x/?a=b\n", "yaml"),
+        (b"export OPT1=a\n", "env"),
+        (b"opt1 = 1\n[[servers]]\nname = 'a'\n", "toml"),
+        (b"[app]\nport = 8080\nname = web\n", "ini"),
+        (b"", None),
+        (b"just some words\n", None),
+    ],
+)
+def test_sniff_format_edge_cases(head: bytes, fmt: str):
+    """Format detection of less regular configs."""
+    assert sniff_format(head) == fmt
+
+
+def test_sniff_binary(tmp_path: Path):
+    """Binary configs are recognized by their magic bytes."""
+    binary_dumper({"opt1": "a"}, tmp_path / "config.tcfg")
+
+    assert sniff_format((tmp_path / "config.tcfg").read_bytes()) == "binary"
+
+
+@pytest.mark.parametrize(
+    ("decorator", "name"),
+    [
+        (use_yaml_config, "config.yml"),
+        (use_json_config, "config.json"),
+        (use_toml_config, "config.toml"),
+    ],
+)
+def test_stdin(decorator, name: str):
+    """`--config -` reads the config from stdin."""
+    result = RUNNER.invoke(
+        _app(decorator), ["--config", "-"], input=(HERE / name).read_bytes()
+    )
+
+    assert result.exit_code == 0, result.output
+    assert result.stdout.strip() == "things nothing stuff"
+
+
+@pytest.mark.parametrize(
+    "name", ["config.json", "config.yml", "config.toml", "config.env"]
+)
+def test_stdin_sniffed(name: str):
+    """Multifile configs detect the format of stdin."""
+    result = RUNNER.invoke(
+        _app(use_multifile_config, default_files=[str(HERE / "other.yml")]),
+        ["--config", "-"],
+        input=(HERE / name).read_bytes(),
+    )
+
+    assert result.exit_code == 0, result.output
+    assert result.stdout.strip() == "things nothing stuff"
+
+
+def test_stdin_fallback():
+    """Fallback configs prefer stdin over the fallback files."""
+    result = RUNNER.invoke(
+        _app(
+            use_fallback_config,
+            fallback_files=[str(HERE / "other.yml")],
+            section=["simple_app"],
+        ),
+        ["--config", "-"],
+        input=(HERE / "config.ini").read_bytes(),
+    )
+
+    assert result.exit_code == 0, result.output
+    assert result.stdout.strip() == "things nothing stuff"
+
+
+def test_stdin_explicit_format():
+    """An explicit format skips detection."""
+    app = _app(use_multifile_config, default_files=[], stream_format="yaml")
+
+    # flow style YAML would be detected as JSON
+    result = RUNNER.invoke(app, ["--config", "-"], input="{opt1: a, opt2: b}\n")
+
+    assert result.exit_code == 0, result.output
+    assert result.stdout.strip() == "a b default_arg"
+
+
+def test_stdin_not_cached(tmp_path: Path):
+    """Stacks with a stream bypass the snapshot cache."""
+    app = _app(use_multifile_config, default_files=[], cache_dir=tmp_path)
+
+    for value in ("a", "b"):
+        result = RUNNER.invoke(app, ["--config", "-"], input=f"opt1: {value}\n")
+        assert result.exit_code == 0, result.output
+        assert result.stdout.strip() == f"{value} default_opt2 default_arg"
+
+
+def test_stdin_undetectable():
+    """Undetectable formats are reported."""
+    result = RUNNER.invoke(
+        _app(use_multifile_config, default_files=[]),
+        ["--config", "-"],
+        input="just some words\n",
+    )
+
+    assert result.exit_code != 0
+    assert "detect" in result.output
+
+
+@needs_fd_paths
+def test_file_descriptor():
+    """`/dev/fd/N` streams are sniffed and parsed without losing data."""
+    data = (HERE / "config.toml").read_bytes()
+
+    assert multifile_loader(
+        [str(HERE / "config.yml"), _pipe(data)]
+    ) == multifile_loader([str(HERE / "config.toml")])
+
+
+@needs_fd_paths
+def test_file_descriptor_decorator():
+    """A file descriptor can be passed as the config file."""
+    result = RUNNER.invoke(_app(use_yaml_config), ["--config", _pipe(b"opt1: piped\n")])
+
+    assert result.exit_code == 0, result.output
+    assert result.stdout.strip() == "piped default_opt2 default_arg"
+
+
+@needs_fd_paths
+def test_sniff_keeps_data():
+    """Sniffing a stream doesn't consume it."""
+    path = _pipe(b'{"opt1": "a"}')
+
+    assert sniff_stream_format(path) == "json"
+    assert multifile_loader([path], stream_format="json") == {"opt1": "a"}
+
+
+@needs_fd_paths
+def test_undetectable_stream_closed():
+    """A stream whose format can't be detected isn't kept open."""
+    path = _pipe(b"just some words\n")
+
+    with pytest.raises(ValueError, match="detect"):
+        sniff_stream_format(path)
+    assert path not in streams._SNIFFED
@@ -1,40 +1,58 @@
 """Tests for typer_config.utils."""
 
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
 
 from typer_config.utils import (
     ORIGINAL_WARNING_FORMATTER,
+    FileLines,
     SimpleWarningFormat,
     file_exists_and_warn,
+    response_file,
+    show_simple_warning,
 )
 
 
 class TestSimpleWarningFormat:
-    """Tests for SimpleWarningFormat context manager."""
+    """Tests for show_simple_warning and the SimpleWarningFormat context manager."""
 
-    def test_formats_warning_as_category_and_message(self):
-        """Warning inside context uses simple 'Category: msg' format."""
-        with warnings.catch_warnings():
-            warnings.simplefilter("always")
-            with SimpleWarningFormat():
-                formatted = warnings.formatwarning("bad thing", UserWarning, "f.py", 1)
-        assert formatted == "UserWarning: bad thing\n"
+    def test_formats_warning_as_category_and_message(self, capsys):
+        """Warnings are shown in the simple 'Category: msg' format."""
+        with SimpleWarningFormat() as show:
+            show("bad thing", UserWarning)
+        show_simple_warning("other thing", DeprecationWarning)
+        assert capsys.readouterr().err == (
+            "UserWarning: bad thing\nDeprecationWarning: other thing\n"
+        )
 
-    def test_restores_original_formatter_on_exit(self):
-        """`warnings.formatwarning` is restored to original after context exits."""
+    def test_formatter_untouched(self):
+        """`warnings.formatwarning` is never replaced."""
         with SimpleWarningFormat():
-            pass
+            assert warnings.formatwarning is ORIGINAL_WARNING_FORMATTER
         assert warnings.formatwarning is ORIGINAL_WARNING_FORMATTER
 
-    def test_restores_original_formatter_on_exception(self):
-        """`warnings.formatwarning` is restored even if an exception occurs."""
-        msg = "boom"
-        try:
-            with SimpleWarningFormat():
-                raise RuntimeError(msg)
-        except RuntimeError:
+    def test_wrapped_formatter(self, monkeypatch, capsys):
+        """Other libraries can wrap `warnings.formatwarning` in between."""
+        with SimpleWarningFormat():
             pass
-        assert warnings.formatwarning is ORIGINAL_WARNING_FORMATTER
+        previous = warnings.formatwarning
+        monkeypatch.setattr(
+            warnings, "formatwarning", lambda *args: "wrapped " + previous(*args)
+        )
+        with SimpleWarningFormat() as show:
+            show("bad thing", UserWarning)
+        assert warnings.formatwarning("x", UserWarning, "f.py", 1).startswith(
+            "wrapped f.py:1: UserWarning: x"
+        )
+        assert capsys.readouterr().err == "UserWarning: bad thing\n"
+
+    def test_concurrent_threads(self, capsys):
+        """Simple warnings can be shown from concurrent threads."""
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(show_simple_warning, ["bad thing"] * 8))
+        assert capsys.readouterr().err == "UserWarning: bad thing\n" * 8
 
 
 class TestFileExistsAndWarn:
@@ -68,3 +86,37 @@ class TestFileExistsAndWarn:
             warnings.simplefilter("always")
             file_exists_and_warn(missing)
         assert f"No such file: '{missing}'" in str(caught[0].message)
+
+
+class TestResponseFile:
+    """Tests for response_file and FileLines."""
+
+    def test_expands_prefix_and_mapping(self, tmp_path):
+        """`@path` and `{"from_file": path}` become FileLines."""
+        path = str(tmp_path / "items.txt")
+        assert response_file(f"@{path}") == FileLines(path)
+        assert response_file({"from_file": path}) == FileLines(path)
+
+    @pytest.mark.parametrize(
+        "value", [["@a"], "plain", {"from_file": "a", "other": 1}, None]
+    )
+    def test_leaves_other_values(self, value):
+        """Other values are returned unchanged."""
+        assert response_file(value) is value
+
+    def test_lazy_lines(self, tmp_path):
+        """Lines are only read when consumed; blank lines are skipped."""
+        path = tmp_path / "items.txt"
+        lines = FileLines(path)  # file doesn't exist yet
+        path.write_text("a\r\nb\n\nc")
+        assert list(lines) == ["a", "b", "c"]
+        assert len(lines) == len(["a", "b", "c"])
+        assert lines[1] == "b"
+        assert lines == ["a", "b", "c"]
+
+    def test_large_file(self, tmp_path):
+        """Large files are streamed in chunks."""
+        size = 200_000
+        path = tmp_path / "items.txt"
+        path.write_text("".join(f"input{i}.dat\n" for i in range(size)))
+        assert sum(1 for _ in FileLines(path)) == size